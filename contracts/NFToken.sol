@@ -19,9 +19,21 @@ contract NFToken is ERC20Interface {
     uint256 constant MAX_UPPER_BOUND = (2**64) - 2;
     address constant ZERO_ADDRESS = address(0);
 
-    /** depending on the intended totalSupply, you may wish to adjust this constant */
+    /**
+        depending on the intended totalSupply, you may wish to adjust this constant
+        or deploy NFTokenScoped, which sets the multiplier at deployment
+     */
     uint256 constant SCOPING_MULTIPLIER = 16;
 
+    /** maximum number of ranges held by one address, limited by Range.position */
+    uint64 constant MAX_POSITION = (2**32) - 1;
+
+    /** policies for selecting which ranges are sent by transfer and transferFrom */
+    uint8 constant POLICY_FIRST = 0;
+    uint8 constant POLICY_LARGEST = 1;
+    uint8 constant POLICY_BEST_FIT = 2;
+    uint8 constant POLICY_MERGE = 3;
+
     /** cannot fractionalize non-fungibles */
     uint8 public constant decimals = 0;
     string public name;
@@ -33,15 +45,18 @@ contract NFToken is ERC20Interface {
     mapping (uint64 => Range) rangeMap;
     mapping (address => Balance) balances;
     mapping (address => mapping (address => uint256)) allowed;
+    mapping (bytes32 => bool) swapApprovals;
 
     struct Balance {
         uint64 balance;
         uint64 length;
+        uint8 policy;
         uint64[9223372036854775808] ranges;
     }
     struct Range {
         address owner;
         uint64 stop;
+        uint32 position;
     }
 
     event Approval(address indexed owner, address indexed spender, uint256 amount);
@@ -53,6 +68,16 @@ contract NFToken is ERC20Interface {
         uint256 stop,
         uint256 amount
     );
+    event TransferRanges(address indexed from, address indexed to, uint128[] ranges);
+    event SwapApproval(
+        address indexed owner,
+        address indexed counterparty,
+        uint256 start,
+        uint256 stop,
+        uint256 counterStart,
+        uint256 counterStop,
+        bool approved
+    );
 
     /**
         @notice constructor method
@@ -61,18 +86,29 @@ contract NFToken is ERC20Interface {
         @param _totalSupply Total supply (assigned to msg.sender)
      */
     constructor(string memory _name, string memory _symbol, uint64 _totalSupply) public {
-        require(_totalSupply <= MAX_UPPER_BOUND);
         name = _name;
         symbol = _symbol;
+        _mintInitialSupply(_totalSupply);
+    }
+
+    /**
+        @notice internal - assign the initial supply to msg.sender
+        @dev
+            Called from the constructor. Contracts that must initialize
+            storage before any ranges are set may instead call this from
+            their own constructor, and pass a supply of zero to NFToken.
+        @param _totalSupply Total supply
+     */
+    function _mintInitialSupply(uint64 _totalSupply) internal {
+        require(_totalSupply <= MAX_UPPER_BOUND);
         if (_totalSupply == 0) return;
         _setRange(1, msg.sender, _totalSupply+1);
         balances[msg.sender].balance = _totalSupply;
-        balances[msg.sender].length = 1;
-        balances[msg.sender].ranges[0] = 1;
+        _replaceInBalanceRange(msg.sender, 0, 1);
         totalSupply = _totalSupply;
         upperBound = _totalSupply;
         emit Transfer(ZERO_ADDRESS, msg.sender, _totalSupply);
-        emit TransferRange(ZERO_ADDRESS, msg.sender, 1, _totalSupply+1, _totalSupply);
+        _emitTransferRange(ZERO_ADDRESS, msg.sender, 1, _totalSupply+1);
     }
 
     /* modifier to ensure a range index is within bounds */
@@ -128,8 +164,49 @@ contract NFToken is ERC20Interface {
         return (r.owner, _start, r.stop);
     }
 
+    /**
+        @notice Fetch information about the ranges containing many tokens
+        @dev
+            When indexes are sorted, consecutive indexes within the same
+            range only require a single pointer lookup
+        @param _idx Array of token index numbers
+        @return arrays of owners, range starts and range stops
+     */
+    function getRanges(
+        uint256[] calldata _idx
+    )
+        external
+        view
+        returns (
+            address[] memory _owners,
+            uint64[] memory _starts,
+            uint64[] memory _stops
+        )
+    {
+        _owners = new address[](_idx.length);
+        _starts = new uint64[](_idx.length);
+        _stops = new uint64[](_idx.length);
+        address _owner;
+        uint64 _start;
+        uint64 _stop;
+        for (uint256 i; i < _idx.length; i++) {
+            if (_idx[i] < _start || _idx[i] >= _stop) {
+                _checkBounds(_idx[i]);
+                _start = _getPointer(_idx[i]);
+                Range storage r = rangeMap[_start];
+                _owner = r.owner;
+                _stop = r.stop;
+            }
+            _owners[i] = _owner;
+            _starts[i] = _start;
+            _stops[i] = _stop;
+        }
+        return (_owners, _starts, _stops);
+    }
+
     /**
         @notice Fetch the token ranges owned by an address
+        @dev Ranges are in storage order, they are not sorted by start
         @param _owner Address to query
         @return Array of [(start, stop),..]
      */
@@ -142,6 +219,58 @@ contract NFToken is ERC20Interface {
         return _ranges;
     }
 
+    /**
+        @notice Fetch the number of token ranges owned by an address
+        @param _owner Address to query
+        @return integer
+     */
+    function rangeCountOf(address _owner) external view returns (uint256) {
+        return balances[_owner].length;
+    }
+
+    /**
+        @notice Fetch the transfer policy of an address
+        @param _owner Address to query
+        @return integer
+     */
+    function transferPolicyOf(address _owner) external view returns (uint8) {
+        return balances[_owner].policy;
+    }
+
+    /**
+        @notice Fetch a subset of the token ranges owned by an address
+        @dev
+            Use this instead of rangesOf for addresses that hold too many
+            ranges to fetch in a single call. Ranges are returned in the
+            same order as rangesOf.
+        @param _owner Address to query
+        @param _offset Number of ranges to skip
+        @param _limit Maximum number of ranges to return
+        @return Array of [(start, stop),..]
+     */
+    function rangesOfPaginated(
+        address _owner,
+        uint256 _offset,
+        uint256 _limit
+    )
+        external
+        view
+        returns (uint64[2][] memory)
+    {
+        Balance storage b = balances[_owner];
+        uint256 _count;
+        if (_offset < b.length) {
+            _count = b.length - _offset;
+            if (_count > _limit) _count = _limit;
+        }
+        uint64[2][] memory _ranges = new uint64[2][](_count);
+        for (uint256 i; i < _count; i++) {
+            uint64 _start = b.ranges[_offset + i];
+            _ranges[i] = [_start, rangeMap[_start].stop];
+        }
+        return _ranges;
+    }
+
     /**
         @notice ERC20 approve standard
         @param _spender Address approved to transfer tokens
@@ -161,7 +290,44 @@ contract NFToken is ERC20Interface {
         @return bool success
      */
     function transfer(address _to, uint256 _value) external returns (bool) {
-        _transfer(msg.sender, _to, _value);
+        _transfer(msg.sender, _to, _value, balances[msg.sender].policy);
+        return true;
+    }
+
+    /**
+        @notice Set the policy used to select ranges in transfer and transferFrom
+        @dev
+            0 - first range in the balance range array (default)
+            1 - largest range
+            2 - smallest range that covers the remaining amount, otherwise largest
+            3 - ranges that merge with those of the recipient, otherwise first
+        @param _policy Policy ID
+        @return bool success
+     */
+    function setTransferPolicy(uint8 _policy) external returns (bool) {
+        require(_policy <= POLICY_MERGE); // dev: invalid policy
+        balances[msg.sender].policy = _policy;
+        return true;
+    }
+
+    /**
+        @notice transfer tokens, selecting ranges with the given policy
+        @dev Policies are the same as in setTransferPolicy
+        @param _to Recipient
+        @param _value Amount being transferred
+        @param _policy Policy ID
+        @return bool success
+     */
+    function transferWithPolicy(
+        address _to,
+        uint256 _value,
+        uint8 _policy
+    )
+        external
+        returns (bool)
+    {
+        require(_policy <= POLICY_MERGE); // dev: invalid policy
+        _transfer(msg.sender, _to, _value, _policy);
         return true;
     }
 
@@ -182,7 +348,7 @@ contract NFToken is ERC20Interface {
         returns (bool)
     {
         allowed[_from][msg.sender] = allowed[_from][msg.sender].sub(_value);
-        _transfer(_from, _to, _value);
+        _transfer(_from, _to, _value, balances[_from].policy);
         return true;
     }
 
@@ -201,24 +367,302 @@ contract NFToken is ERC20Interface {
         external
         returns (bool)
     {
-        _checkBounds(_start);
-        _checkBounds(_stop.sub(1));
-        require(_start < _stop); // dev: stop < start
-        uint64 _pointer = _getPointer(_stop.sub(1));
-        require(_pointer <= _start); // dev: multiple ranges
-
+        uint64 _pointer = _checkRange(msg.sender, _start, _stop);
         uint64 _value = _stop.sub(_start);
 
-        require(msg.sender == rangeMap[_pointer].owner); // dev: sender does not own
-
         balances[msg.sender].balance = balances[msg.sender].balance.sub(_value);
         balances[_to].balance = balances[_to].balance.add(_value);
 
         emit Transfer(msg.sender, _to, _value);
         if (msg.sender != _to && _value > 0) {
+            _emitTransferRange(msg.sender, _to, _start, _stop);
             _transferSingleRange(_pointer, msg.sender, _to, _start, _stop);
         }
+        return true;
+    }
+
+    /**
+        @notice transfer a single token
+        @dev
+            Equivalent to transferRange(_to, _idx, _idx+1), but only one
+            index must be bounds checked and located. When the token is
+            already held as a range of one, the pointer lookup and update
+            each touch a single slot.
+        @param _to Recipient address
+        @param _idx Token index
+        @return bool success
+     */
+    function transferToken(address _to, uint64 _idx) external returns (bool) {
+        _checkBounds(_idx);
+        uint64 _pointer = _getPointer(_idx);
+        require(msg.sender == rangeMap[_pointer].owner); // dev: sender does not own
+
+        /* sender owns the token, so the balance cannot underflow */
+        balances[msg.sender].balance -= 1;
+        balances[_to].balance = balances[_to].balance.add(1);
+
+        emit Transfer(msg.sender, _to, 1);
+        if (msg.sender != _to) {
+            _emitTransferRange(msg.sender, _to, _idx, _idx + 1);
+            _transferSingleRange(_pointer, msg.sender, _to, _idx, _idx + 1);
+        }
+        return true;
+    }
+
+    /**
+        @notice transfer multiple token ranges in a single call
+        @dev
+            Each range is verified and transferred individually, balances
+            are only updated once and a single Transfer event is emitted
+        @param _to Recipient address
+        @param _ranges Array of [(start, stop),..] to transfer
+        @return bool success
+     */
+    function transferRanges(
+        address _to,
+        uint64[2][] calldata _ranges
+    )
+        external
+        returns (bool)
+    {
+        uint64 _value;
+        uint128[] memory _packed = _rangeBuffer(_ranges.length);
+        for (uint256 i; i < _ranges.length; i++) {
+            uint64 _start = _ranges[i][0];
+            uint64 _stop = _ranges[i][1];
+            uint64 _pointer = _checkRange(msg.sender, _start, _stop);
+            _value = _value.add(_stop - _start);
+            if (msg.sender != _to) {
+                _logRange(_packed, i, msg.sender, _to, _start, _stop);
+                _transferSingleRange(_pointer, msg.sender, _to, _start, _stop);
+            }
+        }
+        if (msg.sender != _to) {
+            _emitTransferRanges(msg.sender, _to, _packed, _ranges.length);
+        }
+
+        balances[msg.sender].balance = balances[msg.sender].balance.sub(_value);
+        balances[_to].balance = balances[_to].balance.add(_value);
+
+        emit Transfer(msg.sender, _to, _value);
+        return true;
+    }
+
+    /**
+        @notice transfer tokens to multiple recipients in a single call
+        @dev
+            The sender balance is only updated once. Tokens are taken
+            starting from balance.ranges[0], the same as transfer().
+        @param _to Array of recipient addresses
+        @param _values Array of amounts to send to each recipient
+        @return bool success
+     */
+    function transferMany(
+        address[] calldata _to,
+        uint256[] calldata _values
+    )
+        external
+        returns (bool)
+    {
+        require(_to.length == _values.length); // dev: length mismatch
+        uint64 _total;
+        for (uint256 i; i < _values.length; i++) {
+            require(_values[i] <= MAX_UPPER_BOUND); // dev: uint64 overflow
+            _total = _total.add(uint64(_values[i]));
+        }
+        balances[msg.sender].balance = balances[msg.sender].balance.sub(_total);
 
+        uint8 _policy = balances[msg.sender].policy;
+        for (uint256 i; i < _to.length; i++) {
+            address _receiver = _to[i];
+            uint64 _value = uint64(_values[i]);
+            balances[_receiver].balance = balances[_receiver].balance.add(_value);
+            emit Transfer(msg.sender, _receiver, _value);
+            if (msg.sender != _receiver && _value > 0) {
+                _transferValue(msg.sender, _receiver, _value, _policy);
+            }
+        }
+        return true;
+    }
+
+    /**
+        @notice transfer specific token ranges to multiple recipients
+        @dev The sender balance is only updated once
+        @param _to Array of recipient addresses
+        @param _ranges Array of [(start, stop),..] to send to each recipient
+        @return bool success
+     */
+    function transferRangeMany(
+        address[] calldata _to,
+        uint64[2][] calldata _ranges
+    )
+        external
+        returns (bool)
+    {
+        require(_to.length == _ranges.length); // dev: length mismatch
+        uint64 _total;
+        for (uint256 i; i < _to.length; i++) {
+            address _receiver = _to[i];
+            uint64 _start = _ranges[i][0];
+            uint64 _stop = _ranges[i][1];
+            uint64 _pointer = _checkRange(msg.sender, _start, _stop);
+            _total = _total.add(_stop - _start);
+
+            balances[_receiver].balance = balances[_receiver].balance.add(_stop - _start);
+            emit Transfer(msg.sender, _receiver, _stop - _start);
+            if (msg.sender != _receiver) {
+                _emitTransferRange(msg.sender, _receiver, _start, _stop);
+                _transferSingleRange(_pointer, msg.sender, _receiver, _start, _stop);
+            }
+        }
+        balances[msg.sender].balance = balances[msg.sender].balance.sub(_total);
+        return true;
+    }
+
+    /**
+        @notice Check if a swap of token ranges has been approved
+        @param _owner Address giving the range _start:_stop
+        @param _counterparty Address giving the range _counterStart:_counterStop
+        @param _start Start index of range given by _owner
+        @param _stop Stop index of range given by _owner
+        @param _counterStart Start index of range given by _counterparty
+        @param _counterStop Stop index of range given by _counterparty
+        @return bool approved
+     */
+    function swapApproved(
+        address _owner,
+        address _counterparty,
+        uint64 _start,
+        uint64 _stop,
+        uint64 _counterStart,
+        uint64 _counterStop
+    )
+        external
+        view
+        returns (bool)
+    {
+        return swapApprovals[
+            _swapId(_owner, _counterparty, _start, _stop, _counterStart, _counterStop)
+        ];
+    }
+
+    /**
+        @notice Approve a swap of token ranges with another address
+        @dev
+            Ranges are not verified until the swap is performed. Approving
+            with _approved set to false revokes a previous approval.
+        @param _counterparty Address to swap with
+        @param _start Start index of range to give
+        @param _stop Stop index of range to give
+        @param _counterStart Start index of range to receive
+        @param _counterStop Stop index of range to receive
+        @param _approved Is the swap approved?
+        @return bool success
+     */
+    function approveSwap(
+        address _counterparty,
+        uint64 _start,
+        uint64 _stop,
+        uint64 _counterStart,
+        uint64 _counterStop,
+        bool _approved
+    )
+        external
+        returns (bool)
+    {
+        swapApprovals[
+            _swapId(msg.sender, _counterparty, _start, _stop, _counterStart, _counterStop)
+        ] = _approved;
+        emit SwapApproval(
+            msg.sender,
+            _counterparty,
+            _start,
+            _stop,
+            _counterStart,
+            _counterStop,
+            _approved
+        );
+        return true;
+    }
+
+    /**
+        @notice Swap equal sized token ranges with another address
+        @dev
+            The counterparty must have approved the swap with approveSwap.
+            Swapping adjacent ranges allows both addresses to consolidate
+            their holdings, reducing the cost of later transfers.
+        @param _counterparty Address to swap with
+        @param _start Start index of range to give
+        @param _stop Stop index of range to give
+        @param _counterStart Start index of range to receive
+        @param _counterStop Stop index of range to receive
+        @return bool success
+     */
+    function swapRanges(
+        address _counterparty,
+        uint64 _start,
+        uint64 _stop,
+        uint64 _counterStart,
+        uint64 _counterStop
+    )
+        external
+        returns (bool)
+    {
+        require(msg.sender != _counterparty); // dev: swap with self
+        require(_stop.sub(_start) == _counterStop.sub(_counterStart)); // dev: unequal ranges
+        bytes32 _id = _swapId(
+            _counterparty,
+            msg.sender,
+            _counterStart,
+            _counterStop,
+            _start,
+            _stop
+        );
+        require(swapApprovals[_id]); // dev: swap not approved
+        delete swapApprovals[_id];
+
+        /* both ranges are verified before either is transferred */
+        _checkRange(_counterparty, _counterStart, _counterStop);
+        uint64 _pointer = _checkRange(msg.sender, _start, _stop);
+
+        emit Transfer(msg.sender, _counterparty, _stop - _start);
+        _emitTransferRange(msg.sender, _counterparty, _start, _stop);
+        _transferSingleRange(_pointer, msg.sender, _counterparty, _start, _stop);
+
+        /* the first transfer may have merged with the counterparty range */
+        _pointer = _getPointer(_counterStop - 1);
+        emit Transfer(_counterparty, msg.sender, _stop - _start);
+        _emitTransferRange(_counterparty, msg.sender, _counterStart, _counterStop);
+        _transferSingleRange(_pointer, _counterparty, msg.sender, _counterStart, _counterStop);
+        return true;
+    }
+
+    /**
+        @notice internal - verify that a range may be transferred
+        @dev
+            The range must be within bounds, must not span multiple ranges
+            and must be owned by the sender
+        @param _from Sender address
+        @param _start Start index of range
+        @param _stop Stop index of range
+        @return Range array pointer
+     */
+    function _checkRange(
+        address _from,
+        uint64 _start,
+        uint64 _stop
+    )
+        internal
+        view
+        returns (uint64 _pointer)
+    {
+        _checkBounds(_start);
+        _checkBounds(_stop.sub(1));
+        require(_start < _stop); // dev: stop < start
+        _pointer = _getPointer(_stop.sub(1));
+        require(_pointer <= _start); // dev: multiple ranges
+        require(_from == rangeMap[_pointer].owner); // dev: sender does not own
+        return _pointer;
     }
 
     /**
@@ -227,11 +671,18 @@ contract NFToken is ERC20Interface {
         @param _from Sender address
         @param _to Receiver address
         @param _bigValue Amount to transfer
+        @param _policy Policy used to select ranges to transfer
      */
-    function _transfer(address _from, address _to, uint256 _bigValue) internal {
+    function _transfer(
+        address _from,
+        address _to,
+        uint256 _bigValue,
+        uint8 _policy
+    )
+        internal
+    {
         require(_bigValue <= MAX_UPPER_BOUND); // dev: uint64 overflow
 
-        uint64[9223372036854775808] storage r = balances[_from].ranges;
         uint64 _value = uint64(_bigValue);
 
         balances[_from].balance = balances[_from].balance.sub(_value);
@@ -241,27 +692,114 @@ contract NFToken is ERC20Interface {
         if (_from == _to || _bigValue == 0) {
             return;
         }
-        while (balances[_from].length > 0) {
-            uint64 _start = r[0];
-            uint64 _stop = rangeMap[_start].stop;
+        _transferValue(_from, _to, _value, _policy);
+    }
+
+    /**
+        @notice internal - transfer ownership of an amount of tokens
+        @dev
+            Ranges are selected according to _policy. Does not modify
+            balances, the caller is responsible for this.
+        @param _from Sender address
+        @param _to Receiver address
+        @param _value Amount to transfer
+        @param _policy Policy used to select ranges to transfer
+     */
+    function _transferValue(
+        address _from,
+        address _to,
+        uint64 _value,
+        uint8 _policy
+    )
+        internal
+    {
+        Balance storage b = balances[_from];
+        /* each iteration sends all or the last of a range, so b.length bounds the count */
+        uint128[] memory _packed = _rangeBuffer(b.length);
+        uint256 _count;
+        while (b.length > 0) {
+            uint64 _pointer = b.ranges[0];
+            if (_policy != POLICY_FIRST) {
+                _pointer = _selectRange(b, _to, _value, _policy);
+            }
+            uint64 _start = _pointer;
+            uint64 _stop = rangeMap[_pointer].stop;
             uint64 _amount = _stop.sub(_start);
             if (_value < _amount) {
-                _stop = _stop.sub(_amount.sub(_value));
+                /* when merging, send the end of the range if it touches the recipient */
+                if (_policy == POLICY_MERGE && rangeMap[_stop].owner == _to) {
+                    _start = _stop.sub(_value);
+                } else {
+                    _stop = _stop.sub(_amount.sub(_value));
+                }
                 _value = 0;
             }
             else {
                 _value = _value.sub(_amount);
             }
-            _transferSingleRange(_start, _from, _to, _start, _stop);
+            _logRange(_packed, _count, _from, _to, _start, _stop);
+            _count += 1;
+            _transferSingleRange(_pointer, _from, _to, _start, _stop);
             if (_value == 0) {
+                _emitTransferRanges(_from, _to, _packed, _count);
                 return;
             }
         }
         revert(); // dev: unreachable
     }
 
+    /**
+        @notice internal - select the next range to send in a transfer
+        @dev Iterates over every range held by the sender
+        @param b Sender balance
+        @param _to Receiver address
+        @param _value Remaining amount to transfer
+        @param _policy Policy used to select the range
+        @return Range array pointer
+     */
+    function _selectRange(
+        Balance storage b,
+        address _to,
+        uint64 _value,
+        uint8 _policy
+    )
+        internal
+        view
+        returns (uint64)
+    {
+        if (_policy == POLICY_MERGE) {
+            for (uint256 i; i < b.length; i++) {
+                uint64 _start = b.ranges[i];
+                if (
+                    rangeMap[tokens[_start - 1]].owner == _to ||
+                    rangeMap[rangeMap[_start].stop].owner == _to
+                ) {
+                    return _start;
+                }
+            }
+            return b.ranges[0];
+        }
+
+        uint64 _best = b.ranges[0];
+        uint64 _bestSize = rangeMap[_best].stop - _best;
+        for (uint256 i = 1; i < b.length; i++) {
+            uint64 _start = b.ranges[i];
+            uint64 _size = rangeMap[_start].stop - _start;
+            if (_policy == POLICY_LARGEST || _bestSize < _value) {
+                /* best fit prefers larger ranges until one covers the amount */
+                if (_size <= _bestSize) continue;
+            } else if (_size < _value || _size >= _bestSize) {
+                continue;
+            }
+            _best = _start;
+            _bestSize = _size;
+        }
+        return _best;
+    }
+
     /**
         @notice internal - transfer ownership of a single range of tokens
+        @dev Does not emit TransferRange, the caller is responsible for this.
         @param _pointer Range array pointer
         @param _from Sender address
         @param _to Recipient address
@@ -280,7 +818,6 @@ contract NFToken is ERC20Interface {
         Range storage r = rangeMap[_pointer];
         uint64 _rangeStop = r.stop;
         uint64 _prev = tokens[_start.sub(1)];
-        emit TransferRange(_from, _to, _start, _stop, _stop-_start);
 
         if (_pointer == _start) {
             /* entire range is being transferred */
@@ -292,14 +829,18 @@ contract NFToken is ERC20Interface {
                 if (!_left && !_right) {
                     _replaceInBalanceRange(_to, 0, _start);
                     r.owner = _to;
+                    _rangeChanged(_pointer);
                     return;
                 }
                 _setRangePointers(_pointer, _stop, 0);
                 /* merging with previous range */
                 if (!_right) {
                     delete rangeMap[_pointer];
+                    _setRangePointers(_prev, _start, 0);
                     rangeMap[_prev].stop = _stop;
                     _setRangePointers(_prev, _stop, _prev);
+                    _rangeChanged(_pointer);
+                    _rangeChanged(_prev);
                     return;
                 }
                 /* merging with next range */
@@ -307,6 +848,7 @@ contract NFToken is ERC20Interface {
                     _replaceInBalanceRange(_to, _stop, _start);
                     _setRange(_pointer, _to, rangeMap[_stop].stop);
                     delete rangeMap[_stop];
+                    _rangeChanged(_stop);
                     return;
                 }
                 /* merging with both ranges */
@@ -317,6 +859,9 @@ contract NFToken is ERC20Interface {
                 _setRangePointers(_stop, rangeMap[_stop].stop, 0);
                 _setRangePointers(_prev, rangeMap[_prev].stop, _prev);
                 delete rangeMap[_stop];
+                _rangeChanged(_pointer);
+                _rangeChanged(_prev);
+                _rangeChanged(_stop);
                 return;
             }
 
@@ -329,6 +874,7 @@ contract NFToken is ERC20Interface {
             /* merging with previous range */
             if (rangeMap[_prev].owner == _to) {
                 _setRangePointers(_prev, _start, 0);
+                _rangeChanged(_pointer);
                 _start = _prev;
             } else {
                 _replaceInBalanceRange(_to, 0, _start);
@@ -341,6 +887,7 @@ contract NFToken is ERC20Interface {
         _setRangePointers(_pointer, _rangeStop, 0);
         r.stop = _start;
         _setRangePointers(_pointer, _start, _pointer);
+        _rangeChanged(_pointer);
 
         /* range to transfer ends at end of existing range */
         if (_rangeStop == _stop) {
@@ -350,6 +897,7 @@ contract NFToken is ERC20Interface {
                 _setRangePointers(_stop, rangeMap[_stop].stop, 0);
                 uint64 _next = rangeMap[_stop].stop;
                 delete rangeMap[_stop];
+                _rangeChanged(_stop);
                 _stop = _next;
             } else {
                 _replaceInBalanceRange(_to, 0, _start);
@@ -365,6 +913,92 @@ contract NFToken is ERC20Interface {
         _setRange(_stop, _from, _rangeStop);
     }
 
+    /**
+        @notice internal - emit the event for a single range transfer
+        @param _from Sender address
+        @param _to Recipient address
+        @param _start Start index of range
+        @param _stop Stop index of range
+     */
+    function _emitTransferRange(address _from, address _to, uint64 _start, uint64 _stop) internal {
+        if (!_compactEvents()) {
+            emit TransferRange(_from, _to, _start, _stop, _stop - _start);
+            return;
+        }
+        uint128[] memory _packed = new uint128[](1);
+        _packed[0] = (uint128(_start) << 64) | _stop;
+        emit TransferRanges(_from, _to, _packed);
+    }
+
+    /**
+        @notice internal - allocate a buffer for ranges sent in a single call
+        @dev Returns an empty array when TransferRange is emitted for each range
+        @param _length Maximum number of ranges
+        @return Array to pass to _logRange and _emitTransferRanges
+     */
+    function _rangeBuffer(uint256 _length) internal pure returns (uint128[] memory _packed) {
+        if (_compactEvents()) {
+            _packed = new uint128[](_length);
+        }
+        return _packed;
+    }
+
+    /**
+        @notice internal - record one of many ranges sent in a single call
+        @dev
+            Emits TransferRange immediately, or packs the range into the
+            buffer when compact events are used
+        @param _packed Buffer returned by _rangeBuffer
+        @param _i Position of the range within the buffer
+        @param _from Sender address
+        @param _to Recipient address
+        @param _start Start index of range
+        @param _stop Stop index of range
+     */
+    function _logRange(
+        uint128[] memory _packed,
+        uint256 _i,
+        address _from,
+        address _to,
+        uint64 _start,
+        uint64 _stop
+    )
+        internal
+    {
+        if (_packed.length == 0) {
+            emit TransferRange(_from, _to, _start, _stop, _stop - _start);
+        } else {
+            _packed[_i] = (uint128(_start) << 64) | _stop;
+        }
+    }
+
+    /**
+        @notice internal - emit TransferRanges for ranges recorded with _logRange
+        @dev Does nothing when TransferRange was emitted for each range
+        @param _from Sender address
+        @param _to Recipient address
+        @param _packed Buffer returned by _rangeBuffer
+        @param _count Number of ranges recorded in the buffer
+     */
+    function _emitTransferRanges(
+        address _from,
+        address _to,
+        uint128[] memory _packed,
+        uint256 _count
+    )
+        internal
+    {
+        if (_packed.length == 0) return;
+        if (_count < _packed.length) {
+            uint128[] memory _trimmed = new uint128[](_count);
+            for (uint256 i; i < _count; i++) {
+                _trimmed[i] = _packed[i];
+            }
+            _packed = _trimmed;
+        }
+        emit TransferRanges(_from, _to, _packed);
+    }
+
     /**
         @notice sets a Range struct and associated pointers
         @dev keeping this as a seperate method reduces gas costs from SSTORE
@@ -377,10 +1011,19 @@ contract NFToken is ERC20Interface {
         if (r.owner != _owner) r.owner = _owner;
         if (r.stop != _stop) r.stop = _stop;
         _setRangePointers(_pointer, _stop, _pointer);
+        _rangeChanged(_pointer);
     }
 
     /**
         @notice modifies the balance range array
+        @dev
+            Range.position holds the position of each range within the
+            array (offset by one) so that ranges can be found without
+            iterating. It shares a storage slot with the owner and stop,
+            so no additional slots are written. Deleting swaps the final
+            range into the empty slot. A range that remains in storage
+            after leaving every balance, such as a burned range, must have
+            its position cleared by the caller.
         @param _addr Balance address
         @param _old Token index to remove
         @param _new Token index to add
@@ -392,27 +1035,36 @@ contract NFToken is ERC20Interface {
     )
         internal
     {
-        uint64[9223372036854775808] storage r = balances[_addr].ranges;
+        Balance storage b = balances[_addr];
         if (_old == 0) {
             // add a new range to the array
-            r[balances[_addr].length] = _new;
-            balances[_addr].length = balances[_addr].length.add(1);
+            require(b.length < MAX_POSITION); // dev: range limit
+            b.ranges[b.length] = _new;
+            b.length = b.length.add(1);
+            rangeMap[_new].position = uint32(b.length);
             return;
         }
-        for (uint256 i; i <= balances[_addr].length; i++) {
-            if (r[i] == _old) {
-                if (_new > 0) {
-                    // replace an existing range
-                    r[i] = _new;
-                } else {
-                    // delete an existing range
-                    balances[_addr].length = balances[_addr].length.sub(1);
-                    r[i] = r[balances[_addr].length];
-                }
-                return;
+        uint32 i = rangeMap[_old].position;
+        require(i != 0); // dev: range not in balance
+        if (_new > 0) {
+            // replace an existing range
+            b.ranges[i-1] = _new;
+            rangeMap[_new].position = i;
+            return;
+        }
+        // delete an existing range
+        b.length = b.length.sub(1);
+        if (i <= b.length) {
+            uint64 _last = b.ranges[b.length];
+            b.ranges[i-1] = _last;
+            rangeMap[_last].position = i;
+        }
+        if (b.length % 4 == 0) {
+            /* four starts share a slot, clear it once the final one is unused */
+            for (uint64 j = b.length; j < b.length + 4; j++) {
+                delete b.ranges[j];
             }
         }
-        revert(); // dev: unreachable
     }
 
     /**
@@ -428,14 +1080,15 @@ contract NFToken is ERC20Interface {
             return;
         }
         tokens[_stop] = _value;
-        uint256 _interval = SCOPING_MULTIPLIER;
+        uint256 _multiplier = _scopingMultiplier();
+        uint256 _interval = _multiplier;
         while (true) {
             if (_stop < _interval) return;
             uint256 i = uint256(_stop).div(_interval).mul(_interval);
 
-            _interval = _interval.mul(SCOPING_MULTIPLIER);
+            _interval = _interval.mul(_multiplier);
             if (i.mod(_interval) == 0) continue;
-            if (i > _start) tokens[i] = _value;
+            if (i >= _start) tokens[i] = _value;
         }
     }
 
@@ -447,14 +1100,71 @@ contract NFToken is ERC20Interface {
         @param _idx Token index
      */
     function _getPointer(uint256 _idx) internal view returns (uint64) {
+        uint256 _multiplier = _scopingMultiplier();
         uint256 _increment = 1;
         while (true) {
             if (tokens[_idx] != 0) return tokens[_idx];
-            if (_idx.mod(_increment.mul(SCOPING_MULTIPLIER)) == 0) {
-                _increment = _increment.mul(SCOPING_MULTIPLIER);
+            if (_idx.mod(_increment.mul(_multiplier)) == 0) {
+                _increment = _increment.mul(_multiplier);
                 require(_idx <= upperBound); // dev: exceeds upper bound
             }
             _idx = _idx.add(_increment);
         }
     }
+
+    /**
+        @notice internal - unique identifier for a swap approval
+        @param _owner Address giving the range _start:_stop
+        @param _counterparty Address giving the range _counterStart:_counterStop
+        @param _start Start index of range given by _owner
+        @param _stop Stop index of range given by _owner
+        @param _counterStart Start index of range given by _counterparty
+        @param _counterStop Stop index of range given by _counterparty
+        @return bytes32
+     */
+    function _swapId(
+        address _owner,
+        address _counterparty,
+        uint64 _start,
+        uint64 _stop,
+        uint64 _counterStart,
+        uint64 _counterStop
+    )
+        internal
+        pure
+        returns (bytes32)
+    {
+        return keccak256(
+            abi.encodePacked(_owner, _counterparty, _start, _stop, _counterStart, _counterStop)
+        );
+    }
+
+    /**
+        @notice internal - scoping multiplier used for range pointers
+        @dev Override to use a multiplier other than SCOPING_MULTIPLIER
+        @return uint256
+     */
+    function _scopingMultiplier() internal view returns (uint256) {
+        return SCOPING_MULTIPLIER;
+    }
+
+    /**
+        @notice internal - called after the owner or stop of a range is modified
+        @dev
+            Override to maintain a commitment over the set of ranges, see
+            NFTokenMerkle. A range that has been deleted has a stop of zero.
+        @param _start Start index of the range
+     */
+    function _rangeChanged(uint64 _start) internal {}
+
+    /**
+        @notice internal - emit TransferRanges in place of TransferRange
+        @dev
+            Override to return true, see NFTokenCompactEvents. A constant
+            avoids reading a storage flag each time a range is sent.
+        @return bool
+     */
+    function _compactEvents() internal pure returns (bool) {
+        return false;
+    }
 }
@@ -0,0 +1,44 @@
+pragma solidity 0.5.16;
+
+import "./NFTokenMintable.sol";
+
+/**
+    @title Mintable/Burnable Non-Fungible ERC20 with compact range events
+    @author Ben Hauser - @iamdefinitelyahuman
+    @author with guidance from Gabriel Shapiro - @lex-node
+    @dev
+        Emits one TransferRanges event per call in place of one
+        TransferRange event per range. Methods with an array of recipients
+        emit one for each recipient in the array. Each item in
+        the ranges array packs a range as (start << 64) | stop, so the
+        amount is not repeated. The ERC20 Transfer event is unchanged.
+
+        Off-chain tooling must decode TransferRanges, as in
+        scripts/range_index.py
+ */
+contract NFTokenCompactEvents is NFTokenMintable {
+
+    /**
+        @notice constructor method
+        @param _name Token Name
+        @param _symbol Token symbol
+        @param _totalSupply Total supply (assigned to msg.sender)
+     */
+    constructor(
+        string memory _name,
+        string memory _symbol,
+        uint64 _totalSupply
+    )
+        public
+        NFTokenMintable(_name, _symbol, _totalSupply)
+    {}
+
+    /**
+        @notice internal - emit TransferRanges in place of TransferRange
+        @return bool
+     */
+    function _compactEvents() internal pure returns (bool) {
+        return true;
+    }
+
+}
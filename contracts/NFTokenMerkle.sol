@@ -0,0 +1,121 @@
+pragma solidity 0.5.16;
+
+import "./NFTokenMintable.sol";
+
+/**
+    @title Mintable/Burnable Non-Fungible ERC20 with a Merkle commitment of ranges
+    @author Ben Hauser - @iamdefinitelyahuman
+    @author with guidance from Gabriel Shapiro - @lex-node
+    @dev
+        Maintains a sparse Merkle tree of depth 64 over every range, keyed by
+        the range start. Each leaf is keccak256(start, stop, owner) with
+        packed encoding, or zero where no range begins. A node with two zero
+        children is also zero, so empty subtrees are never written.
+
+        Anyone holding merkleRoot, e.g. from a storage proof or a bridge, can
+        verify ownership of a range from the 64 sibling hashes generated by
+        scripts/range_proof.py, without calling getRange on a full node.
+
+        Every modified range rewrites up to 64 tree nodes, so transfers cost
+        far more than with NFTokenMintable. See scripts/benchmarks/merkle.py
+ */
+contract NFTokenMerkle is NFTokenMintable {
+
+    uint256 constant TREE_DEPTH = 64;
+
+    bytes32 public merkleRoot;
+
+    /** tree nodes by level and index, level 0 holds the leaves */
+    mapping (uint256 => mapping (uint64 => bytes32)) merkleNodes;
+
+    /**
+        @notice constructor method
+        @param _name Token Name
+        @param _symbol Token symbol
+        @param _totalSupply Total supply (assigned to msg.sender)
+     */
+    constructor(
+        string memory _name,
+        string memory _symbol,
+        uint64 _totalSupply
+    )
+        public
+        NFTokenMintable(_name, _symbol, _totalSupply)
+    {}
+
+    /**
+        @notice Verify a proof that a range is held by an address
+        @dev
+            Reference implementation for verifiers that hold a trusted root.
+            A proof that a token is owned is a proof for the range holding it.
+        @param _root Merkle root to verify against
+        @param _owner Range owner
+        @param _start Start index of range
+        @param _stop Stop index of range
+        @param _proof Sibling hashes, from the leaf level up to the root
+        @return bool
+     */
+    function verifyRange(
+        bytes32 _root,
+        address _owner,
+        uint64 _start,
+        uint64 _stop,
+        bytes32[64] calldata _proof
+    )
+        external
+        pure
+        returns (bool)
+    {
+        bytes32 _node = keccak256(abi.encodePacked(_start, _stop, _owner));
+        uint64 _idx = _start;
+        for (uint256 i; i < TREE_DEPTH; i++) {
+            if (_idx & 1 == 0) {
+                _node = _hashNodes(_node, _proof[i]);
+            } else {
+                _node = _hashNodes(_proof[i], _node);
+            }
+            _idx >>= 1;
+        }
+        return _node == _root;
+    }
+
+    /**
+        @notice internal - update the tree after a range is modified
+        @dev
+            Stops early once a node is unchanged, as every node above it is
+            also unchanged
+        @param _start Start index of the range
+     */
+    function _rangeChanged(uint64 _start) internal {
+        Range storage r = rangeMap[_start];
+        bytes32 _node;
+        if (r.stop != 0) {
+            _node = keccak256(abi.encodePacked(_start, r.stop, r.owner));
+        }
+        uint64 _idx = _start;
+        for (uint256 i; i < TREE_DEPTH; i++) {
+            mapping (uint64 => bytes32) storage _level = merkleNodes[i];
+            if (_level[_idx] == _node) return;
+            _level[_idx] = _node;
+            if (_idx & 1 == 0) {
+                _node = _hashNodes(_node, _level[_idx + 1]);
+            } else {
+                _node = _hashNodes(_level[_idx - 1], _node);
+            }
+            _idx >>= 1;
+        }
+        merkleRoot = _node;
+    }
+
+    /**
+        @notice internal - hash two child nodes
+        @param _left Left child
+        @param _right Right child
+        @return bytes32
+     */
+    function _hashNodes(bytes32 _left, bytes32 _right) internal pure returns (bytes32) {
+        if (_left == bytes32(0) && _right == bytes32(0)) return bytes32(0);
+        return keccak256(abi.encodePacked(_left, _right));
+    }
+
+}
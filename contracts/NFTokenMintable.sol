@@ -40,25 +40,45 @@ contract NFTokenMintable is NFToken {
      */
     function mint(address _target, uint64 _value) external returns (bool) {
         require(msg.sender == owner); // dev: only owner
-        require(_value > 0); // dev: mint 0
-        require(upperBound.add(_value) <= MAX_UPPER_BOUND); // dev: upper bound
-        uint64 _start = upperBound.add(1);
-        uint64 _stop = _start + _value;
-        if (rangeMap[tokens[upperBound]].owner == _target) {
-            /* merge with previous range */
-            uint64 _pointer = tokens[upperBound];
-            rangeMap[_pointer].stop = _stop;
-        } else {
-            /* create new range */
-            _setRange(_start, _target, _stop);
-            balances[_target].ranges[balances[_target].length] = _start;
-            balances[_target].length = balances[_target].length.add(1);
+        _mint(_target, _value);
+        return true;
+    }
+
+    /**
+        @notice Mints new tokens to many targets
+        @dev
+            Only the owner can mint tokens. Consecutive mints to the same
+            target are combined into a single range, and totalSupply and
+            upperBound are only written once.
+        @param _targets Array of addresses to assign new tokens to
+        @param _values Array of token amounts to mint to each target
+        @return Bool success
+     */
+    function mintBatch(
+        address[] calldata _targets,
+        uint64[] calldata _values
+    )
+        external
+        returns (bool)
+    {
+        require(msg.sender == owner); // dev: only owner
+        require(_targets.length == _values.length); // dev: length mismatch
+        uint64 _upperBound = upperBound;
+        uint64 _start = _upperBound + 1;
+        for (uint256 i; i < _targets.length; i++) {
+            require(_values[i] > 0); // dev: mint 0
+            require(_upperBound.add(_values[i]) <= MAX_UPPER_BOUND); // dev: upper bound
+            uint64 _stop = _upperBound + 1 + _values[i];
+            emit Transfer(ZERO_ADDRESS, _targets[i], _values[i]);
+            _emitTransferRange(ZERO_ADDRESS, _targets[i], _upperBound + 1, _stop);
+            _upperBound = _stop - 1;
+            if (i + 1 == _targets.length || _targets[i + 1] != _targets[i]) {
+                _setMintedRange(_targets[i], _start, _stop);
+                _start = _stop;
+            }
         }
-        balances[_target].balance = balances[_target].balance.add(_value);
-        totalSupply = totalSupply.add(_value);
-        upperBound = upperBound.add(_value);
-        emit Transfer(ZERO_ADDRESS, _target, _value);
-        emit TransferRange(ZERO_ADDRESS, _target, _start, _stop, _value);
+        totalSupply = totalSupply.add(_upperBound - upperBound);
+        upperBound = _upperBound;
         return true;
     }
 
@@ -74,36 +94,208 @@ contract NFTokenMintable is NFToken {
      */
     function burn(uint64 _start, uint64 _stop) external returns (bool) {
         require(msg.sender == owner); // dev: only owner
+        _burn(_start, _stop);
+        return true;
+    }
+
+    /**
+        @notice Burns many token ranges
+        @dev
+            * Only the owner can burn tokens
+            * Only tokens held by the owner can be burned
+            * Each range follows the same rules as burn
+        @param _ranges Array of [(start, stop),..] to burn
+        @return Bool success
+     */
+    function burnRanges(uint64[2][] calldata _ranges) external returns (bool) {
+        require(msg.sender == owner); // dev: only owner
+        require(_ranges.length > 0); // dev: burn 0
+        _burnRanges(_ranges);
+        return true;
+    }
+
+    /**
+        @notice Burns tokens held by the owner, by amount
+        @dev
+            Ranges are chosen in the same way as transfer, starting from
+            the first range held by the owner.
+        @param _value Number of tokens to burn
+        @return Bool success
+     */
+    function burnAmount(uint64 _value) external returns (bool) {
+        require(msg.sender == owner); // dev: only owner
+        require(_value > 0); // dev: burn 0
+        Balance storage b = balances[msg.sender];
+        b.balance = b.balance.sub(_value);
+        totalSupply = totalSupply.sub(_value);
+        uint64 _remaining = _value;
+        uint128[] memory _packed = _rangeBuffer(b.length);
+        uint256 _count;
+        while (_remaining > 0) {
+            uint64 _start = b.ranges[0];
+            uint64 _stop = rangeMap[_start].stop;
+            if (_stop - _start > _remaining) {
+                _stop = _start + _remaining;
+            }
+            _remaining -= _stop - _start;
+            _logRange(_packed, _count, msg.sender, ZERO_ADDRESS, _start, _stop);
+            _count += 1;
+            _burnRange(_start, _start, _stop);
+        }
+        emit Transfer(msg.sender, ZERO_ADDRESS, _value);
+        _emitTransferRanges(msg.sender, ZERO_ADDRESS, _packed, _count);
+        return true;
+    }
+
+    /**
+        @notice internal - mint new tokens
+        @param _target Address to assign new tokens to
+        @param _value Number of tokens to mint
+     */
+    function _mint(address _target, uint64 _value) internal {
+        require(_value > 0); // dev: mint 0
+        require(upperBound.add(_value) <= MAX_UPPER_BOUND); // dev: upper bound
+        uint64 _start = upperBound.add(1);
+        uint64 _stop = _start + _value;
+        _setMintedRange(_target, _start, _stop);
+        totalSupply = totalSupply.add(_value);
+        upperBound = upperBound.add(_value);
+        emit Transfer(ZERO_ADDRESS, _target, _value);
+        _emitTransferRange(ZERO_ADDRESS, _target, _start, _stop);
+    }
+
+    /**
+        @notice internal - assign a newly minted range
+        @dev Does not modify totalSupply or upperBound
+        @param _target Address to assign new tokens to
+        @param _start Start index of range, one above the current upper bound
+        @param _stop Stop index of range
+     */
+    function _setMintedRange(address _target, uint64 _start, uint64 _stop) internal {
+        uint64 _pointer = tokens[_start - 1];
+        if (rangeMap[_pointer].owner == _target) {
+            /* merge with previous range */
+            _setRangePointers(_pointer, _start, 0);
+            rangeMap[_pointer].stop = _stop;
+            _setRangePointers(_pointer, _stop, _pointer);
+            _rangeChanged(_pointer);
+        } else {
+            /* create new range */
+            _setRange(_start, _target, _stop);
+            _replaceInBalanceRange(_target, 0, _start);
+        }
+        balances[_target].balance = balances[_target].balance.add(_stop - _start);
+    }
+
+    /**
+        @notice internal - burn a range of tokens held by the owner
+        @param _start Start index of range to burn
+        @param _stop Stop index of range to burn
+     */
+    function _burn(uint64 _start, uint64 _stop) internal {
+        uint64 _pointer = _checkBurn(_start, _stop);
+        uint64 _value = _stop - _start;
+        totalSupply = totalSupply.sub(_value);
+        balances[owner].balance = balances[owner].balance.sub(_value);
+        emit Transfer(owner, ZERO_ADDRESS, _value);
+        _emitTransferRange(owner, ZERO_ADDRESS, _start, _stop);
+        _burnRange(_pointer, _start, _stop);
+    }
+
+    /**
+        @notice internal - burn many ranges of tokens held by the owner
+        @dev totalSupply and the owner balance are only written once
+        @param _ranges Array of [(start, stop),..] to burn
+        @return Total number of tokens burned
+     */
+    function _burnRanges(uint64[2][] memory _ranges) internal returns (uint64 _value) {
+        uint128[] memory _packed = _rangeBuffer(_ranges.length);
+        for (uint256 i; i < _ranges.length; i++) {
+            uint64 _start = _ranges[i][0];
+            uint64 _stop = _ranges[i][1];
+            uint64 _pointer = _checkBurn(_start, _stop);
+            _logRange(_packed, i, owner, ZERO_ADDRESS, _start, _stop);
+            _burnRange(_pointer, _start, _stop);
+            _value = _value.add(_stop - _start);
+        }
+        totalSupply = totalSupply.sub(_value);
+        balances[owner].balance = balances[owner].balance.sub(_value);
+        emit Transfer(owner, ZERO_ADDRESS, _value);
+        _emitTransferRanges(owner, ZERO_ADDRESS, _packed, _ranges.length);
+        return _value;
+    }
+
+    /**
+        @notice internal - verify a range of tokens may be burned
+        @param _start Start index of range to burn
+        @param _stop Stop index of range to burn
+        @return Range pointer
+     */
+    function _checkBurn(uint64 _start, uint64 _stop) internal view returns (uint64 _pointer) {
         require(_stop > _start); // dev: burn 0
-        uint64 _pointer = _getPointer(_stop-1);
+        _pointer = _getPointer(_stop-1);
         require(_pointer <= _start); // dev: multiple ranges
-        address _target = rangeMap[_pointer].owner;
-        require(_target == owner); // dev: only owner tokens
+        require(rangeMap[_pointer].owner == owner); // dev: only owner tokens
+        return _pointer;
+    }
+
+    /**
+        @notice internal - burn a range of tokens held by the owner
+        @dev
+            Does not modify totalSupply or the owner balance, or emit
+            TransferRange. Burned ranges remain in storage so that getRange
+            can return a zero owner. Adjacent burned ranges are merged.
+        @param _pointer Range pointer, as returned by _checkBurn
+        @param _start Start index of range to burn
+        @param _stop Stop index of range to burn
+     */
+    function _burnRange(uint64 _pointer, uint64 _start, uint64 _stop) internal {
         if (rangeMap[_pointer].stop > _stop) {
-            _splitRange(_stop);
+            _splitRange(_pointer, _stop);
         }
         if (_pointer < _start) {
-            _splitRange(_start);
+            _splitRange(_pointer, _start);
         }
-        _replaceInBalanceRange(_target, _start, 0);
-        uint64 _value = _stop.sub(_start);
-        totalSupply = totalSupply.sub(_value);
-        balances[_target].balance = balances[_target].balance.sub(_value);
-        emit Transfer(_target, ZERO_ADDRESS, _value);
-        emit TransferRange(_target, ZERO_ADDRESS, _start, _stop, _value);
-        rangeMap[_start].owner = ZERO_ADDRESS;
-        return true;
+        _replaceInBalanceRange(owner, _start, 0);
+        /* burned ranges are not held in any balance */
+        rangeMap[_start].position = 0;
+
+        /* merge with adjacent burned ranges, freeing their storage */
+        uint64 _prev = tokens[_start - 1];
+        bool _left = (_prev != 0 && rangeMap[_prev].owner == ZERO_ADDRESS);
+        bool _right = (_stop <= upperBound && rangeMap[_stop].owner == ZERO_ADDRESS);
+        if (!_left && !_right) {
+            rangeMap[_start].owner = ZERO_ADDRESS;
+            _rangeChanged(_start);
+            return;
+        }
+        _setRangePointers(_start, _stop, 0);
+        if (_right) {
+            /* pointers for the next range are overwritten by _setRange */
+            uint64 _next = rangeMap[_stop].stop;
+            delete rangeMap[_stop];
+            _rangeChanged(_stop);
+            _stop = _next;
+        }
+        if (_left) {
+            delete rangeMap[_start];
+            _setRangePointers(_prev, _start, 0);
+            _rangeChanged(_start);
+            _start = _prev;
+        }
+        _setRange(_start, ZERO_ADDRESS, _stop);
     }
 
     /**
         @notice Splits a range during burning
+        @param _pointer Pointer of the range to split
         @param _split Index to split the range at
      */
-    function _splitRange(uint64 _split) internal {
-        uint64 _pointer = _getPointer(_split);
+    function _splitRange(uint64 _pointer, uint64 _split) internal {
         Range storage r = rangeMap[_pointer];
         uint64 _stop = r.stop;
         r.stop = _split;
+        _rangeChanged(_pointer);
         _replaceInBalanceRange(r.owner, 0, _split);
         _setRangePointers(_pointer, _stop, 0);
         _setRangePointers(_pointer, _split, _pointer);
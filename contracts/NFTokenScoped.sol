@@ -0,0 +1,52 @@
+pragma solidity 0.5.16;
+
+import "./NFToken.sol";
+
+/**
+    @title Non-Fungible ERC20 with a configurable scoping multiplier
+    @author Ben Hauser - @iamdefinitelyahuman
+    @author with guidance from Gabriel Shapiro - @lex-node
+    @dev
+        The scoping multiplier determines how many range pointers are
+        written when a range is set, and how many token indexes must be
+        read to find a range pointer. A larger multiplier makes writes
+        cheaper and lookups more expensive. The best value depends on the
+        total supply and typical range length, see scripts/benchmarks/scoping.py
+
+        The multiplier is held in storage, so every transfer pays for one
+        additional SLOAD per pointer operation compared to NFToken.
+ */
+contract NFTokenScoped is NFToken {
+
+    uint256 public scopingMultiplier;
+
+    /**
+        @notice constructor method
+        @param _name Token Name
+        @param _symbol Token symbol
+        @param _totalSupply Total supply (assigned to msg.sender)
+        @param _multiplier Scoping multiplier, cannot be modified
+     */
+    constructor(
+        string memory _name,
+        string memory _symbol,
+        uint64 _totalSupply,
+        uint256 _multiplier
+    )
+        public
+        NFToken(_name, _symbol, 0)
+    {
+        require(_multiplier > 1 && _multiplier <= 2**64); // dev: invalid multiplier
+        scopingMultiplier = _multiplier;
+        _mintInitialSupply(_totalSupply);
+    }
+
+    /**
+        @notice internal - scoping multiplier used for range pointers
+        @return uint256
+     */
+    function _scopingMultiplier() internal view returns (uint256) {
+        return scopingMultiplier;
+    }
+
+}
@@ -0,0 +1,172 @@
+#!/usr/bin/python3
+
+"""
+Shared harness for the gas benchmarks in this folder.
+
+Each benchmark script records the gas used by a set of named scenarios into a
+`GasRecorder`, and then calls `check` to compare the results against a stored
+baseline. Baselines are kept as JSON within `scripts/benchmarks/baselines/`.
+
+Run a benchmark with:
+
+    brownie run benchmarks/gas
+
+Once recorded, baselines are committed so that a regression fails the
+benchmark on any checkout. A benchmark fails if its baseline is missing, or
+does not include every scenario. To record a baseline, or accept a known change in gas costs,
+call `main(update=True)` from the console and commit the result:
+
+    >>> run("benchmarks/gas", "main", (0.02, True))
+"""
+
+import csv
+import json
+from pathlib import Path
+
+BASELINE_FOLDER = Path(__file__).parent.joinpath("baselines")
+
+# maximum allowed increase in gas, relative to the baseline
+DEFAULT_THRESHOLD = 0.02
+
+
+class GasRegression(Exception):
+    pass
+
+
+class MissingBaseline(Exception):
+    pass
+
+
+class GasRecorder:
+
+    """
+    Collects the gas used by transactions within a benchmark, keyed by
+    scenario name, e.g. "transferRange/whole/merge=left".
+    """
+
+    def __init__(self):
+        self.results = {}
+
+    def __getitem__(self, name):
+        return self.results[name]
+
+    def __len__(self):
+        return len(self.results)
+
+    def record(self, name, tx):
+        """Records the gas used by a transaction and returns the transaction."""
+        self.results[name] = tx.gas_used
+        return tx
+
+    def record_value(self, name, gas_used):
+        """Records a gas amount that was not taken directly from a transaction."""
+        self.results[name] = gas_used
+
+
+def fragment(nft, accounts, ranges, amount):
+    """
+    Mints `ranges * 2` alternating ranges of `amount` tokens, leaving accounts[0]
+    and accounts[1] each holding `ranges` non-adjacent ranges.
+
+    Arguments
+    ---------
+    nft : NFTokenMintable
+        A freshly deployed token with a total supply of zero.
+    """
+    for i in range(ranges * 2):
+        nft.mint(accounts[i % 2], amount, {"from": accounts[0]})
+
+
+def load(path):
+    """Loads benchmark results from a JSON or CSV file."""
+    path = Path(path)
+    with path.open() as fp:
+        if path.suffix == ".csv":
+            return {row["scenario"]: int(row["gas_used"]) for row in csv.DictReader(fp)}
+        return json.load(fp)
+
+
+def save(results, path):
+    """Saves benchmark results to a JSON or CSV file, based on the file suffix."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as fp:
+        if path.suffix == ".csv":
+            writer = csv.writer(fp)
+            writer.writerow(["scenario", "gas_used"])
+            writer.writerows(sorted(results.items()))
+        else:
+            json.dump(results, fp, indent=2, sort_keys=True)
+            fp.write("\n")
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compares benchmark results against a baseline.
+
+    Arguments
+    ---------
+    results : dict
+        Current results, as {scenario: gas_used}
+    baseline : dict
+        Baseline results, in the same format
+    threshold : float
+        Maximum allowed relative increase in gas
+
+    Returns
+    -------
+    list
+        (scenario, baseline gas, current gas) for each scenario where the
+        increase exceeds the threshold
+    """
+    regressions = []
+    for name, gas_used in sorted(results.items()):
+        if name not in baseline:
+            continue
+        if gas_used > baseline[name] * (1 + threshold):
+            regressions.append((name, baseline[name], gas_used))
+    return regressions
+
+
+def report(results, baseline=None):
+    """Prints benchmark results, including the delta against a baseline if given."""
+    baseline = baseline or {}
+    width = max((len(i) for i in results), default=0)
+    for name, gas_used in sorted(results.items()):
+        line = f"{name:<{width}}  {gas_used:>10}"
+        if name in baseline and baseline[name]:
+            delta = gas_used - baseline[name]
+            line += f"  {delta:>+9} ({delta / baseline[name]:+.2%})"
+        print(line)
+
+
+def check(recorder, name, threshold=DEFAULT_THRESHOLD, update=False):
+    """
+    Compares recorded results against the stored baseline `name`.
+
+    If `update` is True, the current results are saved as the new baseline.
+    Otherwise raises `MissingBaseline` if the baseline does not exist or lacks
+    a recorded scenario, and `GasRegression` if any scenario uses more gas than
+    the baseline allows.
+    """
+    path = BASELINE_FOLDER.joinpath(f"{name}.json")
+    baseline = load(path) if path.exists() else {}
+    report(recorder.results, baseline)
+
+    if update:
+        save(recorder.results, path)
+        print(f"\nBaseline saved to {path}")
+        return
+
+    if not baseline:
+        raise MissingBaseline(f"No baseline at {path}, call main(update=True) to record one")
+    missing = sorted(set(recorder.results) - set(baseline))
+    if missing:
+        raise MissingBaseline(f"Scenarios missing from {path}: {', '.join(missing)}")
+
+    regressions = compare(recorder.results, baseline, threshold)
+    if regressions:
+        details = "\n".join(f"  {i[0]}: {i[1]} -> {i[2]}" for i in regressions)
+        raise GasRegression(
+            f"{len(regressions)} scenario(s) exceed the {threshold:.0%} threshold:\n{details}"
+        )
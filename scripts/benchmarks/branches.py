@@ -0,0 +1,175 @@
+#!/usr/bin/python3
+
+"""
+Gas profile of each branch within NFToken._transferSingleRange.
+
+Every TransferRange event emitted by a transfer corresponds to one call to
+`_transferSingleRange`. The gas used by each call is measured from the
+transaction trace, and the branch taken is determined from the state of the
+token ranges immediately before the call, as tracked by a `RangeIndex`.
+
+Run the profiler against a random workload with:
+
+    brownie run benchmarks/branches
+
+`BranchProfile` may also be used directly to profile any set of transactions,
+so long as they are added in the order they were confirmed.
+"""
+
+import random
+
+from brownie import NFToken, accounts
+
+from scripts.benchmarks import save
+from scripts.range_index import ZERO_ADDRESS, RangeIndex
+
+BRANCHES = (
+    "whole/no_merge",
+    "whole/merge_left",
+    "whole/merge_right",
+    "whole/merge_both",
+    "start/no_merge",
+    "start/merge_left",
+    "end/no_merge",
+    "end/merge_right",
+    "inside",
+)
+
+# width of the longest bar in the histogram
+HISTOGRAM_WIDTH = 40
+
+
+class BranchProfile:
+
+    """
+    Aggregates the gas used within each branch of `_transferSingleRange`.
+
+    Arguments
+    ---------
+    address : str
+        Address of the profiled token. Transactions must be added starting
+        from the deployment of the contract.
+    """
+
+    def __init__(self, address):
+        self.index = RangeIndex(address)
+        self.gas = {i: [] for i in BRANCHES}
+
+    def add(self, tx):
+        """Adds a confirmed transaction to the profile."""
+        events = [
+            (i["from"], i["to"], i["start"], i["stop"])
+            for i in _transfer_ranges(tx)
+            if i.address == self.index.address
+        ]
+        if not events:
+            return
+        # mints and burns do not call _transferSingleRange
+        is_transfer = [ZERO_ADDRESS not in i[:2] for i in events]
+        segments = _segment_gas(tx.trace, "_transferSingleRange") if any(is_transfer) else []
+        if len(segments) != sum(is_transfer):
+            raise ValueError(
+                f"{tx.txid}: found {len(segments)} calls to _transferSingleRange "
+                f"but {sum(is_transfer)} TransferRange events"
+            )
+
+        segments = iter(segments)
+        for event, transfer in zip(events, is_transfer):
+            if transfer:
+                self.gas[classify(self.index, *event)].append(next(segments))
+            self.index.apply(*event)
+
+    def histogram(self):
+        """Prints a histogram of the total gas used within each branch."""
+        totals = {k: sum(v) for k, v in self.gas.items()}
+        total = sum(totals.values()) or 1
+        largest = max(totals.values()) or 1
+        print(f"{'branch':<18}{'calls':>7}{'mean':>9}{'total':>11}{'share':>8}")
+        for name in BRANCHES:
+            calls = len(self.gas[name])
+            mean = totals[name] // calls if calls else 0
+            bar = "#" * round(HISTOGRAM_WIDTH * totals[name] / largest)
+            print(
+                f"{name:<18}{calls:>7}{mean:>9}{totals[name]:>11}"
+                f"{totals[name] / total:>8.1%}  {bar}"
+            )
+
+    def means(self):
+        """Returns the mean gas used within each branch that has been called."""
+        return {k: sum(v) // len(v) for k, v in self.gas.items() if v}
+
+
+def classify(index, from_, to, start, stop):
+    """
+    Returns the branch of `_transferSingleRange` that is taken when transferring
+    `start:stop` to `to`, given the state of the ranges prior to the transfer.
+    """
+    range_start, range_stop = index.get_range(start)[1:]
+    left = _owner_of(index, start - 1) == to
+    right = _owner_of(index, stop) == to
+
+    if range_start == start:
+        if range_stop == stop:
+            if left and right:
+                return "whole/merge_both"
+            if left or right:
+                return "whole/merge_left" if left else "whole/merge_right"
+            return "whole/no_merge"
+        return "start/merge_left" if left else "start/no_merge"
+    if range_stop == stop:
+        return "end/merge_right" if right else "end/no_merge"
+    return "inside"
+
+
+def main(steps=200, seed=0, output=None):
+    rng = random.Random(seed)
+    holders = accounts[:5]
+    nft = accounts[0].deploy(NFToken, "NFT", "NFT", 10 ** 6)
+    profile = BranchProfile(nft.address)
+    profile.add(nft.tx)
+
+    for _ in range(steps):
+        sender, receiver = rng.sample(holders, 2)
+        ranges = profile.index.ranges_of(sender)
+        if not ranges:
+            continue
+        if rng.random() < 0.25:
+            amount = rng.randint(1, min(profile.index.balance_of(sender), 1000))
+            tx = nft.transfer(receiver, amount, {"from": sender})
+        else:
+            start, stop = rng.choice(ranges)
+            start = rng.choice((start, rng.randint(start, stop - 1)))
+            stop = rng.choice((stop, rng.randint(start + 1, stop)))
+            tx = nft.transferRange(receiver, start, stop, {"from": sender})
+        profile.add(tx)
+
+    profile.histogram()
+    if output:
+        save(profile.means(), output)
+
+
+def _owner_of(index, idx):
+    try:
+        return index.owner_of(idx)
+    except IndexError:
+        return None
+
+
+def _transfer_ranges(tx):
+    if "TransferRange" not in tx.events:
+        return []
+    return list(tx.events["TransferRange"])
+
+
+def _segment_gas(trace, fn_name):
+    # returns the gas used by each call to an internal function, in order
+    results = []
+    entry = None
+    for step in trace:
+        if entry is None:
+            if step["fn"].endswith(f".{fn_name}"):
+                entry = (step["jumpDepth"], step["gas"])
+        elif step["jumpDepth"] < entry[0]:
+            results.append(entry[1] - step["gas"])
+            entry = None
+    return results
@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+
+from brownie import NFTokenMintable, accounts
+
+from scripts.benchmarks import DEFAULT_THRESHOLD, GasRecorder, check, fragment
+
+# number of ranges held by each account before defragmenting, must be a power of 2
+RANGE_COUNTS = (4, 16, 64)
+
+# number of tokens within each range
+RANGE_SIZE = 100
+
+# number of ranges sent in the transfer used to measure savings
+TRANSFER_RANGES = 4
+
+
+def main(threshold=DEFAULT_THRESHOLD, update=False):
+    """
+    Compares the one-off cost of consolidating fragmented holdings against the
+    gas saved on a later transfer.
+
+    accounts[0] and accounts[1] each hold alternating ranges of equal size.
+    They are consolidated by repeatedly swapping adjacent ranges with
+    swapRanges.
+    """
+    recorder = GasRecorder()
+    amount = RANGE_SIZE * TRANSFER_RANGES
+
+    for count in RANGE_COUNTS:
+        nft = _deploy(count)
+        tx = nft.transfer(accounts[2], amount, {"from": accounts[0]})
+        before = recorder.record(f"transfer/ranges={count}", tx).gas_used
+
+        nft = _deploy(count)
+        cost = _swap_all(nft)
+        recorder.record_value(f"swapRanges/ranges={count}/cost", cost)
+        tx = nft.transfer(accounts[2], amount, {"from": accounts[0]})
+        after = recorder.record(f"swapRanges/ranges={count}/transfer", tx).gas_used
+        _summary("swapRanges", count, cost, before, after)
+
+    print()
+    check(recorder, "defragment", threshold, update)
+
+
+def _deploy(count):
+    nft = accounts[0].deploy(NFTokenMintable, "NFT", "NFT", 0)
+    fragment(nft, accounts, count, RANGE_SIZE)
+    return nft
+
+
+def _swap_all(nft):
+    # each pass swaps every second range of accounts[0] with the preceding
+    # range of accounts[1], halving the range count of both accounts
+    cost = 0
+    while nft.rangeCountOf(accounts[0]) > 1:
+        ranges = sorted(nft.rangesOf(accounts[0]) + nft.rangesOf(accounts[1]))
+        for i in range(2, len(ranges), 4):
+            args = ranges[i] + ranges[i - 1]
+            tx = nft.approveSwap(accounts[0], *args[2:], *args[:2], True, {"from": accounts[1]})
+            cost += tx.gas_used
+            tx = nft.swapRanges(accounts[1], *args, {"from": accounts[0]})
+            cost += tx.gas_used
+    return cost
+
+
+def _summary(name, count, cost, before, after):
+    saved = before - after
+    breakeven = f"{-(-cost // saved)} transfers" if saved > 0 else "never"
+    print(f"{name} ranges={count}: cost {cost}, saves {saved} per transfer, breakeven {breakeven}")
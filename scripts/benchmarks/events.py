@@ -0,0 +1,39 @@
+#!/usr/bin/python3
+
+from brownie import NFTokenCompactEvents, NFTokenMintable, accounts
+
+from scripts.benchmarks import DEFAULT_THRESHOLD, GasRecorder, check, fragment
+
+# number of ranges sent in a single call
+RANGE_COUNTS = (1, 10, 50)
+
+CONTRACTS = {"TransferRange": NFTokenMintable, "TransferRanges": NFTokenCompactEvents}
+
+
+def main(threshold=DEFAULT_THRESHOLD, update=False):
+    """
+    Compares the gas used with one TransferRange event per range, against a
+    single packed TransferRanges event per call.
+    """
+    recorder = GasRecorder()
+    for ranges in RANGE_COUNTS:
+        for method in ("transfer", "transferRanges", "burnRanges"):
+            gas_used = {}
+            for event, contract in CONTRACTS.items():
+                nft = accounts[0].deploy(contract, "NFT", "NFT", 0)
+                fragment(nft, accounts, ranges, 100)
+                tx = _call(nft, method, ranges)
+                gas_used[event] = recorder.record(f"{event}/{method}/ranges={ranges}", tx).gas_used
+            before, after = gas_used.values()
+            print(f"{method} of {ranges} range(s): {before} -> {after}, saves {before - after}")
+
+    print()
+    check(recorder, "events", threshold, update)
+
+
+def _call(nft, method, ranges):
+    if method == "transfer":
+        return nft.transfer(accounts[2], ranges * 100, {"from": accounts[0]})
+    if method == "transferRanges":
+        return nft.transferRanges(accounts[2], nft.rangesOf(accounts[0]), {"from": accounts[0]})
+    return nft.burnRanges(nft.rangesOf(accounts[0]), {"from": accounts[0]})
@@ -0,0 +1,49 @@
+#!/usr/bin/python3
+
+from brownie import NFToken, accounts
+
+from scripts.benchmarks import DEFAULT_THRESHOLD, GasRecorder, GasRegression, check
+
+# number of ranges held by the sender when each measurement is taken
+RANGE_COUNTS = (1, 10, 100, 1000, 10000)
+
+# number of ranges created in a single transferMany call
+BATCH_SIZE = 40
+
+# maximum allowed difference between the cheapest and most expensive measurement
+FLAT_TOLERANCE = 0.02
+
+
+def main(threshold=DEFAULT_THRESHOLD, update=False):
+    """
+    Measures the cost of modifying a range held by an increasingly fragmented
+    account, to verify that it does not depend on the number of ranges held.
+
+    accounts[1] is given many 2 token ranges, separated by single tokens that
+    belong to accounts[2]. At each count, the first token from the most
+    recently added range is transferred to an account that holds no tokens.
+    This requires a lookup of the final item within the balance range array.
+    """
+    recorder = GasRecorder()
+    nft = accounts[0].deploy(NFToken, "NFT", "NFT", max(RANGE_COUNTS) * 3)
+
+    count = 0
+    for i, target in enumerate(RANGE_COUNTS):
+        while count < target:
+            size = min(BATCH_SIZE, target - count)
+            nft.transferMany(
+                [accounts[1], accounts[2]] * size, [2, 1] * size, {"from": accounts[0]}
+            )
+            count += size
+
+        start = count * 3 - 2
+        tx = nft.transferRange(accounts[3 + i], start, start + 1, {"from": accounts[1]})
+        recorder.record(f"transferRange/ranges={count}", tx)
+
+    check(recorder, "fragmentation", threshold, update)
+
+    costs = recorder.results.values()
+    if max(costs) > min(costs) * (1 + FLAT_TOLERANCE):
+        raise GasRegression(
+            f"transfer cost varies with range count: {min(costs)} - {max(costs)} gas"
+        )
@@ -0,0 +1,201 @@
+#!/usr/bin/python3
+
+from brownie import NFToken, NFTokenMintable, accounts
+
+from scripts.benchmarks import DEFAULT_THRESHOLD, GasRecorder, check, fragment
+
+# number of ranges held by the sender
+RANGE_COUNTS = (1, 10, 50, 100)
+
+# number of tokens within each range
+RANGE_SIZES = (1, 100, 65535)
+
+# number of tokens sent from a single range
+TRANSFER_SIZES = (1, 100, 10000, 2 ** 32)
+
+# number of recipients in a batched transfer
+RECIPIENT_COUNTS = (1, 10, 100)
+
+
+def main(threshold=DEFAULT_THRESHOLD, update=False):
+    recorder = GasRecorder()
+    bench_fragmented(recorder)
+    bench_fragmented_receiver(recorder)
+    bench_transfer_size(recorder)
+    bench_transfer_ranges(recorder)
+    bench_transfer_many(recorder)
+    bench_transfer_range(recorder)
+    bench_mint(recorder)
+    bench_mint_batch(recorder)
+    bench_burn(recorder)
+    bench_burn_merge(recorder)
+    bench_burn_ranges(recorder)
+    check(recorder, "gas", threshold, update)
+
+
+def bench_fragmented(recorder):
+    """transfer and transferFrom of a sender's entire balance, across many ranges"""
+    for ranges in RANGE_COUNTS:
+        for amount in RANGE_SIZES:
+            nft = _deploy_fragmented(ranges, amount)
+            tx = nft.transfer(accounts[2], ranges * amount, {"from": accounts[0]})
+            recorder.record(f"transfer/ranges={ranges}/size={amount}", tx)
+
+            nft = _deploy_fragmented(ranges, amount)
+            nft.approve(accounts[2], ranges * amount, {"from": accounts[0]})
+            tx = nft.transferFrom(accounts[0], accounts[2], ranges * amount, {"from": accounts[2]})
+            recorder.record(f"transferFrom/ranges={ranges}/size={amount}", tx)
+
+
+def bench_fragmented_receiver(recorder):
+    """transfer that adds a new range to a receiver already holding many ranges"""
+    for ranges in RANGE_COUNTS:
+        nft = _deploy_fragmented(ranges, 100)
+        nft.mint(accounts[2], 100, {"from": accounts[0]})
+        tx = nft.transfer(accounts[0], 1, {"from": accounts[2]})
+        recorder.record(f"transfer/receiver_ranges={ranges}", tx)
+
+
+def bench_transfer_size(recorder):
+    """transfer of a partial balance from a single range"""
+    for amount in TRANSFER_SIZES:
+        nft = accounts[0].deploy(NFToken, "NFT", "NFT", 2 ** 40)
+        tx = nft.transfer(accounts[1], amount, {"from": accounts[0]})
+        recorder.record(f"transfer/amount={amount}", tx)
+
+
+def bench_transfer_ranges(recorder):
+    """transferRanges of many specific ranges in a single call"""
+    for ranges in RANGE_COUNTS:
+        nft = _deploy_fragmented(ranges, 100)
+        tx = nft.transferRanges(accounts[2], nft.rangesOf(accounts[0]), {"from": accounts[0]})
+        recorder.record(f"transferRanges/ranges={ranges}", tx)
+
+
+def bench_transfer_many(recorder):
+    """transferMany and transferRangeMany to many distinct recipients"""
+    for count in RECIPIENT_COUNTS:
+        recipients = [_address(i) for i in range(1, count + 1)]
+
+        nft = accounts[0].deploy(NFToken, "NFT", "NFT", 10 ** 6)
+        tx = nft.transferMany(recipients, [100] * count, {"from": accounts[0]})
+        recorder.record(f"transferMany/recipients={count}", tx)
+
+        nft = accounts[0].deploy(NFToken, "NFT", "NFT", 10 ** 6)
+        ranges = [(i * 200 + 1, i * 200 + 101) for i in range(count)]
+        tx = nft.transferRangeMany(recipients, ranges, {"from": accounts[0]})
+        recorder.record(f"transferRangeMany/recipients={count}", tx)
+
+
+def bench_transfer_range(recorder):
+    """
+    transferRange across each branch of NFToken._transferSingleRange
+
+    Each scenario starts from the same distribution used in the test suite:
+    accounts[1:4] each hold a single range of 10000 tokens.
+    """
+    scenarios = {
+        "whole/merge=none": [(2, 4, 10001, 20001)],
+        "whole/merge=left": [(2, 1, 10001, 20001)],
+        "whole/merge=right": [(2, 3, 10001, 20001)],
+        "whole/merge=both": [(1, 3, 5000, 10001), (3, 1, 25001, 30001), (2, 3, 10001, 20001)],
+        "start/merge=none": [(2, 4, 10001, 11001)],
+        "start/merge=left": [(2, 1, 10001, 11001)],
+        "end/merge=none": [(2, 4, 19000, 20001)],
+        "end/merge=right": [(2, 3, 19000, 20001)],
+        "inside": [(2, 4, 12000, 13000)],
+    }
+    for name, transfers in scenarios.items():
+        nft = _deploy_distributed()
+        for sender, receiver, start, stop in transfers:
+            tx = nft.transferRange(accounts[receiver], start, stop, {"from": accounts[sender]})
+        # only the final transfer in each scenario is recorded
+        recorder.record(f"transferRange/{name}", tx)
+
+
+def bench_mint(recorder):
+    """mint of a new range, and mint that merges with the previous range"""
+    nft = accounts[0].deploy(NFTokenMintable, "NFT", "NFT", 0)
+    recorder.record("mint/first", nft.mint(accounts[1], 10000, {"from": accounts[0]}))
+    recorder.record("mint/merge=none", nft.mint(accounts[2], 10000, {"from": accounts[0]}))
+    recorder.record("mint/merge=left", nft.mint(accounts[2], 10000, {"from": accounts[0]}))
+
+
+def bench_mint_batch(recorder):
+    """mintBatch to many distinct targets, against the total of individual mints"""
+    for count in RECIPIENT_COUNTS:
+        targets = [_address(i) for i in range(1, count + 1)]
+
+        nft = accounts[0].deploy(NFTokenMintable, "NFT", "NFT", 0)
+        tx = nft.mintBatch(targets, [100] * count, {"from": accounts[0]})
+        recorder.record(f"mintBatch/targets={count}", tx)
+
+        nft = accounts[0].deploy(NFTokenMintable, "NFT", "NFT", 0)
+        gas_used = sum(nft.mint(i, 100, {"from": accounts[0]}).gas_used for i in targets)
+        recorder.record_value(f"mint/targets={count}", gas_used)
+
+
+def bench_burn(recorder):
+    """burn of an entire range, and of partial ranges"""
+    scenarios = {
+        "whole": (10001, 20001),
+        "start": (10001, 11001),
+        "end": (19000, 20001),
+        "inside": (12000, 13000),
+    }
+    for name, (start, stop) in scenarios.items():
+        nft = accounts[0].deploy(NFTokenMintable, "NFT", "NFT", 0)
+        for account in (accounts[1], accounts[0], accounts[1]):
+            nft.mint(account, 10000, {"from": accounts[0]})
+        recorder.record(f"burn/{name}", nft.burn(start, stop, {"from": accounts[0]}))
+
+
+def bench_burn_merge(recorder):
+    """burn of a range adjacent to burned ranges, which are merged"""
+    scenarios = {
+        "left": [(2001, 3001), (3001, 4001)],
+        "right": [(3001, 4001), (2001, 3001)],
+        "both": [(2001, 3001), (4001, 5001), (3001, 4001)],
+    }
+    for name, burns in scenarios.items():
+        nft = accounts[0].deploy(NFTokenMintable, "NFT", "NFT", 0)
+        nft.mint(accounts[0], 10000, {"from": accounts[0]})
+        for start, stop in burns:
+            tx = nft.burn(start, stop, {"from": accounts[0]})
+        # only the final burn in each scenario is recorded
+        recorder.record(f"burn/merge={name}", tx)
+
+
+def bench_burn_ranges(recorder):
+    """burnRanges and burnAmount of many owner ranges, against the total of individual burns"""
+    for ranges in RANGE_COUNTS:
+        nft = _deploy_fragmented(ranges, 100)
+        tx = nft.burnRanges(nft.rangesOf(accounts[0]), {"from": accounts[0]})
+        recorder.record(f"burnRanges/ranges={ranges}", tx)
+
+        nft = _deploy_fragmented(ranges, 100)
+        tx = nft.burnAmount(ranges * 100, {"from": accounts[0]})
+        recorder.record(f"burnAmount/ranges={ranges}", tx)
+
+        nft = _deploy_fragmented(ranges, 100)
+        gas_used = sum(
+            nft.burn(*i, {"from": accounts[0]}).gas_used for i in nft.rangesOf(accounts[0])
+        )
+        recorder.record_value(f"burn/ranges={ranges}", gas_used)
+
+
+def _deploy_fragmented(ranges, amount):
+    nft = accounts[0].deploy(NFTokenMintable, "NFT", "NFT", 0)
+    fragment(nft, accounts, ranges, amount)
+    return nft
+
+
+def _deploy_distributed():
+    nft = accounts[0].deploy(NFToken, "NFT", "NFT", 30000)
+    for i in range(1, 4):
+        nft.transfer(accounts[i], 10000, {"from": accounts[0]})
+    return nft
+
+
+def _address(value):
+    return "0x" + hex(value)[2:].zfill(40)
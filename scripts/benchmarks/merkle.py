@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+
+from brownie import NFTokenMerkle, NFTokenMintable, accounts
+
+from scripts.benchmarks import DEFAULT_THRESHOLD, GasRecorder, check
+
+# name: (sender, receiver, start, stop), after accounts[1:4] each receive 10000 tokens
+SCENARIOS = {
+    "transferRange/inside": (2, 4, 12000, 13000),
+    "transferRange/start/merge=left": (2, 1, 10001, 11001),
+    "transferRange/whole/merge=both": (2, 1, 10001, 20001),
+}
+
+
+def main(threshold=DEFAULT_THRESHOLD, update=False):
+    """
+    Compares NFTokenMintable against NFTokenMerkle, which also updates a
+    Merkle commitment of the range set each time a range is modified.
+    """
+    recorder = GasRecorder()
+    for contract in (NFTokenMintable, NFTokenMerkle):
+        name = contract._name
+        for scenario, (sender, receiver, start, stop) in SCENARIOS.items():
+            nft = _deploy(contract)
+            if scenario.endswith("both"):
+                nft.transferRange(accounts[1], 20001, 30001, {"from": accounts[3]})
+            tx = nft.transferRange(accounts[receiver], start, stop, {"from": accounts[sender]})
+            recorder.record(f"{name}/{scenario}", tx)
+
+        nft = _deploy(contract)
+        recorder.record(f"{name}/mint", nft.mint(accounts[1], 1000, {"from": accounts[0]}))
+        nft.transferRange(accounts[0], 1, 1001, {"from": accounts[1]})
+        recorder.record(f"{name}/burn", nft.burn(1, 500, {"from": accounts[0]}))
+
+    for scenario in list(SCENARIOS) + ["mint", "burn"]:
+        before = recorder[f"NFTokenMintable/{scenario}"]
+        after = recorder[f"NFTokenMerkle/{scenario}"]
+        print(f"{scenario}: {before} -> {after}, costs {after - before}")
+
+    print()
+    check(recorder, "merkle", threshold, update)
+
+
+def _deploy(contract):
+    nft = accounts[0].deploy(contract, "NFT", "NFT", 30000)
+    for i in range(1, 4):
+        nft.transfer(accounts[i], 10000, {"from": accounts[0]})
+    return nft
@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+
+import random
+
+from brownie import NFToken, accounts
+
+from scripts.benchmarks import DEFAULT_THRESHOLD, GasRecorder, check
+
+POLICIES = {"first": 0, "largest": 1, "best_fit": 2, "merge": 3}
+
+# number of accounts holding tokens
+HOLDERS = 5
+
+# number of calls within the workload
+STEPS = 300
+
+# fraction of calls that are transferRange rather than transfer
+RANGE_TRANSFERS = 0.5
+
+
+def main(threshold=DEFAULT_THRESHOLD, update=False, seed=0):
+    """
+    Runs the same random workload of transfer and transferRange calls with each
+    transfer policy, and compares the gas used by transfer and the number of
+    ranges held at the end of the workload.
+
+    transferRange calls fragment the holdings of each account, the same as
+    in the stateful tests. The policy decides which of these ranges are spent
+    by each call to transfer.
+    """
+    recorder = GasRecorder()
+    for name, policy in POLICIES.items():
+        gas_used, ranges = _run(policy, random.Random(seed))
+        gas_used = sorted(gas_used)
+        recorder.record_value(f"{name}/transfer/mean", sum(gas_used) // len(gas_used))
+        recorder.record_value(f"{name}/transfer/p90", gas_used[len(gas_used) * 9 // 10])
+        print(f"{name}: {ranges} ranges after {STEPS} calls")
+
+    print()
+    check(recorder, "policies", threshold, update)
+
+
+def _run(policy, rng):
+    holders = accounts[:HOLDERS]
+    nft = accounts[0].deploy(NFToken, "NFT", "NFT", 10 ** 6)
+    nft.transferMany(holders[1:], [10 ** 6 // HOLDERS] * (HOLDERS - 1), {"from": accounts[0]})
+    for account in holders:
+        nft.setTransferPolicy(policy, {"from": account})
+
+    gas_used = []
+    for _ in range(STEPS):
+        sender, receiver = rng.sample(holders, 2)
+        balance = nft.balanceOf(sender)
+        if not balance:
+            continue
+        if rng.random() < RANGE_TRANSFERS:
+            ranges = nft.rangesOf(sender)
+            start, stop = ranges[rng.randrange(len(ranges))]
+            start = rng.randint(start, stop - 1)
+            stop = rng.randint(start + 1, stop)
+            nft.transferRange(receiver, start, stop, {"from": sender})
+        else:
+            amount = rng.randint(1, max(balance // 10, 1))
+            tx = nft.transfer(receiver, amount, {"from": sender})
+            gas_used.append(tx.gas_used)
+
+    return gas_used, sum(nft.rangeCountOf(i) for i in holders)
@@ -0,0 +1,194 @@
+#!/usr/bin/python3
+
+"""
+Replays a recorded trace of calls against a local NFTokenMintable deployment.
+
+The trace is a JSONL file with one call per line:
+
+    {"fn": "transfer", "sender": "0x...", "receiver": "0x...", "amount": 100}
+    {"fn": "transferRange", "sender": "0x...", "receiver": "0x...", "start": 1, "stop": 51}
+    {"fn": "mint", "receiver": "0x...", "amount": 5000}
+    {"fn": "burn", "start": 42, "stop": 1337}
+
+Addresses within the trace may be any unique string or integer, each one is
+assigned a local account in the order they first appear. The first address
+is assigned accounts[0], the owner of the token. All mints and burns are sent
+from this account.
+
+Each call is first applied to the reference model in scripts/model.py. Calls
+that revert against the model are skipped, so that concurrently submitted
+transactions do not revert depending on the order in which they confirm.
+
+Storage slot counts are estimated from the state of the model, using
+NFTokenMintableModel.storage_slots. They are not read from the contract.
+
+Run with:
+
+    brownie run benchmarks/replay main scripts/benchmarks/traces/example.jsonl
+"""
+
+import json
+from pathlib import Path
+
+from brownie import NFTokenMintable, accounts
+
+from scripts.benchmarks.branches import BranchProfile
+from scripts.model import ModelRevert, NFTokenMintableModel
+
+# percentiles shown in the gas report
+PERCENTILES = (50, 90, 99, 100)
+
+# number of holders shown in the range count report
+TOP_HOLDERS = 10
+
+
+def main(trace, concurrency=1, sample_every=100, profile=False, output=None):
+    """
+    Replays a trace and reports on the gas used and the growth of storage.
+
+    Arguments
+    ---------
+    trace : str
+        Path to the JSONL trace file
+    concurrency : int
+        Maximum number of transactions pending at one time
+    sample_every : int
+        Number of calls between each sample of range counts and estimated storage slots
+    profile : bool
+        If True, also profile the gas used per branch of _transferSingleRange
+    output : str
+        Optional path to save the results, as JSON
+    """
+    concurrency, sample_every = int(concurrency), int(sample_every)
+    calls = load_trace(trace)
+
+    holders = {}
+    owner = accounts[0]
+    nft = owner.deploy(NFTokenMintable, "NFT", "NFT", 0)
+    model = NFTokenMintableModel(owner, 0)
+    branches = BranchProfile(nft.address) if profile else None
+    if branches:
+        branches.add(nft.tx)
+
+    pending = []
+    gas_used = {}
+    samples = []
+    skipped = 0
+
+    for i, call in enumerate(calls, start=1):
+        fn_name, args, sender = _prepare(call, holders, owner)
+        try:
+            getattr(model, _MODEL_METHODS[fn_name])(sender, *args)
+        except ModelRevert:
+            skipped += 1
+        else:
+            tx = getattr(nft, fn_name)(*args, {"from": sender, "required_confs": 0})
+            pending.append((fn_name, tx))
+
+        if len(pending) >= concurrency:
+            _confirm(pending.pop(0), gas_used, branches)
+        if i % sample_every == 0 or i == len(calls):
+            while pending:
+                _confirm(pending.pop(0), gas_used, branches)
+            samples.append(_sample(i, nft, model, holders))
+
+    print(f"Replayed {len(calls)} calls, {skipped} skipped as they would revert\n")
+    report_gas(gas_used)
+    report_growth(samples)
+    if branches:
+        print()
+        branches.histogram()
+
+    if output:
+        with Path(output).open("w") as fp:
+            json.dump({"gas_used": gas_used, "samples": samples}, fp, indent=2)
+
+
+def load_trace(path):
+    """Loads a JSONL trace file, returning a list of calls."""
+    with Path(path).open() as fp:
+        calls = [json.loads(line) for line in fp if line.strip()]
+    for num, call in enumerate(calls, start=1):
+        if call.get("fn") not in _MODEL_METHODS:
+            raise ValueError(f"{path}: line {num} has an unknown fn '{call.get('fn')}'")
+    return calls
+
+
+def percentile(values, pct):
+    """Returns the nearest-rank percentile of a list of values."""
+    values = sorted(values)
+    rank = max(-(-len(values) * pct // 100), 1)
+    return values[rank - 1]
+
+
+def report_gas(gas_used):
+    """Prints gas percentiles for each called method."""
+    header = "".join(f"{'p' + str(i):>10}" for i in PERCENTILES)
+    print(f"{'method':<16}{'calls':>7}{header}")
+    for fn_name, values in sorted(gas_used.items()):
+        row = "".join(f"{percentile(values, i):>10}" for i in PERCENTILES)
+        print(f"{fn_name:<16}{len(values):>7}{row}")
+
+
+def report_growth(samples):
+    """Prints model estimated slot counts over time, and the holders with the most ranges."""
+    print(f"\n{'calls':>7}{'model slots':>14}{'ranges':>10}")
+    for sample in samples:
+        ranges = sum(sample["ranges"].values())
+        print(f"{sample['calls']:>7}{sample['model_slots']:>14}{ranges:>10}")
+
+    final = samples[-1]["ranges"] if samples else {}
+    top = sorted(final, key=lambda k: final[k], reverse=True)[:TOP_HOLDERS]
+    if not top:
+        return
+    print(f"\n{'holder':<44}" + "".join(f"{i['calls']:>8}" for i in samples))
+    for holder in top:
+        print(f"{holder:<44}" + "".join(f"{i['ranges'].get(holder, 0):>8}" for i in samples))
+
+
+# trace method name -> model method name
+_MODEL_METHODS = {
+    "transfer": "transfer",
+    "transferRange": "transfer_range",
+    "mint": "mint",
+    "burn": "burn",
+}
+
+
+def _account(holders, key):
+    # assigns a local account to each address within the trace
+    key = str(key)
+    if key not in holders:
+        idx = len(holders)
+        holders[key] = accounts[idx] if idx < len(accounts) else accounts.add()
+    return holders[key]
+
+
+def _prepare(call, holders, owner):
+    fn_name = call["fn"]
+    if fn_name == "mint":
+        return fn_name, (_account(holders, call["receiver"]), call["amount"]), owner
+    if fn_name == "burn":
+        return fn_name, (call["start"], call["stop"]), owner
+    sender = _account(holders, call["sender"])
+    receiver = _account(holders, call["receiver"])
+    if fn_name == "transfer":
+        return fn_name, (receiver, call["amount"]), sender
+    return fn_name, (receiver, call["start"], call["stop"]), sender
+
+
+def _confirm(item, gas_used, branches):
+    fn_name, tx = item
+    tx.wait(1)
+    gas_used.setdefault(fn_name, []).append(tx.gas_used)
+    if branches:
+        branches.add(tx)
+
+
+def _sample(calls, nft, model, holders):
+    ranges = {}
+    for account in set(holders.values()):
+        count = nft.rangeCountOf(account)
+        assert count == model.range_count_of(account), "Contract and model have diverged"
+        ranges[str(account)] = count
+    return {"calls": calls, "model_slots": model.storage_slots(), "ranges": ranges}
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+
+from brownie import NFTokenScoped, accounts
+
+from scripts.benchmarks import DEFAULT_THRESHOLD, GasRecorder, check
+
+MULTIPLIERS = (2, 4, 8, 16, 32, 64)
+
+SUPPLIES = (10 ** 3, 10 ** 6, 10 ** 9)
+
+# relative positions within a range, used to sample lookup costs
+LOOKUP_OFFSETS = (0, 0.001, 0.25, 0.5, 0.75, 0.999)
+
+
+def main(threshold=DEFAULT_THRESHOLD, update=False):
+    """
+    Measures lookup and write gas for each scoping multiplier, across several
+    total supplies.
+
+    At deployment the supply is split into three equal ranges. "write" is the
+    gas used to transfer a range from inside of the middle range, which sets
+    pointers for three ranges. "lookup" is the highest gas estimate for a
+    `getRange` call when sampling indexes across the first range.
+    """
+    recorder = GasRecorder()
+    for supply in SUPPLIES:
+        for multiplier in MULTIPLIERS:
+            nft = accounts[0].deploy(NFTokenScoped, "NFT", "NFT", supply, multiplier)
+            third = supply // 3
+            nft.transfer(accounts[1], third, {"from": accounts[0]})
+            nft.transfer(accounts[2], third, {"from": accounts[0]})
+
+            lookups = [int(1 + third * i) for i in LOOKUP_OFFSETS]
+            gas_used = max(nft.getRange.estimate_gas(i) for i in lookups)
+            recorder.record_value(f"lookup/supply={supply}/multiplier={multiplier}", gas_used)
+
+            start = third + 1 + third // 4
+            stop = third + 1 + third // 2
+            tx = nft.transferRange(accounts[3], start, stop, {"from": accounts[2]})
+            recorder.record(f"write/supply={supply}/multiplier={multiplier}", tx)
+
+    check(recorder, "scoping", threshold, update)
+
+    print("\nMultiplier with the lowest combined lookup and write cost:")
+    for supply in SUPPLIES:
+        costs = {
+            i: recorder[f"lookup/supply={supply}/multiplier={i}"]
+            + recorder[f"write/supply={supply}/multiplier={i}"]
+            for i in MULTIPLIERS
+        }
+        best = min(costs, key=costs.get)
+        print(f"  supply={supply}: {best} ({costs[best]} gas)")
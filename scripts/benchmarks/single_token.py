@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+
+from brownie import NFToken, accounts
+
+from scripts.benchmarks import DEFAULT_THRESHOLD, GasRecorder, check
+
+# name: (setup transfers, measured transfer) as (sender, receiver, token)
+#
+# Each scenario starts with accounts[1:4] holding a single range of 10000
+# tokens, the same distribution used in the test suite.
+SCENARIOS = {
+    "inside": ([], (2, 4, 12000)),
+    "start/merge=none": ([], (2, 4, 10001)),
+    "start/merge=left": ([], (2, 1, 10001)),
+    "end/merge=right": ([], (2, 3, 20000)),
+    "whole/merge=none": ([(2, 4, 12000)], (4, 5, 12000)),
+    "whole/merge=left": ([(2, 4, 12000), (2, 5, 11999)], (4, 5, 12000)),
+    "whole/merge=both": ([(2, 4, 12000)], (4, 2, 12000)),
+}
+
+
+def main(threshold=DEFAULT_THRESHOLD, update=False):
+    """
+    Compares transferToken against transferRange(_to, _idx, _idx+1) for the
+    same single token transfers.
+    """
+    recorder = GasRecorder()
+    for name, (setup, (sender, receiver, idx)) in SCENARIOS.items():
+        nft = _deploy(setup)
+        tx = nft.transferRange(accounts[receiver], idx, idx + 1, {"from": accounts[sender]})
+        before = recorder.record(f"transferRange/{name}", tx).gas_used
+
+        nft = _deploy(setup)
+        tx = nft.transferToken(accounts[receiver], idx, {"from": accounts[sender]})
+        after = recorder.record(f"transferToken/{name}", tx).gas_used
+        print(f"{name}: transferRange {before}, transferToken {after}, saves {before - after}")
+
+    print()
+    check(recorder, "single_token", threshold, update)
+
+
+def _deploy(setup):
+    nft = accounts[0].deploy(NFToken, "NFT", "NFT", 30000)
+    for i in range(1, 4):
+        nft.transfer(accounts[i], 10000, {"from": accounts[0]})
+    for sender, receiver, idx in setup:
+        nft.transferToken(accounts[receiver], idx, {"from": accounts[sender]})
+    return nft
@@ -2,10 +2,14 @@
 
 from brownie import NFTokenMintable, accounts
 
+from scripts.benchmarks import fragment
+
 
 # adjust the amount and range count to test gas costs for large transfers
+# for a parameterized sweep with baseline tracking, see scripts/benchmarks/gas.py
+# the default scenario is also covered by tests/NFTokenMintable/test_fragmented.py
 def main(amount=65535, ranges=100):
     nft = accounts[0].deploy(NFTokenMintable, "NFT", "NFT", 0)
-    for i in range(ranges * 2):
-        nft.mint(accounts[i % 2], amount, {"from": accounts[0]})
-    nft.transfer(accounts[2], nft.balanceOf(accounts[0]), {"from": accounts[0]})
+    fragment(nft, accounts, ranges, amount)
+    tx = nft.transfer(accounts[2], nft.balanceOf(accounts[0]), {"from": accounts[0]})
+    print(f"Transferred {ranges} ranges of {amount} tokens - gas used: {tx.gas_used}")
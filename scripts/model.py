@@ -0,0 +1,674 @@
+#!/usr/bin/python3
+
+"""
+Pure-Python reference model of NFToken and NFTokenMintable.
+
+The model mirrors the storage layout and logic of the contracts: the range map,
+the scoped `tokens` pointer array, and the balance range arrays (including the
+order of ranges within each array). It can be used to run property-based tests
+far faster than is possible against a local chain, and to verify the contracts
+by replaying the same calls against both and comparing the results.
+
+Calls that would revert raise `ModelRevert`, with the same dev revert string
+that brownie would report. As with a transaction, state is unchanged after a
+revert.
+
+Every state-changing method returns a list of the events that it emitted, as
+tuples of (name, *args) in the same order as the contract.
+"""
+
+import copy
+import functools
+
+MAX_UPPER_BOUND = 2 ** 64 - 2
+SCOPING_MULTIPLIER = 16
+MAX_POSITION = 2 ** 32 - 1
+
+POLICY_FIRST = 0
+POLICY_LARGEST = 1
+POLICY_BEST_FIT = 2
+POLICY_MERGE = 3
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+class ModelRevert(Exception):
+    def __init__(self, revert_msg=None):
+        self.revert_msg = revert_msg
+        super().__init__(revert_msg)
+
+
+class _Balance:
+    def __init__(self):
+        self.balance = 0
+        self.length = 0
+        self.policy = 0
+        self.ranges = {}
+
+
+def _require(condition, revert_msg=None):
+    if not condition:
+        raise ModelRevert(revert_msg)
+
+
+def _add(a, b, bits=64):
+    _require(a + b < 2 ** bits, "dev: overflow")
+    return a + b
+
+
+def _sub(a, b):
+    _require(b <= a, "dev: underflow")
+    return a - b
+
+
+def _set(storage, key, value):
+    # a value of zero is equivalent to deleting the key
+    if value:
+        storage[key] = value
+    else:
+        storage.pop(key, None)
+
+
+def _atomic(fn):
+    # restores the state of the model if a call reverts
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        state = copy.deepcopy(self.__dict__)
+        self._events = []
+        try:
+            fn(self, *args, **kwargs)
+        except ModelRevert:
+            self.__dict__ = state
+            raise
+        return self._events
+
+    return wrapper
+
+
+class NFTokenModel:
+
+    """
+    Model of NFToken.
+
+    Addresses are handled as strings. The deployer receives the initial supply.
+    """
+
+    def __init__(self, deployer, total_supply, scoping_multiplier=SCOPING_MULTIPLIER):
+        self.scoping_multiplier = scoping_multiplier
+        self.total_supply = 0
+        self.upper_bound = 0
+        self.tokens = {}
+        self.range_map = {}
+        self.positions = {}
+        self.balances = {}
+        self.allowed = {}
+        self.swap_approvals = {}
+        self._events = []
+        self._mint_initial_supply(str(deployer), total_supply)
+
+    # view methods
+
+    def allowance(self, owner, spender):
+        return self.allowed.get((str(owner), str(spender)), 0)
+
+    def balance_of(self, owner):
+        return self._balance(owner).balance
+
+    def get_range(self, idx):
+        self._check_bounds(idx)
+        start = self._get_pointer(idx)
+        owner, stop = self._range(start)
+        return owner, start, stop
+
+    def get_ranges(self, idx_list):
+        owners, starts, stops = [], [], []
+        owner, start, stop = ZERO_ADDRESS, 0, 0
+        for idx in idx_list:
+            if idx < start or idx >= stop:
+                owner, start, stop = self.get_range(idx)
+            owners.append(owner)
+            starts.append(start)
+            stops.append(stop)
+        return owners, starts, stops
+
+    def ranges_of(self, owner):
+        return self.ranges_of_paginated(owner, 0, self.range_count_of(owner))
+
+    def transfer_policy_of(self, owner):
+        return self._balance(owner).policy
+
+    def range_count_of(self, owner):
+        return self._balance(owner).length
+
+    def ranges_of_paginated(self, owner, offset, limit):
+        b = self._balance(owner)
+        count = min(max(b.length - offset, 0), limit)
+        starts = [b.ranges.get(offset + i, 0) for i in range(count)]
+        return [(i, self._range(i)[1]) for i in starts]
+
+    def swap_approved(self, owner, counterparty, start, stop, counter_start, counter_stop):
+        key = (str(owner), str(counterparty), start, stop, counter_start, counter_stop)
+        return self.swap_approvals.get(key, False)
+
+    def storage_slots(self):
+        """Returns the number of non-zero storage slots used by the model."""
+        # Range.position shares a slot with the range owner and stop
+        slots = len(self.tokens) + len(self.range_map.keys() | self.positions.keys())
+        slots += len(self.allowed)
+        slots += len(self.swap_approvals)
+        slots += len([i for i in (self.total_supply, self.upper_bound) if i])
+        for b in self.balances.values():
+            slots += bool(b.balance or b.length or b.policy)
+            slots += len(set(i // 4 for i in b.ranges))
+        return slots
+
+    # state-changing methods
+
+    @_atomic
+    def approve(self, sender, spender, value):
+        _set(self.allowed, (str(sender), str(spender)), value)
+        self._emit("Approval", str(sender), str(spender), value)
+
+    @_atomic
+    def transfer(self, sender, to, value):
+        self._transfer(str(sender), str(to), value, self.transfer_policy_of(sender))
+
+    @_atomic
+    def set_transfer_policy(self, sender, policy):
+        _require(policy <= POLICY_MERGE, "dev: invalid policy")
+        self._balance(sender).policy = policy
+
+    @_atomic
+    def transfer_with_policy(self, sender, to, value, policy):
+        _require(policy <= POLICY_MERGE, "dev: invalid policy")
+        self._transfer(str(sender), str(to), value, policy)
+
+    @_atomic
+    def transfer_from(self, sender, from_, to, value):
+        key = (str(from_), str(sender))
+        _set(self.allowed, key, _sub(self.allowed.get(key, 0), value))
+        self._transfer(str(from_), str(to), value, self.transfer_policy_of(from_))
+
+    @_atomic
+    def transfer_range(self, sender, to, start, stop):
+        sender, to = str(sender), str(to)
+        pointer = self._check_range(sender, start, stop)
+        value = _sub(stop, start)
+        self._balance(sender).balance = _sub(self.balance_of(sender), value)
+        self._balance(to).balance = _add(self.balance_of(to), value)
+        self._emit("Transfer", sender, to, value)
+        if sender != to and value > 0:
+            self._transfer_single_range(pointer, sender, to, start, stop)
+
+    @_atomic
+    def transfer_token(self, sender, to, idx):
+        sender, to = str(sender), str(to)
+        self._check_bounds(idx)
+        pointer = self._get_pointer(idx)
+        _require(sender == self._range(pointer)[0], "dev: sender does not own")
+        self._balance(sender).balance -= 1
+        self._balance(to).balance = _add(self.balance_of(to), 1)
+        self._emit("Transfer", sender, to, 1)
+        if sender != to:
+            self._transfer_single_range(pointer, sender, to, idx, idx + 1)
+
+    @_atomic
+    def transfer_ranges(self, sender, to, ranges):
+        sender, to = str(sender), str(to)
+        value = 0
+        for start, stop in ranges:
+            pointer = self._check_range(sender, start, stop)
+            value = _add(value, stop - start)
+            if sender != to:
+                self._transfer_single_range(pointer, sender, to, start, stop)
+        self._balance(sender).balance = _sub(self.balance_of(sender), value)
+        self._balance(to).balance = _add(self.balance_of(to), value)
+        self._emit("Transfer", sender, to, value)
+
+    @_atomic
+    def transfer_many(self, sender, to_list, values):
+        sender, to_list = str(sender), [str(i) for i in to_list]
+        _require(len(to_list) == len(values), "dev: length mismatch")
+        total = 0
+        for value in values:
+            _require(value <= MAX_UPPER_BOUND, "dev: uint64 overflow")
+            total = _add(total, value)
+        self._balance(sender).balance = _sub(self.balance_of(sender), total)
+        policy = self.transfer_policy_of(sender)
+        for to, value in zip(to_list, values):
+            self._balance(to).balance = _add(self.balance_of(to), value)
+            self._emit("Transfer", sender, to, value)
+            if sender != to and value > 0:
+                self._transfer_value(sender, to, value, policy)
+
+    @_atomic
+    def transfer_range_many(self, sender, to_list, ranges):
+        sender, to_list = str(sender), [str(i) for i in to_list]
+        _require(len(to_list) == len(ranges), "dev: length mismatch")
+        total = 0
+        for to, (start, stop) in zip(to_list, ranges):
+            pointer = self._check_range(sender, start, stop)
+            total = _add(total, stop - start)
+            self._balance(to).balance = _add(self.balance_of(to), stop - start)
+            self._emit("Transfer", sender, to, stop - start)
+            if sender != to:
+                self._transfer_single_range(pointer, sender, to, start, stop)
+        self._balance(sender).balance = _sub(self.balance_of(sender), total)
+
+    @_atomic
+    def approve_swap(
+        self, sender, counterparty, start, stop, counter_start, counter_stop, approved
+    ):
+        sender, counterparty = str(sender), str(counterparty)
+        key = (sender, counterparty, start, stop, counter_start, counter_stop)
+        _set(self.swap_approvals, key, approved)
+        self._emit(
+            "SwapApproval", sender, counterparty, start, stop, counter_start, counter_stop, approved
+        )
+
+    @_atomic
+    def swap_ranges(self, sender, counterparty, start, stop, counter_start, counter_stop):
+        sender, counterparty = str(sender), str(counterparty)
+        _require(sender != counterparty, "dev: swap with self")
+        _require(_sub(stop, start) == _sub(counter_stop, counter_start), "dev: unequal ranges")
+        key = (counterparty, sender, counter_start, counter_stop, start, stop)
+        _require(self.swap_approvals.get(key), "dev: swap not approved")
+        del self.swap_approvals[key]
+
+        self._check_range(counterparty, counter_start, counter_stop)
+        pointer = self._check_range(sender, start, stop)
+        self._emit("Transfer", sender, counterparty, stop - start)
+        self._transfer_single_range(pointer, sender, counterparty, start, stop)
+
+        pointer = self._get_pointer(counter_stop - 1)
+        self._emit("Transfer", counterparty, sender, stop - start)
+        self._transfer_single_range(pointer, counterparty, sender, counter_start, counter_stop)
+
+    # internal methods
+
+    def _emit(self, name, *args):
+        self._events.append((name,) + args)
+
+    def _balance(self, owner):
+        owner = str(owner)
+        if owner not in self.balances:
+            self.balances[owner] = _Balance()
+        return self.balances[owner]
+
+    def _range(self, pointer):
+        return self.range_map.get(pointer, (ZERO_ADDRESS, 0))
+
+    def _set_range_values(self, pointer, owner=None, stop=None):
+        # modifies a Range struct, deleting it if all values are zero
+        current = self._range(pointer)
+        owner = current[0] if owner is None else owner
+        stop = current[1] if stop is None else stop
+        if owner == ZERO_ADDRESS and stop == 0:
+            self.range_map.pop(pointer, None)
+        else:
+            self.range_map[pointer] = (owner, stop)
+
+    def _delete_range(self, pointer):
+        self.range_map.pop(pointer, None)
+        self.positions.pop(pointer, None)
+
+    def _mint_initial_supply(self, deployer, total_supply):
+        _require(total_supply <= MAX_UPPER_BOUND)
+        if total_supply == 0:
+            return
+        self._set_range(1, deployer, total_supply + 1)
+        self._balance(deployer).balance = total_supply
+        self._replace_in_balance_range(deployer, 0, 1)
+        self.total_supply = total_supply
+        self.upper_bound = total_supply
+        self._emit("Transfer", ZERO_ADDRESS, deployer, total_supply)
+        self._emit("TransferRange", ZERO_ADDRESS, deployer, 1, total_supply + 1, total_supply)
+
+    def _check_bounds(self, idx):
+        _require(idx != 0 and idx <= self.upper_bound, "dev: index out of bounds")
+
+    def _check_range(self, sender, start, stop):
+        self._check_bounds(start)
+        self._check_bounds(_sub(stop, 1))
+        _require(start < stop, "dev: stop < start")
+        pointer = self._get_pointer(stop - 1)
+        _require(pointer <= start, "dev: multiple ranges")
+        _require(sender == self._range(pointer)[0], "dev: sender does not own")
+        return pointer
+
+    def _transfer(self, from_, to, value, policy):
+        _require(value <= MAX_UPPER_BOUND, "dev: uint64 overflow")
+        self._balance(from_).balance = _sub(self.balance_of(from_), value)
+        self._balance(to).balance = _add(self.balance_of(to), value)
+        self._emit("Transfer", from_, to, value)
+        if from_ == to or value == 0:
+            return
+        self._transfer_value(from_, to, value, policy)
+
+    def _transfer_value(self, from_, to, value, policy):
+        b = self._balance(from_)
+        while b.length > 0:
+            pointer = b.ranges.get(0, 0)
+            if policy != POLICY_FIRST:
+                pointer = self._select_range(b, to, value, policy)
+            start = pointer
+            stop = self._range(pointer)[1]
+            amount = _sub(stop, start)
+            if value < amount:
+                if policy == POLICY_MERGE and self._range(stop)[0] == to:
+                    start = _sub(stop, value)
+                else:
+                    stop = _sub(stop, amount - value)
+                value = 0
+            else:
+                value = _sub(value, amount)
+            self._transfer_single_range(pointer, from_, to, start, stop)
+            if value == 0:
+                return
+        raise ModelRevert("dev: unreachable")
+
+    def _select_range(self, b, to, value, policy):
+        starts = [b.ranges.get(i, 0) for i in range(b.length)]
+        if policy == POLICY_MERGE:
+            for start in starts:
+                prev = self.tokens.get(start - 1, 0)
+                if to in (self._range(prev)[0], self._range(self._range(start)[1])[0]):
+                    return start
+            return starts[0]
+
+        best = starts[0]
+        best_size = self._range(best)[1] - best
+        for start in starts[1:]:
+            size = self._range(start)[1] - start
+            if policy == POLICY_LARGEST or best_size < value:
+                if size <= best_size:
+                    continue
+            elif size < value or size >= best_size:
+                continue
+            best, best_size = start, size
+        return best
+
+    def _transfer_single_range(self, pointer, from_, to, start, stop):
+        range_stop = self._range(pointer)[1]
+        prev = self.tokens.get(_sub(start, 1), 0)
+        self._emit("TransferRange", from_, to, start, stop, stop - start)
+
+        if pointer == start:
+            # entire range is being transferred
+            if range_stop == stop:
+                self._replace_in_balance_range(from_, start, 0)
+                left = self._range(prev)[0] == to
+                right = self._range(stop)[0] == to
+                # no merges with surrounding ranges
+                if not left and not right:
+                    self._replace_in_balance_range(to, 0, start)
+                    self._set_range_values(pointer, owner=to)
+                    return
+                self._set_range_pointers(pointer, stop, 0)
+                # merging with previous range
+                if not right:
+                    self._delete_range(pointer)
+                    self._set_range_pointers(prev, start, 0)
+                    self._set_range_values(prev, stop=stop)
+                    self._set_range_pointers(prev, stop, prev)
+                    return
+                # merging with next range
+                if not left:
+                    self._replace_in_balance_range(to, stop, start)
+                    self._set_range(pointer, to, self._range(stop)[1])
+                    self._delete_range(stop)
+                    return
+                # merging with both ranges
+                self._replace_in_balance_range(to, stop, 0)
+                self._delete_range(pointer)
+                self._set_range_values(prev, stop=self._range(stop)[1])
+                self._set_range_pointers(prev, start, 0)
+                self._set_range_pointers(stop, self._range(stop)[1], 0)
+                self._set_range_pointers(prev, self._range(prev)[1], prev)
+                self._delete_range(stop)
+                return
+
+            # range to transfer starts at beginning of existing range
+            self._set_range_pointers(start, range_stop, 0)
+            self._set_range(stop, from_, range_stop)
+            self._replace_in_balance_range(from_, start, stop)
+            self._delete_range(pointer)
+
+            # merging with previous range
+            if self._range(prev)[0] == to:
+                self._set_range_pointers(prev, start, 0)
+                start = prev
+            else:
+                self._replace_in_balance_range(to, 0, start)
+            self._set_range(start, to, stop)
+            return
+
+        # shared logic - inside / ends at end
+        self._set_range_pointers(pointer, range_stop, 0)
+        self._set_range_values(pointer, stop=start)
+        self._set_range_pointers(pointer, start, pointer)
+
+        # range to transfer ends at end of existing range
+        if range_stop == stop:
+            # merging with next range
+            if self._range(stop)[0] == to:
+                self._replace_in_balance_range(to, stop, start)
+                self._set_range_pointers(stop, self._range(stop)[1], 0)
+                next_ = self._range(stop)[1]
+                self._delete_range(stop)
+                stop = next_
+            else:
+                self._replace_in_balance_range(to, 0, start)
+            self._set_range(start, to, stop)
+            return
+
+        # range to transfer is inside the existing range
+        self._replace_in_balance_range(to, 0, start)
+        self._set_range(start, to, stop)
+        self._replace_in_balance_range(from_, 0, stop)
+        self._set_range(stop, from_, range_stop)
+
+    def _set_range(self, pointer, owner, stop):
+        self._set_range_values(pointer, owner, stop)
+        self._set_range_pointers(pointer, stop, pointer)
+
+    def _replace_in_balance_range(self, addr, old, new):
+        b = self._balance(addr)
+        if old == 0:
+            _require(b.length < MAX_POSITION, "dev: range limit")
+            _set(b.ranges, b.length, new)
+            b.length = _add(b.length, 1)
+            _set(self.positions, new, b.length)
+            return
+        i = self.positions.get(old, 0)
+        _require(i != 0, "dev: range not in balance")
+        if new > 0:
+            _set(b.ranges, i - 1, new)
+            _set(self.positions, new, i)
+            return
+        b.length = _sub(b.length, 1)
+        if i <= b.length:
+            last = b.ranges.get(b.length, 0)
+            _set(b.ranges, i - 1, last)
+            _set(self.positions, last, i)
+        if b.length % 4 == 0:
+            for j in range(b.length, b.length + 4):
+                b.ranges.pop(j, None)
+
+    def _set_range_pointers(self, start, stop, value):
+        stop = _sub(stop, 1)
+        if start == stop:
+            _set(self.tokens, start, value)
+            return
+        _set(self.tokens, stop, value)
+        multiplier = self.scoping_multiplier
+        interval = multiplier
+        while True:
+            if stop < interval:
+                return
+            i = stop // interval * interval
+            interval *= multiplier
+            if i % interval == 0:
+                continue
+            if i >= start:
+                _set(self.tokens, i, value)
+
+    def _get_pointer(self, idx):
+        multiplier = self.scoping_multiplier
+        increment = 1
+        while True:
+            if self.tokens.get(idx):
+                return self.tokens[idx]
+            if idx % (increment * multiplier) == 0:
+                increment *= multiplier
+                _require(idx <= self.upper_bound, "dev: exceeds upper bound")
+            idx += increment
+
+
+class NFTokenMintableModel(NFTokenModel):
+
+    """
+    Model of NFTokenMintable.
+
+    The deployer is the owner, and is the only address that may mint or burn.
+    """
+
+    def __init__(self, deployer, total_supply, scoping_multiplier=SCOPING_MULTIPLIER):
+        super().__init__(deployer, total_supply, scoping_multiplier)
+        self.owner = str(deployer)
+
+    @_atomic
+    def mint(self, sender, target, value):
+        _require(str(sender) == self.owner, "dev: only owner")
+        self._mint(str(target), value)
+
+    @_atomic
+    def mint_batch(self, sender, targets, values):
+        _require(str(sender) == self.owner, "dev: only owner")
+        _require(len(targets) == len(values), "dev: length mismatch")
+        targets = [str(i) for i in targets]
+        upper_bound = self.upper_bound
+        start = upper_bound + 1
+        for i, (target, value) in enumerate(zip(targets, values)):
+            _require(value > 0, "dev: mint 0")
+            _require(_add(upper_bound, value) <= MAX_UPPER_BOUND, "dev: upper bound")
+            stop = upper_bound + 1 + value
+            self._emit("Transfer", ZERO_ADDRESS, target, value)
+            self._emit("TransferRange", ZERO_ADDRESS, target, upper_bound + 1, stop, value)
+            upper_bound = stop - 1
+            if i + 1 == len(targets) or targets[i + 1] != target:
+                self._set_minted_range(target, start, stop)
+                start = stop
+        self.total_supply = _add(self.total_supply, upper_bound - self.upper_bound, 256)
+        self.upper_bound = upper_bound
+
+    @_atomic
+    def burn(self, sender, start, stop):
+        _require(str(sender) == self.owner, "dev: only owner")
+        self._burn(start, stop)
+
+    @_atomic
+    def burn_ranges(self, sender, ranges):
+        _require(str(sender) == self.owner, "dev: only owner")
+        _require(len(ranges) > 0, "dev: burn 0")
+        self._burn_ranges(ranges)
+
+    @_atomic
+    def burn_amount(self, sender, value):
+        _require(str(sender) == self.owner, "dev: only owner")
+        _require(value > 0, "dev: burn 0")
+        b = self._balance(self.owner)
+        b.balance = _sub(b.balance, value)
+        self.total_supply = _sub(self.total_supply, value)
+        self._emit("Transfer", self.owner, ZERO_ADDRESS, value)
+        remaining = value
+        while remaining > 0:
+            start = b.ranges[0]
+            stop = min(self._range(start)[1], start + remaining)
+            remaining -= stop - start
+            self._burn_range(start, start, stop)
+
+    def _mint(self, target, value):
+        _require(value > 0, "dev: mint 0")
+        _require(_add(self.upper_bound, value) <= MAX_UPPER_BOUND, "dev: upper bound")
+        start = self.upper_bound + 1
+        stop = start + value
+        self._set_minted_range(target, start, stop)
+        self.total_supply = _add(self.total_supply, value, 256)
+        self.upper_bound = _add(self.upper_bound, value)
+        self._emit("Transfer", ZERO_ADDRESS, target, value)
+        self._emit("TransferRange", ZERO_ADDRESS, target, start, stop, value)
+
+    def _set_minted_range(self, target, start, stop):
+        pointer = self.tokens.get(start - 1, 0)
+        if self._range(pointer)[0] == target:
+            # merge with previous range
+            self._set_range_pointers(pointer, start, 0)
+            self._set_range_values(pointer, stop=stop)
+            self._set_range_pointers(pointer, stop, pointer)
+        else:
+            # create new range
+            self._set_range(start, target, stop)
+            self._replace_in_balance_range(target, 0, start)
+        self._balance(target).balance = _add(self.balance_of(target), stop - start)
+
+    def _burn(self, start, stop):
+        pointer = self._check_burn(start, stop)
+        value = stop - start
+        self.total_supply = _sub(self.total_supply, value)
+        self._balance(self.owner).balance = _sub(self.balance_of(self.owner), value)
+        self._emit("Transfer", self.owner, ZERO_ADDRESS, value)
+        self._burn_range(pointer, start, stop)
+
+    def _burn_ranges(self, ranges):
+        value = 0
+        # Transfer is emitted ahead of the TransferRange events, once the total is known
+        idx = len(self._events)
+        for start, stop in ranges:
+            self._burn_range(self._check_burn(start, stop), start, stop)
+            value = _add(value, stop - start)
+        self.total_supply = _sub(self.total_supply, value)
+        self._balance(self.owner).balance = _sub(self.balance_of(self.owner), value)
+        self._events.insert(idx, ("Transfer", self.owner, ZERO_ADDRESS, value))
+        return value
+
+    def _check_burn(self, start, stop):
+        _require(stop > start, "dev: burn 0")
+        pointer = self._get_pointer(stop - 1)
+        _require(pointer <= start, "dev: multiple ranges")
+        _require(self._range(pointer)[0] == self.owner, "dev: only owner tokens")
+        return pointer
+
+    def _burn_range(self, pointer, start, stop):
+        if self._range(pointer)[1] > stop:
+            self._split_range(pointer, stop)
+        if pointer < start:
+            self._split_range(pointer, start)
+        self._replace_in_balance_range(self.owner, start, 0)
+        self.positions.pop(start, None)
+        self._emit("TransferRange", self.owner, ZERO_ADDRESS, start, stop, stop - start)
+
+        # merge with adjacent burned ranges
+        prev = self.tokens.get(start - 1, 0)
+        left = prev != 0 and self._range(prev)[0] == ZERO_ADDRESS
+        right = stop <= self.upper_bound and self._range(stop)[0] == ZERO_ADDRESS
+        if not left and not right:
+            self._set_range_values(start, owner=ZERO_ADDRESS)
+            return
+        self._set_range_pointers(start, stop, 0)
+        if right:
+            next_ = self._range(stop)[1]
+            self._delete_range(stop)
+            stop = next_
+        if left:
+            self._delete_range(start)
+            self._set_range_pointers(prev, start, 0)
+            start = prev
+        self._set_range(start, ZERO_ADDRESS, stop)
+
+    def _split_range(self, pointer, split):
+        owner, stop = self._range(pointer)
+        self._set_range_values(pointer, stop=split)
+        self._replace_in_balance_range(owner, 0, split)
+        self._set_range_pointers(pointer, stop, 0)
+        self._set_range_pointers(pointer, split, pointer)
+        self._set_range(split, owner, stop)
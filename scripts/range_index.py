@@ -0,0 +1,282 @@
+#!/usr/bin/python3
+
+"""
+Off-chain index of NFToken range ownership, built from TransferRange events,
+or the packed TransferRanges events emitted by NFTokenCompactEvents.
+
+The index mirrors the range boundaries held by the contract, so that token
+lookups and range enumeration can be performed locally instead of via RPC.
+It is updated incrementally - after an initial sync, only events emitted since
+the last processed block are fetched.
+
+Example usage:
+
+    >>> from scripts.range_index import RangeIndex
+    >>> index = RangeIndex(nft.address)
+    >>> index.sync()
+    >>> index.get_range(31337)
+    ('0xf414d65808f5f59aE156E51B97f98094888e7d92', 30000, 35001)
+    >>> index.save("index.json")
+
+    # later
+    >>> index = RangeIndex.load("index.json")
+    >>> index.sync()
+
+Ranges belonging to the zero address (burned tokens) are merged in the same
+way as the contract, so range boundaries always match those stored on chain.
+"""
+
+import bisect
+import json
+from pathlib import Path
+
+from brownie import web3
+from eth_utils import keccak, to_checksum_address
+from hexbytes import HexBytes
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+TRANSFER_RANGE_TOPIC = HexBytes(
+    keccak(text="TransferRange(address,address,uint256,uint256,uint256)")
+)
+TRANSFER_RANGES_TOPIC = HexBytes(keccak(text="TransferRanges(address,address,uint128[])"))
+
+# maximum number of blocks to request logs for in a single call
+BLOCK_STEP = 10000
+
+# number of ranges fetched in each call to rangesOfPaginated
+PAGE_SIZE = 100
+
+
+class RangeIndex:
+
+    """
+    Sorted interval index of token ranges.
+
+    Point lookups use a binary search over the sorted range starts. Ranges
+    held by each address and balances are tracked separately, so that they
+    may be queried without iterating the entire index.
+
+    Attributes
+    ----------
+    address : str
+        Address of the indexed NFToken contract
+    block : int
+        Number of the last block that has been applied to the index
+    """
+
+    def __init__(self, address=None, block=-1):
+        self.address = _checksum(address) if address else None
+        self.block = block
+        self._starts = []
+        self._ranges = {}
+        self._owned = {}
+        self._balances = {}
+
+    def __len__(self):
+        return len(self._starts)
+
+    def get_range(self, idx):
+        """Returns (owner, start, stop) for the range containing token `idx`."""
+        i = bisect.bisect_right(self._starts, idx) - 1
+        if i < 0:
+            raise IndexError(f"Token {idx} is out of bounds")
+        start = self._starts[i]
+        stop, owner = self._ranges[start]
+        if idx >= stop:
+            raise IndexError(f"Token {idx} is out of bounds")
+        return owner, start, stop
+
+    def owner_of(self, idx):
+        """Returns the owner of token `idx`."""
+        return self.get_range(idx)[0]
+
+    def ranges_of(self, owner):
+        """Returns a sorted list of (start, stop) for each range held by `owner`."""
+        starts = sorted(self._owned.get(_checksum(owner), ()))
+        return [(i, self._ranges[i][0]) for i in starts]
+
+    def balance_of(self, owner):
+        """Returns the number of tokens held by `owner`."""
+        return self._balances.get(_checksum(owner), 0)
+
+    def ranges(self):
+        """Returns a sorted list of (start, stop, owner) for every range."""
+        return [(i, *self._ranges[i]) for i in self._starts]
+
+    def apply(self, from_, to, start, stop):
+        """
+        Applies a single TransferRange event to the index.
+
+        Arguments
+        ---------
+        from_ : str
+            Sender address, or the zero address if the tokens were minted
+        to : str
+            Receiver address
+        start : int
+            Start index of the transferred range
+        stop : int
+            Stop index of the transferred range
+        """
+        from_ = _checksum(from_)
+        to = _checksum(to)
+        if from_ != ZERO_ADDRESS:
+            for range_start, range_stop, owner in self._remove(start, stop):
+                if owner != from_:
+                    raise ValueError(
+                        f"Range {range_start}:{range_stop} is owned by {owner}, not {from_}"
+                    )
+        self._insert(start, stop, to)
+
+    def sync(self, to_block=None):
+        """
+        Fetches and applies all TransferRange and TransferRanges events
+        emitted since the last processed block.
+
+        Arguments
+        ---------
+        to_block : int, optional
+            Last block to process. Defaults to the latest block.
+        """
+        if to_block is None:
+            to_block = _block_number()
+        while self.block < to_block:
+            end = min(self.block + BLOCK_STEP, to_block)
+            logs = _get_logs(
+                {
+                    "address": self.address,
+                    "fromBlock": self.block + 1,
+                    "toBlock": end,
+                    "topics": [[TRANSFER_RANGE_TOPIC, TRANSFER_RANGES_TOPIC]],
+                }
+            )
+            for log in sorted(logs, key=lambda k: (k["blockNumber"], k["logIndex"])):
+                if HexBytes(log["topics"][0]) == TRANSFER_RANGES_TOPIC:
+                    for args in decode_transfer_ranges(log):
+                        self.apply(*args)
+                else:
+                    self.apply(*decode_transfer_range(log))
+            self.block = end
+
+    def save(self, path):
+        """Saves the index and the last processed block to a JSON file."""
+        data = {"address": self.address, "block": self.block, "ranges": self.ranges()}
+        with Path(path).open("w") as fp:
+            json.dump(data, fp)
+
+    @classmethod
+    def load(cls, path):
+        """Loads an index that was previously saved with `save`."""
+        with Path(path).open() as fp:
+            data = json.load(fp)
+        index = cls(data["address"], data["block"])
+        for start, stop, owner in data["ranges"]:
+            index._insert(start, stop, owner, merge=False)
+        return index
+
+    def _split(self, idx):
+        # ensure that a range begins at idx, if idx falls within an existing range
+        i = bisect.bisect_right(self._starts, idx) - 1
+        if i < 0 or self._starts[i] == idx:
+            return
+        start = self._starts[i]
+        stop, owner = self._ranges[start]
+        if idx >= stop:
+            return
+        self._ranges[start] = (idx, owner)
+        self._starts.insert(i + 1, idx)
+        self._ranges[idx] = (stop, owner)
+        self._owned[owner].add(idx)
+
+    def _remove(self, start, stop):
+        # remove all ranges between start and stop, returning the removed ranges
+        self._split(start)
+        self._split(stop)
+        lo = bisect.bisect_left(self._starts, start)
+        hi = bisect.bisect_left(self._starts, stop)
+        removed = []
+        for range_start in self._starts[lo:hi]:
+            range_stop, owner = self._ranges.pop(range_start)
+            self._owned[owner].discard(range_start)
+            self._balances[owner] -= range_stop - range_start
+            removed.append((range_start, range_stop, owner))
+        del self._starts[lo:hi]
+        if sum(i[1] - i[0] for i in removed) != stop - start:
+            raise ValueError(f"Range {start}:{stop} is not fully contained in the index")
+        return removed
+
+    def _insert(self, start, stop, owner, merge=True):
+        # add a new range, merging with adjacent ranges of the same owner
+        self._balances[owner] = self._balances.get(owner, 0) + stop - start
+        owned = self._owned.setdefault(owner, set())
+        i = bisect.bisect_left(self._starts, start)
+        if merge:
+            if i > 0 and self._ranges[self._starts[i - 1]] == (start, owner):
+                # merge with the previous range
+                i -= 1
+                owned.discard(self._starts[i])
+                start = self._starts.pop(i)
+            if i < len(self._starts) and self._starts[i] == stop and stop in owned:
+                # merge with the next range
+                owned.discard(stop)
+                self._starts.pop(i)
+                stop = self._ranges.pop(stop)[0]
+        self._starts.insert(i, start)
+        self._ranges[start] = (stop, owner)
+        owned.add(start)
+
+
+def decode_transfer_range(log):
+    """Decodes a raw TransferRange log into (from, to, start, stop)."""
+    topics = [HexBytes(i) for i in log["topics"]]
+    data = HexBytes(log["data"])
+    from_ = to_checksum_address(topics[1][-20:])
+    to = to_checksum_address(topics[2][-20:])
+    start = int.from_bytes(data[:32], "big")
+    stop = int.from_bytes(data[32:64], "big")
+    return from_, to, start, stop
+
+
+def decode_transfer_ranges(log):
+    """Decodes a raw TransferRanges log into a list of (from, to, start, stop)."""
+    topics = [HexBytes(i) for i in log["topics"]]
+    data = HexBytes(log["data"])
+    from_ = to_checksum_address(topics[1][-20:])
+    to = to_checksum_address(topics[2][-20:])
+    # data holds the array offset and length, followed by one word per range
+    length = int.from_bytes(data[32:64], "big")
+    words = (data[64 + i * 32 : 96 + i * 32] for i in range(length))
+    return [(from_, to, *unpack_range(int.from_bytes(i, "big"))) for i in words]
+
+
+def unpack_range(value):
+    """Unpacks a TransferRanges array item into (start, stop)."""
+    return value >> 64, value & (2 ** 64 - 1)
+
+
+def fetch_ranges(nft, owner, page_size=PAGE_SIZE):
+    """Fetches every range held by `owner` from the contract, using rangesOfPaginated."""
+    ranges = []
+    for offset in range(0, nft.rangeCountOf(owner), page_size):
+        ranges.extend(nft.rangesOfPaginated(owner, offset, page_size))
+    return ranges
+
+
+def _checksum(address):
+    return to_checksum_address(str(address))
+
+
+# web3 v6 removed the camel case methods used by earlier versions
+
+
+def _block_number():
+    if hasattr(web3.eth, "block_number"):
+        return web3.eth.block_number
+    return web3.eth.blockNumber
+
+
+def _get_logs(filter_params):
+    if hasattr(web3.eth, "get_logs"):
+        return web3.eth.get_logs(filter_params)
+    return web3.eth.getLogs(filter_params)
@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+
+"""
+Merkle proofs of range ownership for NFTokenMerkle.
+
+Builds the same sparse Merkle tree that NFTokenMerkle maintains on chain, from
+the ranges held in an off-chain `RangeIndex`. Proofs can be verified against
+`merkleRoot` without access to a node that serves `getRange`.
+
+Example usage:
+
+    >>> from scripts.range_index import RangeIndex
+    >>> from scripts.range_proof import RangeTree, verify_range
+    >>> index = RangeIndex(nft.address)
+    >>> index.sync()
+    >>> tree = RangeTree.from_index(index)
+    >>> tree.root == nft.merkleRoot()
+    True
+    >>> owner, start, stop, proof = tree.prove_token(index, 31337)
+    >>> verify_range(tree.root, owner, start, stop, proof)
+    True
+"""
+
+from eth_utils import keccak, to_canonical_address
+
+TREE_DEPTH = 64
+EMPTY = b"\x00" * 32
+
+
+class RangeTree:
+
+    """
+    Sparse Merkle tree of depth 64, keyed by range start.
+
+    Only non-empty nodes are stored. A node with two empty children is itself
+    empty, matching NFTokenMerkle.
+    """
+
+    def __init__(self, ranges=()):
+        level = {start: leaf_hash(start, stop, owner) for start, stop, owner in ranges}
+        self._levels = [level]
+        for _ in range(TREE_DEPTH):
+            level = {
+                i: hash_nodes(level.get(i * 2, EMPTY), level.get(i * 2 + 1, EMPTY))
+                for i in set(x >> 1 for x in level)
+            }
+            self._levels.append(level)
+
+    @classmethod
+    def from_index(cls, index):
+        """Builds a tree from the ranges held in a `RangeIndex`."""
+        return cls(index.ranges())
+
+    @property
+    def root(self):
+        return self._levels[-1].get(0, EMPTY)
+
+    def prove(self, start):
+        """Returns the sibling hashes for the leaf at `start`, from the leaf level up."""
+        if start not in self._levels[0]:
+            raise KeyError(f"No range begins at {start}")
+        return [self._levels[i].get((start >> i) ^ 1, EMPTY) for i in range(TREE_DEPTH)]
+
+    def prove_token(self, index, idx):
+        """Returns (owner, start, stop, proof) for the range in `index` holding token `idx`."""
+        owner, start, stop = index.get_range(idx)
+        return owner, start, stop, self.prove(start)
+
+
+def leaf_hash(start, stop, owner):
+    """Returns the leaf for a range, keccak256(abi.encodePacked(start, stop, owner))."""
+    return keccak(start.to_bytes(8, "big") + stop.to_bytes(8, "big") + to_canonical_address(owner))
+
+
+def hash_nodes(left, right):
+    if left == EMPTY and right == EMPTY:
+        return EMPTY
+    return keccak(left + right)
+
+
+def verify_range(root, owner, start, stop, proof):
+    """Verifies that `owner` holds the range `start:stop` in the tree with `root`."""
+    node = leaf_hash(start, stop, owner)
+    for i, sibling in enumerate(proof):
+        node = hash_nodes(sibling, node) if (start >> i) & 1 else hash_nodes(node, sibling)
+    return len(proof) == TREE_DEPTH and node == bytes(root)
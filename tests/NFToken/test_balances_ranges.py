@@ -110,3 +110,19 @@ def test_split(transfer, accounts, nft, skip_coverage):
         transfer(1, i, nft.balanceOf(accounts[1]) // 2)
     for i in range(1, 5):
         transfer(i, 6, nft.balanceOf(accounts[i]))
+
+
+def test_remove_from_middle(nft, accounts):
+    """remove ranges from the middle of the balance range array"""
+    for i in range(4):
+        nft.transfer(accounts[1], 10, {"from": accounts[0]})
+        nft.transfer(accounts[2], 10, {"from": accounts[0]})
+    nft.transferRange(accounts[3], 21, 31, {"from": accounts[1]})
+    assert set(nft.rangesOf(accounts[1])) == {(1, 11), (41, 51), (61, 71)}
+    nft.transferRange(accounts[3], 1, 11, {"from": accounts[1]})
+    nft.transferRange(accounts[3], 45, 50, {"from": accounts[1]})
+    assert set(nft.rangesOf(accounts[1])) == {(41, 45), (50, 51), (61, 71)}
+    nft.transfer(accounts[3], 15, {"from": accounts[1]})
+    assert nft.balanceOf(accounts[1]) == 0
+    assert nft.rangesOf(accounts[1]) == ()
+    assert nft.balanceOf(accounts[3]) == 40
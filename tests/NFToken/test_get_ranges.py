@@ -0,0 +1,34 @@
+#!/usr/bin/python3
+
+import brownie
+
+
+def test_get_ranges(accounts, nft):
+    """sorted indexes"""
+    idx = [1, 2, 10000, 10001, 15000, 20000, 20001, 30000]
+    owners, starts, stops = nft.getRanges(idx)
+    assert len(owners) == len(idx)
+    for i, value in enumerate(idx):
+        assert (owners[i], starts[i], stops[i]) == nft.getRange(value)
+
+
+def test_unsorted(accounts, nft):
+    """unsorted indexes, including repeated values"""
+    nft.transferRange(accounts[4], 12000, 13000, {"from": accounts[2]})
+    idx = [30000, 12000, 1, 12999, 12999, 13000, 11999, 5]
+    owners, starts, stops = nft.getRanges(idx)
+    for i, value in enumerate(idx):
+        assert (owners[i], starts[i], stops[i]) == nft.getRange(value)
+    assert owners[1] == owners[3] == accounts[4]
+    assert owners[5] == owners[6] == accounts[2]
+
+
+def test_empty(nft):
+    assert nft.getRanges([]) == ((), (), ())
+
+
+def test_out_of_bounds(nft):
+    with brownie.reverts():
+        nft.getRanges([1, 0])
+    with brownie.reverts():
+        nft.getRanges([1, 30001])
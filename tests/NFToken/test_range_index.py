@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+
+import pytest
+
+from scripts.range_index import ZERO_ADDRESS, RangeIndex
+
+
+def _compare(index, nft, accounts):
+    for account in accounts:
+        assert index.ranges_of(account) == sorted(nft.rangesOf(account))
+        assert index.balance_of(account) == nft.balanceOf(account)
+
+    boundaries = sorted(set(i for start, stop, _ in index.ranges() for i in (start, stop - 1)))
+    owners, starts, stops = nft.getRanges(boundaries)
+    for i, idx in enumerate(boundaries):
+        assert index.get_range(idx) == (owners[i], starts[i], stops[i])
+
+
+def test_initial(accounts, nft):
+    index = RangeIndex(nft.address)
+    index.sync()
+    assert index.ranges() == [
+        (1, 10001, accounts[1]),
+        (10001, 20001, accounts[2]),
+        (20001, 30001, accounts[3]),
+    ]
+    _compare(index, nft, accounts)
+
+
+def test_out_of_bounds(nft):
+    index = RangeIndex(nft.address)
+    index.sync()
+    with pytest.raises(IndexError):
+        index.get_range(0)
+    with pytest.raises(IndexError):
+        index.get_range(30001)
+
+
+def test_incremental(accounts, nft):
+    index = RangeIndex(nft.address)
+    index.sync()
+    nft.transferRange(accounts[4], 12000, 13000, {"from": accounts[2]})
+    nft.transfer(accounts[2], 4000, {"from": accounts[1]})
+    index.sync()
+    _compare(index, nft, accounts)
+
+    nft.transferRanges(accounts[1], [(10001, 10500), (19000, 20001)], {"from": accounts[2]})
+    nft.transferMany(accounts[4:8], [100, 2000, 3, 777], {"from": accounts[3]})
+    nft.transferRange(accounts[2], 12500, 13000, {"from": accounts[4]})
+    index.sync()
+    _compare(index, nft, accounts)
+
+
+def test_partial_sync(accounts, nft):
+    index = RangeIndex(nft.address)
+    index.sync()
+    block = index.block
+    nft.transferRange(accounts[4], 12000, 13000, {"from": accounts[2]})
+    nft.transferRange(accounts[4], 13000, 14000, {"from": accounts[2]})
+    index.sync(to_block=block + 1)
+    assert index.ranges_of(accounts[4]) == [(12000, 13000)]
+    index.sync()
+    assert index.ranges_of(accounts[4]) == [(12000, 14000)]
+
+
+def test_save_load(accounts, nft, tmp_path):
+    index = RangeIndex(nft.address)
+    index.sync()
+    nft.transfer(accounts[5], 10000, {"from": accounts[1]})
+    index.sync()
+    index.save(tmp_path.joinpath("index.json"))
+
+    nft.transferRange(accounts[1], 25000, 26000, {"from": accounts[3]})
+    index = RangeIndex.load(tmp_path.joinpath("index.json"))
+    index.sync()
+    _compare(index, nft, accounts)
+
+
+def test_mint_burn(accounts, nftmint):
+    index = RangeIndex(nftmint.address)
+    nftmint.mint(accounts[0], 5000, {"from": accounts[0]})
+    nftmint.mint(accounts[1], 5000, {"from": accounts[0]})
+    nftmint.mint(accounts[1], 5000, {"from": accounts[0]})
+    nftmint.mint(accounts[0], 5000, {"from": accounts[0]})
+    index.sync()
+    _compare(index, nftmint, accounts)
+
+    nftmint.burn(2000, 3000, {"from": accounts[0]})
+    nftmint.burn(15001, 20001, {"from": accounts[0]})
+    nftmint.transferRange(accounts[0], 6000, 7000, {"from": accounts[1]})
+    nftmint.burn(6000, 6500, {"from": accounts[0]})
+    nftmint.burn(3000, 4000, {"from": accounts[0]})
+    nftmint.mint(accounts[2], 5000, {"from": accounts[0]})
+    index.sync()
+    _compare(index, nftmint, accounts)
+    assert index.get_range(2500) == (ZERO_ADDRESS, 2000, 4000)
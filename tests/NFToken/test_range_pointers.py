@@ -0,0 +1,23 @@
+#!/usr/bin/python3
+
+
+def test_aligned_start(check_ranges, accounts, nft):
+    """short range starting at a multiple of the scoping multiplier"""
+    nft.transferRange(accounts[4], 12000, 12003, {"from": accounts[2]})
+    check_ranges([(1, 10001)], [(10001, 12000), (12003, 20001)], [(20001, 30001)], [(12000, 12003)])
+    assert nft.getRange(12000) == (accounts[4], 12000, 12003)
+
+
+def test_aligned_start_low(check_ranges, accounts, nft):
+    """short range starting at a multiple of the scoping multiplier, low index"""
+    nft.transferRange(accounts[4], 16, 19, {"from": accounts[1]})
+    check_ranges([(1, 16), (19, 10001)], [(10001, 20001)], [(20001, 30001)], [(16, 19)])
+    assert nft.getRange(16) == (accounts[4], 16, 19)
+
+
+def test_merge_left_pointers(check_ranges, accounts, nft):
+    """pointers are removed when a range merges with the previous range"""
+    nft.transferRange(accounts[2], 20001, 30001, {"from": accounts[3]})
+    nft.transferRange(accounts[3], 10001, 10002, {"from": accounts[2]})
+    check_ranges([(1, 10001)], [(10002, 30001)], [(10001, 10002)])
+    assert nft.getRange(20000) == (accounts[2], 10002, 30001)
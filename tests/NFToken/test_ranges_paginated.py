@@ -0,0 +1,40 @@
+#!/usr/bin/python3
+
+
+def _fragment(nft, accounts):
+    for i in range(5):
+        nft.transferRange(accounts[4], 10 + i * 100, 20 + i * 100, {"from": accounts[1]})
+
+
+def test_range_count(accounts, nft):
+    assert nft.rangeCountOf(accounts[1]) == 1
+    assert nft.rangeCountOf(accounts[4]) == 0
+    _fragment(nft, accounts)
+    assert nft.rangeCountOf(accounts[1]) == 6
+    assert nft.rangeCountOf(accounts[4]) == 5
+
+
+def test_all_pages(accounts, nft):
+    _fragment(nft, accounts)
+    for account in (accounts[1], accounts[4]):
+        expected = nft.rangesOf(account)
+        for limit in range(1, 8):
+            ranges = []
+            for offset in range(0, len(expected), limit):
+                page = nft.rangesOfPaginated(account, offset, limit)
+                assert len(page) <= limit
+                ranges.extend(page)
+            assert ranges == list(expected)
+
+
+def test_offset_exceeds_count(accounts, nft):
+    _fragment(nft, accounts)
+    assert nft.rangesOfPaginated(accounts[4], 5, 10) == ()
+    assert nft.rangesOfPaginated(accounts[4], 6, 10) == ()
+    assert nft.rangesOfPaginated(accounts[5], 0, 10) == ()
+
+
+def test_partial_page(accounts, nft):
+    _fragment(nft, accounts)
+    assert len(nft.rangesOfPaginated(accounts[4], 3, 10)) == 2
+    assert nft.rangesOfPaginated(accounts[4], 0, 0) == ()
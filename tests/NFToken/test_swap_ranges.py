@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+
+import brownie
+
+
+def test_swap(check_ranges, accounts, nft):
+    """swap ranges"""
+    nft.approveSwap(accounts[1], 15000, 15100, 5000, 5100, True, {"from": accounts[2]})
+    nft.swapRanges(accounts[2], 5000, 5100, 15000, 15100, {"from": accounts[1]})
+    check_ranges(
+        [(1, 5000), (5100, 10001), (15000, 15100)],
+        [(10001, 15000), (15100, 20001), (5000, 5100)],
+        [(20001, 30001)],
+    )
+    assert nft.balanceOf(accounts[1]) == 10000
+    assert nft.balanceOf(accounts[2]) == 10000
+
+
+def test_swap_consolidate(check_ranges, accounts, nft):
+    """swap adjacent ranges, consolidating both holders"""
+    nft.transferRange(accounts[2], 9001, 9501, {"from": accounts[1]})
+    check_ranges([(1, 9001), (9501, 10001)], [(9001, 9501), (10001, 20001)])
+
+    nft.approveSwap(accounts[1], 9001, 9501, 9501, 10001, True, {"from": accounts[2]})
+    nft.swapRanges(accounts[2], 9501, 10001, 9001, 9501, {"from": accounts[1]})
+    check_ranges([(1, 9501)], [(9501, 20001)], [(20001, 30001)])
+
+
+def test_swap_merge_counterparty(check_ranges, accounts, nft):
+    """given range merges with the range being received"""
+    nft.approveSwap(accounts[1], 10001, 10101, 9901, 10001, True, {"from": accounts[2]})
+    nft.swapRanges(accounts[2], 9901, 10001, 10001, 10101, {"from": accounts[1]})
+    check_ranges([(1, 9901), (10001, 10101)], [(9901, 10001), (10101, 20001)])
+
+
+def test_approval_consumed(accounts, nft):
+    """approval can only be used once"""
+    nft.approveSwap(accounts[1], 15000, 15100, 5000, 5100, True, {"from": accounts[2]})
+    assert nft.swapApproved(accounts[2], accounts[1], 15000, 15100, 5000, 5100)
+    nft.swapRanges(accounts[2], 5000, 5100, 15000, 15100, {"from": accounts[1]})
+    assert not nft.swapApproved(accounts[2], accounts[1], 15000, 15100, 5000, 5100)
+    nft.transferRange(accounts[1], 5000, 5100, {"from": accounts[2]})
+    nft.transferRange(accounts[2], 15000, 15100, {"from": accounts[1]})
+    with brownie.reverts("dev: swap not approved"):
+        nft.swapRanges(accounts[2], 5000, 5100, 15000, 15100, {"from": accounts[1]})
+
+
+def test_revoke(accounts, nft):
+    """approval is revoked"""
+    nft.approveSwap(accounts[1], 15000, 15100, 5000, 5100, True, {"from": accounts[2]})
+    nft.approveSwap(accounts[1], 15000, 15100, 5000, 5100, False, {"from": accounts[2]})
+    with brownie.reverts("dev: swap not approved"):
+        nft.swapRanges(accounts[2], 5000, 5100, 15000, 15100, {"from": accounts[1]})
+
+
+def test_not_approved(accounts, nft):
+    """approval must match the swap exactly"""
+    nft.approveSwap(accounts[1], 15000, 15100, 5000, 5100, True, {"from": accounts[2]})
+    with brownie.reverts("dev: swap not approved"):
+        nft.swapRanges(accounts[2], 5000, 5100, 15000, 15100, {"from": accounts[3]})
+    with brownie.reverts("dev: swap not approved"):
+        nft.swapRanges(accounts[2], 5001, 5101, 15000, 15100, {"from": accounts[1]})
+    with brownie.reverts("dev: swap not approved"):
+        nft.swapRanges(accounts[2], 15000, 15100, 5000, 5100, {"from": accounts[1]})
+
+
+def test_unequal_ranges(accounts, nft):
+    """ranges must be the same size"""
+    nft.approveSwap(accounts[1], 15000, 15101, 5000, 5100, True, {"from": accounts[2]})
+    with brownie.reverts("dev: unequal ranges"):
+        nft.swapRanges(accounts[2], 5000, 5100, 15000, 15101, {"from": accounts[1]})
+
+
+def test_swap_with_self(accounts, nft):
+    """cannot swap with self"""
+    nft.approveSwap(accounts[1], 15000, 15100, 5000, 5100, True, {"from": accounts[1]})
+    with brownie.reverts("dev: swap with self"):
+        nft.swapRanges(accounts[1], 5000, 5100, 15000, 15100, {"from": accounts[1]})
+
+
+def test_not_owned(accounts, nft):
+    """both ranges must be owned"""
+    nft.approveSwap(accounts[1], 25000, 25100, 5000, 5100, True, {"from": accounts[2]})
+    with brownie.reverts("dev: sender does not own"):
+        nft.swapRanges(accounts[2], 5000, 5100, 25000, 25100, {"from": accounts[1]})
+    nft.approveSwap(accounts[1], 15000, 15100, 25000, 25100, True, {"from": accounts[2]})
+    with brownie.reverts("dev: sender does not own"):
+        nft.swapRanges(accounts[2], 25000, 25100, 15000, 15100, {"from": accounts[1]})
+
+
+def test_events(accounts, nft):
+    """Transfer and TransferRange events in both directions"""
+    tx = nft.approveSwap(accounts[1], 15000, 15100, 5000, 5100, True, {"from": accounts[2]})
+    assert tx.events["SwapApproval"]["approved"]
+    tx = nft.swapRanges(accounts[2], 5000, 5100, 15000, 15100, {"from": accounts[1]})
+    assert tx.events["Transfer"][0] == {"from": accounts[1], "to": accounts[2], "amount": 100}
+    assert tx.events["Transfer"][1] == {"from": accounts[2], "to": accounts[1], "amount": 100}
+    assert [i["start"] for i in tx.events["TransferRange"]] == [5000, 15000]
@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+
+import brownie
+
+
+def test_transfer_many(check_ranges, accounts, nft):
+    """transfer to multiple recipients"""
+    nft.transferMany(accounts[4:7], [100, 200, 300], {"from": accounts[1]})
+    check_ranges(
+        [(601, 10001)], [(10001, 20001)], [(20001, 30001)], [(1, 101)], [(101, 301)], [(301, 601)],
+    )
+
+
+def test_transfer_many_multiple_ranges(check_ranges, accounts, nft):
+    """transfer to multiple recipients, across multiple sender ranges"""
+    nft.transfer(accounts[4], 10000, {"from": accounts[2]})
+    nft.transfer(accounts[1], 10000, {"from": accounts[3]})
+    nft.transferMany([accounts[2], accounts[5]], [9000, 6000], {"from": accounts[1]})
+    check_ranges(
+        [(25001, 30001)], [(1, 9001)], [], [(10001, 20001)], [(9001, 10001), (20001, 25001)],
+    )
+
+
+def test_transfer_many_same_recipient(check_ranges, accounts, nft):
+    """repeated recipients merge their ranges"""
+    nft.transferMany(
+        [accounts[4], accounts[4], accounts[1]], [100, 100, 100], {"from": accounts[1]}
+    )
+    check_ranges([(201, 10001)], [(10001, 20001)], [(20001, 30001)], [(1, 201)])
+
+
+def test_transfer_many_zero(accounts, nft):
+    """transfer zero tokens"""
+    nft.transferMany([accounts[4], accounts[5]], [0, 100], {"from": accounts[1]})
+    assert nft.balanceOf(accounts[4]) == 0
+    assert nft.balanceOf(accounts[5]) == 100
+
+
+def test_transfer_many_events(accounts, nft):
+    """one Transfer event per recipient"""
+    tx = nft.transferMany(accounts[4:7], [100, 200, 300], {"from": accounts[1]})
+    assert [i["to"] for i in tx.events["Transfer"]] == accounts[4:7]
+    assert [i["amount"] for i in tx.events["Transfer"]] == [100, 200, 300]
+
+
+def test_transfer_many_reverts(accounts, nft):
+    """length mismatch, underflow, uint64 overflow"""
+    with brownie.reverts("dev: length mismatch"):
+        nft.transferMany(accounts[4:7], [100, 200], {"from": accounts[1]})
+    with brownie.reverts("dev: underflow"):
+        nft.transferMany(accounts[4:7], [5000, 5000, 1], {"from": accounts[1]})
+    with brownie.reverts("dev: uint64 overflow"):
+        nft.transferMany(accounts[4:6], [1, 2 ** 65], {"from": accounts[1]})
+
+
+def test_transfer_range_many(check_ranges, accounts, nft):
+    """transfer specific ranges to multiple recipients"""
+    nft.transferRangeMany(
+        [accounts[4], accounts[5], accounts[3]],
+        [(10001, 10100), (15000, 15100), (20000, 20001)],
+        {"from": accounts[2]},
+    )
+    check_ranges(
+        [(1, 10001)],
+        [(10100, 15000), (15100, 20000)],
+        [(20000, 30001)],
+        [(10001, 10100)],
+        [(15000, 15100)],
+    )
+
+
+def test_transfer_range_many_merge(check_ranges, accounts, nft):
+    """transfer specific ranges to multiple recipients, merging with earlier ranges"""
+    nft.transferRangeMany(
+        [accounts[4], accounts[5], accounts[4]],
+        [(1, 100), (500, 600), (100, 200)],
+        {"from": accounts[1]},
+    )
+    check_ranges(
+        [(200, 500), (600, 10001)], [(10001, 20001)], [(20001, 30001)], [(1, 200)], [(500, 600)],
+    )
+    assert nft.balanceOf(accounts[1]) == 9700
+
+
+def test_transfer_range_many_reverts(accounts, nft):
+    """length mismatch, sender does not own"""
+    with brownie.reverts("dev: length mismatch"):
+        nft.transferRangeMany(accounts[4:6], [(1, 100)], {"from": accounts[1]})
+    with brownie.reverts("dev: sender does not own"):
+        nft.transferRangeMany(accounts[4:6], [(1, 100), (10001, 10002)], {"from": accounts[1]})
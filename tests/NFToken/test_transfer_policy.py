@@ -0,0 +1,131 @@
+#!/usr/bin/python3
+
+import brownie
+import pytest
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(accounts, nft):
+    # accounts[1] holds ranges of 1000, 3000 and 4000 tokens
+    nft.transferRange(accounts[4], 1001, 2001, {"from": accounts[1]})
+    nft.transferRange(accounts[4], 5001, 6001, {"from": accounts[1]})
+
+
+def test_first(check_ranges, accounts, nft):
+    """first range"""
+    nft.transferWithPolicy(accounts[5], 500, 0, {"from": accounts[1]})
+    check_ranges(
+        [(501, 1001), (2001, 5001), (6001, 10001)],
+        [(10001, 20001)],
+        [(20001, 30001)],
+        [(1001, 2001), (5001, 6001)],
+        [(1, 501)],
+    )
+
+
+def test_largest(check_ranges, accounts, nft):
+    """largest range"""
+    nft.transferWithPolicy(accounts[5], 500, 1, {"from": accounts[1]})
+    check_ranges(
+        [(1, 1001), (2001, 5001), (6501, 10001)],
+        [(10001, 20001)],
+        [(20001, 30001)],
+        [(1001, 2001), (5001, 6001)],
+        [(6001, 6501)],
+    )
+
+
+def test_best_fit(check_ranges, accounts, nft):
+    """smallest range that covers the amount"""
+    nft.transferWithPolicy(accounts[5], 2500, 2, {"from": accounts[1]})
+    check_ranges(
+        [(1, 1001), (4501, 5001), (6001, 10001)],
+        [(10001, 20001)],
+        [(20001, 30001)],
+        [(1001, 2001), (5001, 6001)],
+        [(2001, 4501)],
+    )
+
+
+def test_best_fit_multiple(check_ranges, accounts, nft):
+    """no single range covers the amount"""
+    nft.transferWithPolicy(accounts[5], 5000, 2, {"from": accounts[1]})
+    check_ranges(
+        [(2001, 5001)],
+        [(10001, 20001)],
+        [(20001, 30001)],
+        [(1001, 2001), (5001, 6001)],
+        [(1, 1001), (6001, 10001)],
+    )
+
+
+def test_merge(check_ranges, accounts, nft):
+    """ranges that merge with the recipient"""
+    nft.transferWithPolicy(accounts[4], 1500, 3, {"from": accounts[1]})
+    check_ranges(
+        [(2001, 5001), (6501, 10001)],
+        [(10001, 20001)],
+        [(20001, 30001)],
+        [(1, 2001), (5001, 6501)],
+    )
+
+
+def test_merge_end(check_ranges, accounts, nft):
+    """partial range is taken from the end when it touches the recipient"""
+    nft.transferWithPolicy(accounts[4], 500, 3, {"from": accounts[1]})
+    check_ranges(
+        [(1, 501), (2001, 5001), (6001, 10001)],
+        [(10001, 20001)],
+        [(20001, 30001)],
+        [(501, 2001), (5001, 6001)],
+    )
+
+
+def test_merge_no_match(check_ranges, accounts, nft):
+    """no ranges merge with the recipient"""
+    nft.transferWithPolicy(accounts[5], 500, 3, {"from": accounts[1]})
+    check_ranges(
+        [(501, 1001), (2001, 5001), (6001, 10001)],
+        [(10001, 20001)],
+        [(20001, 30001)],
+        [(1001, 2001), (5001, 6001)],
+        [(1, 501)],
+    )
+
+
+def test_set_policy(accounts, nft):
+    """stored policy is used by transfer"""
+    assert nft.transferPolicyOf(accounts[1]) == 0
+    nft.setTransferPolicy(1, {"from": accounts[1]})
+    assert nft.transferPolicyOf(accounts[1]) == 1
+    nft.transfer(accounts[5], 500, {"from": accounts[1]})
+    assert nft.rangesOf(accounts[5]) == [(6001, 6501)]
+
+
+def test_set_policy_transfer_from(accounts, nft):
+    """stored policy is used by transferFrom"""
+    nft.setTransferPolicy(1, {"from": accounts[1]})
+    nft.approve(accounts[2], 500, {"from": accounts[1]})
+    nft.transferFrom(accounts[1], accounts[5], 500, {"from": accounts[2]})
+    assert nft.rangesOf(accounts[5]) == [(6001, 6501)]
+
+
+def test_set_policy_transfer_many(accounts, nft):
+    """stored policy is used by transferMany"""
+    nft.setTransferPolicy(1, {"from": accounts[1]})
+    nft.transferMany([accounts[5]], [500], {"from": accounts[1]})
+    assert nft.rangesOf(accounts[5]) == [(6001, 6501)]
+
+
+def test_invalid_policy(accounts, nft):
+    """invalid policy"""
+    with brownie.reverts("dev: invalid policy"):
+        nft.setTransferPolicy(4, {"from": accounts[1]})
+    with brownie.reverts("dev: invalid policy"):
+        nft.transferWithPolicy(accounts[5], 500, 4, {"from": accounts[1]})
+
+
+def test_insufficient_balance(accounts, nft):
+    """policy does not affect balance checks"""
+    with brownie.reverts("dev: underflow"):
+        nft.transferWithPolicy(accounts[5], 8001, 2, {"from": accounts[1]})
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+
+import brownie
+
+
+def test_transfer_ranges(check_ranges, accounts, nft):
+    """transfer multiple ranges"""
+    nft.transferRanges(accounts[4], [(100, 200), (500, 600), (9000, 10001)], {"from": accounts[1]})
+    check_ranges(
+        [(1, 100), (200, 500), (600, 9000)],
+        [(10001, 20001)],
+        [(20001, 30001)],
+        [(100, 200), (500, 600), (9000, 10001)],
+    )
+    assert nft.balanceOf(accounts[1]) == 8800
+    assert nft.balanceOf(accounts[4]) == 1200
+
+
+def test_transfer_ranges_merge(check_ranges, accounts, nft):
+    """transfer multiple ranges, merging with recipient"""
+    nft.transferRanges(accounts[2], [(5000, 6000), (9000, 10001)], {"from": accounts[1]})
+    check_ranges([(1, 5000), (6000, 9000)], [(5000, 6000), (9000, 20001)], [(20001, 30001)], [])
+
+
+def test_transfer_ranges_adjacent(check_ranges, accounts, nft):
+    """transfer adjacent ranges"""
+    nft.transferRanges(accounts[4], [(1000, 2000), (2000, 3000)], {"from": accounts[1]})
+    check_ranges([(1, 1000), (3000, 10001)], [(10001, 20001)], [(20001, 30001)], [(1000, 3000)])
+
+
+def test_transfer_ranges_empty(accounts, nft):
+    """transfer an empty array"""
+    nft.transferRanges(accounts[4], [], {"from": accounts[1]})
+    assert nft.balanceOf(accounts[1]) == 10000
+    assert nft.balanceOf(accounts[4]) == 0
+
+
+def test_transfer_ranges_to_self(accounts, nft):
+    """transfer to self"""
+    nft.transferRanges(accounts[1], [(1, 100), (200, 300)], {"from": accounts[1]})
+    assert nft.balanceOf(accounts[1]) == 10000
+    assert nft.rangesOf(accounts[1]) == [(1, 10001)]
+
+
+def test_events(accounts, nft):
+    """single Transfer event, one TransferRange per range"""
+    tx = nft.transferRanges(accounts[4], [(1, 101), (500, 600)], {"from": accounts[1]})
+    assert tx.events["Transfer"] == {"from": accounts[1], "to": accounts[4], "amount": 200}
+    assert len(tx.events["TransferRange"]) == 2
+    assert tx.events["TransferRange"][1]["start"] == 500
+
+
+def test_not_owner(accounts, nft):
+    """sender does not own one of the ranges"""
+    with brownie.reverts("dev: sender does not own"):
+        nft.transferRanges(accounts[4], [(1, 100), (11000, 12000)], {"from": accounts[1]})
+
+
+def test_multiple_ranges(accounts, nft):
+    """a single item spans multiple ranges"""
+    with brownie.reverts("dev: multiple ranges"):
+        nft.transferRanges(accounts[4], [(1, 100), (9000, 11000)], {"from": accounts[1]})
+
+
+def test_overlapping(accounts, nft):
+    """overlapping ranges"""
+    with brownie.reverts("dev: sender does not own"):
+        nft.transferRanges(accounts[4], [(1, 100), (1, 100)], {"from": accounts[1]})
@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+
+import brownie
+
+
+def test_inside(check_ranges, accounts, nft):
+    """inside a range"""
+    nft.transferToken(accounts[4], 12000, {"from": accounts[2]})
+    check_ranges([(1, 10001)], [(10001, 12000), (12001, 20001)], [(20001, 30001)], [(12000, 12001)])
+
+
+def test_start(check_ranges, accounts, nft):
+    """start of a range"""
+    nft.transferToken(accounts[4], 10001, {"from": accounts[2]})
+    check_ranges([(1, 10001)], [(10002, 20001)], [(20001, 30001)], [(10001, 10002)])
+
+
+def test_end(check_ranges, accounts, nft):
+    """end of a range"""
+    nft.transferToken(accounts[4], 20000, {"from": accounts[2]})
+    check_ranges([(1, 10001)], [(10001, 20000)], [(20001, 30001)], [(20000, 20001)])
+
+
+def test_merge_left(check_ranges, accounts, nft):
+    """start of a range, merge with previous range"""
+    nft.transferToken(accounts[1], 10001, {"from": accounts[2]})
+    check_ranges([(1, 10002)], [(10002, 20001)], [(20001, 30001)], [])
+
+
+def test_merge_right(check_ranges, accounts, nft):
+    """end of a range, merge with next range"""
+    nft.transferToken(accounts[3], 20000, {"from": accounts[2]})
+    check_ranges([(1, 10001)], [(10001, 20000)], [(20000, 30001)], [])
+
+
+def test_single_token_range(check_ranges, accounts, nft):
+    """range of one token, moved back and forth"""
+    nft.transferToken(accounts[4], 12000, {"from": accounts[2]})
+    nft.transferToken(accounts[1], 12000, {"from": accounts[4]})
+    check_ranges(
+        [(1, 10001), (12000, 12001)], [(10001, 12000), (12001, 20001)], [(20001, 30001)], []
+    )
+    nft.transferToken(accounts[2], 12000, {"from": accounts[1]})
+    check_ranges([(1, 10001)], [(10001, 20001)], [(20001, 30001)], [])
+
+
+def test_events(accounts, nft):
+    """emits the same events as transferRange"""
+    tx = nft.transferToken(accounts[4], 12000, {"from": accounts[2]})
+
+    expected = {"from": accounts[2], "to": accounts[4], "amount": 1}
+    assert tx.events["Transfer"] == expected
+
+    expected = {"from": accounts[2], "to": accounts[4], "start": 12000, "stop": 12001, "amount": 1}
+    assert tx.events["TransferRange"] == expected
+
+
+def test_to_self(check_ranges, accounts, nft):
+    """transfer to self"""
+    tx = nft.transferToken(accounts[2], 12000, {"from": accounts[2]})
+    assert "TransferRange" not in tx.events
+    check_ranges([(1, 10001)], [(10001, 20001)], [(20001, 30001)], [])
+
+
+def test_check_bounds(accounts, nft):
+    """check bounds"""
+    with brownie.reverts("dev: index out of bounds"):
+        nft.transferToken(accounts[2], 0, {"from": accounts[0]})
+    with brownie.reverts("dev: index out of bounds"):
+        nft.transferToken(accounts[2], 30001, {"from": accounts[0]})
+
+
+def test_not_owner(accounts, nft):
+    """sender does not own token"""
+    with brownie.reverts("dev: sender does not own"):
+        nft.transferToken(accounts[3], 12000, {"from": accounts[1]})
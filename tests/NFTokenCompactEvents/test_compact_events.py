@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+
+import pytest
+
+from scripts.model import NFTokenMintableModel
+from scripts.range_index import RangeIndex, unpack_range
+
+
+@pytest.fixture(scope="module")
+def nftc(accounts, NFTokenCompactEvents):
+    token = accounts[0].deploy(NFTokenCompactEvents, "Test NFT", "NFT", 0)
+    # accounts[1] and accounts[2] each hold five alternating ranges of 100 tokens
+    for i in range(10):
+        token.mint(accounts[i % 2 + 1], 100, {"from": accounts[0]})
+    yield token
+
+
+@pytest.fixture
+def model(accounts):
+    model = NFTokenMintableModel(accounts[0], 0)
+    for i in range(10):
+        model.mint(accounts[0], accounts[i % 2 + 1], 100)
+    yield model
+
+
+def _calls(a):
+    # one call of each method that sends ranges, applied in order
+    return [
+        ("transfer", a[1], a[3], 250),
+        ("transferRange", a[1], a[3], 410, 420),
+        ("transferToken", a[2], a[3], 150),
+        ("transferRanges", a[2], a[3], [(101, 110), (301, 400), (501, 550)]),
+        ("transferMany", a[3], [a[1], a[2]], [10, 300]),
+        ("transferRangeMany", a[1], [a[2], a[3]], [(201, 210), (220, 230)]),
+        ("mint", a[0], a[1], 100),
+        ("mintBatch", a[0], [a[1], a[1], a[2]], [10, 20, 30]),
+        ("transferRanges", a[1], a[0], [(421, 501), (651, 701)]),
+        ("burn", a[0], 421, 450),
+        ("burnRanges", a[0], [(450, 501), (651, 670)]),
+        ("burnAmount", a[0], 30),
+    ]
+
+
+CALL_NAMES = [i[0] for i in _calls([None] * 4)]
+
+
+@pytest.mark.parametrize("idx", range(len(CALL_NAMES)), ids=CALL_NAMES)
+def test_same_ranges(accounts, nftc, model, idx):
+    """TransferRanges holds the same ranges as TransferRange, in the same order"""
+    calls = _calls(accounts)
+    for call in calls[:idx]:
+        _call(nftc, model, *call)
+
+    fn_name, sender, *args = calls[idx]
+    events = getattr(model, _snake_case(fn_name))(sender, *args)
+    tx = getattr(nftc, fn_name)(*args, {"from": sender})
+
+    assert "TransferRange" not in tx.events
+    assert _unpack(tx) == [i[1:5] for i in events if i[0] == "TransferRange"]
+    transfers = [tuple(i.values()) for i in tx.events["Transfer"]]
+    assert transfers == [i[1:] for i in events if i[0] == "Transfer"]
+
+
+def test_one_event_per_call(accounts, nftc):
+    """a transfer spanning many ranges emits a single TransferRanges"""
+    tx = nftc.transfer(accounts[3], 450, {"from": accounts[1]})
+    assert len(tx.events["TransferRanges"]) == 1
+    assert len(tx.events["TransferRanges"][0]["ranges"]) == 5
+
+
+def test_transfer_to_self(accounts, nftc):
+    """no TransferRanges event when sending to self"""
+    tx = nftc.transferRanges(accounts[1], nftc.rangesOf(accounts[1]), {"from": accounts[1]})
+    assert "TransferRanges" not in tx.events
+
+
+def test_range_index(accounts, nftc, model):
+    """RangeIndex decodes TransferRanges"""
+    for call in _calls(accounts):
+        _call(nftc, model, *call)
+    index = RangeIndex(nftc.address)
+    index.sync()
+    for account in accounts[:4]:
+        assert index.ranges_of(account) == sorted(nftc.rangesOf(account))
+        assert index.balance_of(account) == nftc.balanceOf(account)
+
+
+def _call(nft, model, fn_name, sender, *args):
+    getattr(model, _snake_case(fn_name))(sender, *args)
+    getattr(nft, fn_name)(*args, {"from": sender})
+
+
+def _unpack(tx):
+    if "TransferRanges" not in tx.events:
+        return []
+    return [
+        (i["from"], i["to"], *unpack_range(x))
+        for i in tx.events["TransferRanges"]
+        for x in i["ranges"]
+    ]
+
+
+def _snake_case(name):
+    return "".join(f"_{i.lower()}" if i.isupper() else i for i in name)
@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+
+import pytest
+
+from scripts.range_index import RangeIndex
+from scripts.range_proof import EMPTY, RangeTree, verify_range
+
+
+@pytest.fixture(scope="module")
+def nftm(accounts, NFTokenMerkle):
+    token = accounts[0].deploy(NFTokenMerkle, "Test NFT", "NFT", 30000)
+    for i in range(1, 4):
+        token.transfer(accounts[i], 10000, {"from": accounts[0]})
+    yield token
+
+
+def _tree(nft):
+    index = RangeIndex(nft.address)
+    index.sync()
+    return index, RangeTree.from_index(index)
+
+
+def test_empty(accounts, NFTokenMerkle):
+    nft = accounts[0].deploy(NFTokenMerkle, "Test NFT", "NFT", 0)
+    assert nft.merkleRoot() == EMPTY
+
+
+def test_initial(nftm):
+    index, tree = _tree(nftm)
+    assert nftm.merkleRoot() == tree.root
+
+
+def test_transfers(accounts, nftm):
+    """root matches the off-chain tree after splits and merges"""
+    nftm.transferRange(accounts[4], 100, 200, {"from": accounts[1]})
+    nftm.transferRange(accounts[4], 200, 300, {"from": accounts[1]})
+    nftm.transferRange(accounts[1], 100, 300, {"from": accounts[4]})
+    nftm.transferRanges(accounts[2], [(9000, 10001), (5000, 5050)], {"from": accounts[1]})
+    nftm.transfer(accounts[4], 1500, {"from": accounts[3]})
+    nftm.transferToken(accounts[3], 20000, {"from": accounts[2]})
+    index, tree = _tree(nftm)
+    assert nftm.merkleRoot() == tree.root
+
+
+def test_mint_burn(accounts, nftm):
+    """root matches the off-chain tree after mints and burns"""
+    nftm.transferRange(accounts[0], 1, 500, {"from": accounts[1]})
+    nftm.mintBatch([accounts[0], accounts[0], accounts[2]], [100, 200, 300], {"from": accounts[0]})
+    nftm.burn(100, 200, {"from": accounts[0]})
+    nftm.burnRanges([(1, 100), (200, 500)], {"from": accounts[0]})
+    index, tree = _tree(nftm)
+    assert nftm.merkleRoot() == tree.root
+
+
+def test_proof(accounts, nftm):
+    """ownership proofs are valid for every range"""
+    nftm.transferRange(accounts[4], 12000, 13000, {"from": accounts[2]})
+    index, tree = _tree(nftm)
+    root = nftm.merkleRoot()
+    for start, stop, owner in index.ranges():
+        proof = tree.prove(start)
+        assert verify_range(root, owner, start, stop, proof)
+        assert nftm.verifyRange(root, owner, start, stop, proof)
+
+    owner, start, stop, proof = tree.prove_token(index, 12500)
+    assert (owner, start, stop) == (accounts[4], 12000, 13000)
+    assert verify_range(root, owner, start, stop, proof)
+
+
+def test_invalid_proof(accounts, nftm):
+    index, tree = _tree(nftm)
+    root = nftm.merkleRoot()
+    proof = tree.prove(10001)
+    assert not nftm.verifyRange(root, accounts[1], 10001, 20001, proof)
+    assert not nftm.verifyRange(root, accounts[2], 10001, 20000, proof)
+    assert not verify_range(root, accounts[1], 10001, 20001, proof)
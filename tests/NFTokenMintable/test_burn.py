@@ -159,6 +159,16 @@ def test_reburn(accounts, nftmint):
         nftmint.burn(100, 200, {"from": accounts[0]})
 
 
+def test_transfer_to_burned(accounts, nftmint):
+    """a burned range is not held in the zero address balance"""
+    nftmint.mint(accounts[0], 1000, {"from": accounts[0]})
+    nftmint.burn(501, 1001, {"from": accounts[0]})
+    with brownie.reverts("dev: range not in balance"):
+        nftmint.transferRange(ZERO_ADDRESS, 1, 501, {"from": accounts[0]})
+    assert nftmint.rangeCountOf(ZERO_ADDRESS) == 0
+    assert nftmint.getRange(700) == (ZERO_ADDRESS, 501, 1001)
+
+
 def test_events(accounts, nftmint):
     nftmint.mint(accounts[0], 10000, {"from": accounts[0]})
     tx = nftmint.burn(1, 1001, {"from": accounts[0]})
@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+
+import brownie
+import pytest
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+@pytest.fixture
+def split(accounts, nftmint):
+    # accounts[0] holds (1, 1001) and (2001, 3001)
+    for i in range(4):
+        nftmint.mint(accounts[i % 2], 1000, {"from": accounts[0]})
+
+
+def test_burn_ranges(accounts, nftmint, split):
+    """burn many ranges"""
+    nftmint.burnRanges([(1, 501), (2001, 2101)], {"from": accounts[0]})
+    assert nftmint.rangesOf(accounts[0]) == [(501, 1001), (2101, 3001)]
+    assert nftmint.balanceOf(accounts[0]) == 1400
+    assert nftmint.totalSupply() == 3400
+    assert nftmint.getRange(1) == (ZERO_ADDRESS, 1, 501)
+    assert nftmint.getRange(2001) == (ZERO_ADDRESS, 2001, 2101)
+
+
+def test_burn_ranges_merge(accounts, nftmint, split):
+    """adjacent burned ranges are merged"""
+    nftmint.burnRanges([(1, 501), (501, 1001)], {"from": accounts[0]})
+    assert nftmint.rangesOf(accounts[0]) == [(2001, 3001)]
+    assert nftmint.getRange(700) == (ZERO_ADDRESS, 1, 1001)
+
+
+def test_burn_ranges_revert(accounts, nftmint, split):
+    """burnRanges reverts"""
+    with brownie.reverts("dev: only owner"):
+        nftmint.burnRanges([(1, 501)], {"from": accounts[1]})
+    with brownie.reverts("dev: burn 0"):
+        nftmint.burnRanges([], {"from": accounts[0]})
+    with brownie.reverts("dev: only owner tokens"):
+        nftmint.burnRanges([(1, 501), (1001, 1101)], {"from": accounts[0]})
+    with brownie.reverts("dev: multiple ranges"):
+        nftmint.burnRanges([(1, 501), (501, 1101)], {"from": accounts[0]})
+
+
+def test_burn_amount(accounts, nftmint, split):
+    """burn by amount"""
+    nftmint.burnAmount(1500, {"from": accounts[0]})
+    assert nftmint.rangesOf(accounts[0]) == [(2501, 3001)]
+    assert nftmint.balanceOf(accounts[0]) == 500
+    assert nftmint.totalSupply() == 2500
+    assert nftmint.getRange(1) == (ZERO_ADDRESS, 1, 1001)
+    assert nftmint.getRange(2200) == (ZERO_ADDRESS, 2001, 2501)
+
+
+def test_burn_amount_all(accounts, nftmint, split):
+    """burn the entire owner balance"""
+    nftmint.burnAmount(2000, {"from": accounts[0]})
+    assert nftmint.rangeCountOf(accounts[0]) == 0
+    assert nftmint.balanceOf(accounts[0]) == 0
+    assert nftmint.totalSupply() == 2000
+
+
+def test_burn_amount_revert(accounts, nftmint, split):
+    """burnAmount reverts"""
+    with brownie.reverts("dev: only owner"):
+        nftmint.burnAmount(100, {"from": accounts[1]})
+    with brownie.reverts("dev: burn 0"):
+        nftmint.burnAmount(0, {"from": accounts[0]})
+    with brownie.reverts("dev: underflow"):
+        nftmint.burnAmount(2001, {"from": accounts[0]})
+
+
+def test_events(accounts, nftmint, split):
+    """one Transfer event is emitted for the total amount"""
+    tx = nftmint.burnAmount(1500, {"from": accounts[0]})
+    assert [tx.events[i].name for i in range(len(tx.events))] == [
+        "Transfer",
+        "TransferRange",
+        "TransferRange",
+    ]
+    expected = {"from": accounts[0], "to": ZERO_ADDRESS, "amount": 1500}
+    assert tx.events["Transfer"] == expected
+    expected = {"from": accounts[0], "to": ZERO_ADDRESS, "start": 2001, "stop": 2501, "amount": 500}
+    assert tx.events["TransferRange"][1] == expected
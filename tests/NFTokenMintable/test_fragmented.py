@@ -0,0 +1,88 @@
+#!/usr/bin/python3
+
+import pytest
+
+from scripts.model import NFTokenMintableModel
+
+# same defaults as scripts/fragment.py
+RANGES = 100
+AMOUNT = 65535
+
+
+@pytest.fixture(scope="module")
+def nft(fragmented):
+    # accounts[0] and accounts[1] each hold 100 non-adjacent ranges
+    yield fragmented(RANGES, AMOUNT)
+
+
+@pytest.fixture
+def model(accounts):
+    model = NFTokenMintableModel(accounts[0], 0)
+    for i in range(RANGES * 2):
+        model.mint(accounts[0], accounts[i % 2], AMOUNT)
+    yield model
+
+
+def test_fragmented(accounts, nft, model):
+    for account in accounts[:2]:
+        assert nft.rangeCountOf(account) == RANGES
+        assert nft.balanceOf(account) == RANGES * AMOUNT
+        assert nft.rangesOf(account) == model.ranges_of(account)
+
+
+def test_transfer_all(accounts, nft, model):
+    """transfer every range in a single call"""
+    balance = nft.balanceOf(accounts[0])
+    nft.transfer(accounts[2], balance, {"from": accounts[0]})
+    model.transfer(accounts[0], accounts[2], balance)
+    _check(accounts, nft, model)
+    assert nft.rangeCountOf(accounts[0]) == 0
+    assert nft.rangeCountOf(accounts[2]) == RANGES
+
+
+def test_transfer_partial(accounts, nft, model):
+    """transfer part of the balance, splitting one range"""
+    amount = RANGES * AMOUNT // 2 + 1000
+    nft.transfer(accounts[2], amount, {"from": accounts[0]})
+    model.transfer(accounts[0], accounts[2], amount)
+    _check(accounts, nft, model)
+
+
+def test_transfer_merge(accounts, nft, model):
+    """every range merges with the ranges on both sides"""
+    balance = nft.balanceOf(accounts[1])
+    nft.transfer(accounts[0], balance, {"from": accounts[1]})
+    model.transfer(accounts[1], accounts[0], balance)
+    _check(accounts, nft, model)
+    assert nft.rangesOf(accounts[0]) == [(1, RANGES * AMOUNT * 2 + 1)]
+
+
+def test_transfer_ranges(accounts, nft, model):
+    ranges = nft.rangesOf(accounts[0])[::2]
+    nft.transferRanges(accounts[2], ranges, {"from": accounts[0]})
+    model.transfer_ranges(accounts[0], accounts[2], ranges)
+    _check(accounts, nft, model)
+
+
+def test_burn_amount(accounts, nft, model):
+    amount = RANGES * AMOUNT // 2 + 1000
+    nft.burnAmount(amount, {"from": accounts[0]})
+    model.burn_amount(accounts[0], amount)
+    _check(accounts, nft, model)
+    assert nft.totalSupply() == model.total_supply
+
+
+def test_paginated(accounts, nft):
+    ranges = nft.rangesOf(accounts[0])
+    for offset in range(0, RANGES, 30):
+        assert nft.rangesOfPaginated(accounts[0], offset, 30) == ranges[offset : offset + 30]
+
+
+def _check(accounts, nft, model):
+    for account in accounts[:3]:
+        ranges = nft.rangesOf(account)
+        assert ranges == model.ranges_of(account)
+        assert nft.balanceOf(account) == model.balance_of(account)
+        idx_list = sorted(x for i in ranges for x in (i[0], i[1] - 1))
+        if idx_list:
+            assert nft.getRanges(idx_list) == model.get_ranges(idx_list)
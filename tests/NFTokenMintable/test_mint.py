@@ -56,6 +56,17 @@ def test_mint_merge(accounts, nftmint):
     assert nftmint.balanceOf(accounts[1]) == 15000
 
 
+def test_mint_merge_pointers(accounts, nftmint):
+    """Mint and merge range, then mint a new range"""
+    nftmint.mint(accounts[1], 10000, {"from": accounts[0]})
+    nftmint.mint(accounts[1], 5000, {"from": accounts[0]})
+    nftmint.mint(accounts[2], 5000, {"from": accounts[0]})
+    for i in (1, 10000, 10001, 12345, 15000):
+        assert nftmint.getRange(i) == (accounts[1], 1, 15001)
+    for i in (15001, 16384, 20000):
+        assert nftmint.getRange(i) == (accounts[2], 15001, 20001)
+
+
 def test_mint_one(accounts, nftmint):
     """mint 1 token"""
     nftmint.mint(accounts[1], 1, {"from": accounts[0]})
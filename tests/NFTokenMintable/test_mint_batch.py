@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+
+import brownie
+
+
+def test_mint_batch(accounts, nftmint):
+    """mint to many targets"""
+    nftmint.mintBatch(accounts[1:4], [1000, 2000, 3000], {"from": accounts[0]})
+    assert nftmint.totalSupply() == 6000
+    assert nftmint.rangesOf(accounts[1]) == [(1, 1001)]
+    assert nftmint.rangesOf(accounts[2]) == [(1001, 3001)]
+    assert nftmint.rangesOf(accounts[3]) == [(3001, 6001)]
+    for i in range(1, 4):
+        assert nftmint.balanceOf(accounts[i]) == i * 1000
+    assert nftmint.getRange(6000) == (accounts[3], 3001, 6001)
+
+
+def test_merge_consecutive(accounts, nftmint):
+    """consecutive mints to the same target are merged"""
+    targets = [accounts[1], accounts[1], accounts[2], accounts[1]]
+    nftmint.mintBatch(targets, [1000, 500, 2000, 100], {"from": accounts[0]})
+    assert nftmint.rangesOf(accounts[1]) == [(1, 1501), (3501, 3601)]
+    assert nftmint.rangesOf(accounts[2]) == [(1501, 3501)]
+    assert nftmint.balanceOf(accounts[1]) == 1600
+    assert nftmint.getRange(1000) == (accounts[1], 1, 1501)
+
+
+def test_merge_existing(accounts, nftmint):
+    """first mint merges with the previous range"""
+    nftmint.mint(accounts[1], 1000, {"from": accounts[0]})
+    nftmint.mintBatch([accounts[1], accounts[2]], [1000, 1000], {"from": accounts[0]})
+    assert nftmint.rangesOf(accounts[1]) == [(1, 2001)]
+    assert nftmint.rangesOf(accounts[2]) == [(2001, 3001)]
+    assert nftmint.totalSupply() == 3000
+
+
+def test_same_as_mint(accounts, nftmint, NFTokenMintable):
+    """results and events match individual calls to mint"""
+    targets = [accounts[1], accounts[2], accounts[2], accounts[1]]
+    values = [100, 200, 300, 400]
+    tx = nftmint.mintBatch(targets, values, {"from": accounts[0]})
+    expected = _events(tx)
+
+    nft = accounts[0].deploy(NFTokenMintable, "Test NFT", "NFT", 0)
+    events = []
+    for target, value in zip(targets, values):
+        events += _events(nft.mint(target, value, {"from": accounts[0]}))
+
+    for i in range(1, 3):
+        assert nftmint.rangesOf(accounts[i]) == nft.rangesOf(accounts[i])
+    assert events == expected
+
+
+def test_empty(accounts, nftmint):
+    """empty batch"""
+    nftmint.mintBatch([], [], {"from": accounts[0]})
+    assert nftmint.totalSupply() == 0
+
+
+def test_only_owner(accounts, nftmint):
+    """only owner"""
+    with brownie.reverts("dev: only owner"):
+        nftmint.mintBatch([accounts[1]], [1000], {"from": accounts[1]})
+
+
+def test_length_mismatch(accounts, nftmint):
+    """length mismatch"""
+    with brownie.reverts("dev: length mismatch"):
+        nftmint.mintBatch([accounts[1], accounts[2]], [1000], {"from": accounts[0]})
+
+
+def test_mint_zero(accounts, nftmint):
+    """mint zero"""
+    with brownie.reverts("dev: mint 0"):
+        nftmint.mintBatch([accounts[1], accounts[2]], [1000, 0], {"from": accounts[0]})
+
+
+def test_upper_bound(accounts, nftmint):
+    """upper bound"""
+    nftmint.mint(accounts[1], 2 ** 64 - 1000, {"from": accounts[0]})
+    with brownie.reverts("dev: upper bound"):
+        nftmint.mintBatch([accounts[1], accounts[2]], [500, 499], {"from": accounts[0]})
+
+
+def _events(tx):
+    return [(tx.events[i].name, *tx.events[i].values()) for i in range(len(tx.events))]
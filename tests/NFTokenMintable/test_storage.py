@@ -0,0 +1,103 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import web3
+from eth_utils import keccak
+
+from scripts.model import ZERO_ADDRESS, NFTokenMintableModel
+
+# storage slots of NFToken.tokens, NFToken.rangeMap and NFToken.balances
+TOKENS_SLOT = 4
+RANGE_MAP_SLOT = TOKENS_SLOT + 2 ** 62
+BALANCES_SLOT = RANGE_MAP_SLOT + 1
+
+
+@pytest.fixture
+def model(accounts):
+    yield NFTokenMintableModel(accounts[0], 0)
+
+
+@pytest.fixture
+def fragmented(accounts, nftmint, model):
+    # accounts[1] and accounts[2] each hold ten alternating ranges of 10 tokens
+    for i in range(20):
+        nftmint.mint(accounts[i % 2 + 1], 10, {"from": accounts[0]})
+        model.mint(accounts[0], accounts[i % 2 + 1], 10)
+
+
+def test_merge(accounts, nftmint, model, fragmented):
+    """merging every range leaves no stale slots"""
+    ranges = nftmint.rangesOf(accounts[2])
+    nftmint.transferRanges(accounts[1], ranges, {"from": accounts[2]})
+    model.transfer_ranges(accounts[2], accounts[1], ranges)
+
+    assert nftmint.rangesOf(accounts[1]) == [(1, 201)]
+    _compare(nftmint, model, accounts[1:3], 201)
+
+
+def test_remove_ranges(accounts, nftmint, model, fragmented):
+    """removing ranges clears each balance array slot once it is unused"""
+    for start, stop in nftmint.rangesOf(accounts[2])[::-1]:
+        nftmint.transferRange(accounts[3], start, stop, {"from": accounts[2]})
+        model.transfer_range(accounts[2], accounts[3], start, stop)
+
+    _compare(nftmint, model, accounts[1:4], 201)
+    assert _read(nftmint, _balance_slot(accounts[2])) == 0
+    for i in range(3):
+        assert _read(nftmint, _balance_slot(accounts[2]) + 1 + i) == 0
+
+
+def test_burn_merge(accounts, nftmint, model, fragmented):
+    """adjacent burned ranges are merged"""
+    nftmint.transferRange(accounts[0], 41, 51, {"from": accounts[1]})
+    nftmint.transferRange(accounts[0], 51, 61, {"from": accounts[2]})
+    model.transfer_range(accounts[1], accounts[0], 41, 51)
+    model.transfer_range(accounts[2], accounts[0], 51, 61)
+    for start, stop in [(45, 50), (55, 61), (50, 55), (41, 45)]:
+        nftmint.burn(start, stop, {"from": accounts[0]})
+        model.burn(accounts[0], start, stop)
+        _compare(nftmint, model, accounts[:3], 201)
+
+    assert nftmint.getRange(50) == (ZERO_ADDRESS, 41, 61)
+    assert _read(nftmint, _range_slot(45)) == 0
+    assert _read(nftmint, _range_slot(55)) == 0
+
+
+def _compare(nft, model, accounts, upper):
+    # compares contract storage against the model, including every slot that
+    # has been used by a range or balance array
+    for i in range(upper // 4 + 1):
+        expected = sum(model.tokens.get(i * 4 + x, 0) << (64 * x) for x in range(4))
+        assert _read(nft, TOKENS_SLOT + i) == expected, f"tokens slot {i}"
+
+    for start in range(1, upper):
+        owner, stop = model.range_map.get(start, (ZERO_ADDRESS, 0))
+        expected = int(owner, 16) | stop << 160 | model.positions.get(start, 0) << 224
+        assert _read(nft, _range_slot(start)) == expected, f"rangeMap slot {start}"
+
+    for account in accounts:
+        b = model.balances.get(str(account))
+        slot = _balance_slot(account)
+        assert _read(nft, slot) == (b.balance | b.length << 64 | b.policy << 128 if b else 0)
+        for i in range(upper // 4 + 1):
+            expected = sum(b.ranges.get(i * 4 + x, 0) << (64 * x) for x in range(4)) if b else 0
+            assert _read(nft, slot + 1 + i) == expected, f"{account} ranges slot {i}"
+
+
+def _range_slot(start):
+    key = start.to_bytes(32, "big")
+    return int.from_bytes(keccak(key + RANGE_MAP_SLOT.to_bytes(32, "big")), "big")
+
+
+def _balance_slot(account):
+    key = bytes.fromhex(str(account)[2:]).rjust(32, b"\x00")
+    return int.from_bytes(keccak(key + BALANCES_SLOT.to_bytes(32, "big")), "big")
+
+
+# web3 v6 removed the camel case methods used by earlier versions
+def _read(nft, slot):
+    if hasattr(web3.eth, "get_storage_at"):
+        value = web3.eth.get_storage_at(nft.address, slot)
+    else:
+        value = web3.eth.getStorageAt(nft.address, slot)
+    return int.from_bytes(value, "big")
@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+
+import brownie
+import pytest
+
+
+@pytest.fixture(scope="module", params=[2, 3, 16, 64])
+def multiplier(request):
+    yield request.param
+
+
+@pytest.fixture(scope="module")
+def nft(NFTokenScoped, accounts, multiplier):
+    token = accounts[0].deploy(NFTokenScoped, "Test NFT", "NFT", 30000, multiplier)
+    token.transfer(accounts[1], 10000, {"from": accounts[0]})
+    token.transfer(accounts[2], 10000, {"from": accounts[0]})
+    token.transfer(accounts[3], 10000, {"from": accounts[0]})
+    yield token
+
+
+def test_multiplier(nft, multiplier):
+    assert nft.scopingMultiplier() == multiplier
+
+
+def test_invalid_multiplier(NFTokenScoped, accounts):
+    with brownie.reverts():
+        accounts[0].deploy(NFTokenScoped, "Test NFT", "NFT", 30000, 1)
+    with brownie.reverts():
+        accounts[0].deploy(NFTokenScoped, "Test NFT", "NFT", 30000, 2 ** 64 + 1)
+
+
+def test_verify_initial(check_ranges):
+    check_ranges([(1, 10001)], [(10001, 20001)], [(20001, 30001)], [])
+
+
+def test_inside(check_ranges, accounts, nft):
+    nft.transferRange(accounts[4], 12000, 13000, {"from": accounts[2]})
+    check_ranges([(1, 10001)], [(10001, 12000), (13000, 20001)], [(20001, 30001)], [(12000, 13000)])
+
+
+def test_start_partial_same(check_ranges, accounts, nft):
+    nft.transferRange(accounts[1], 10001, 11001, {"from": accounts[2]})
+    check_ranges([(1, 11001)], [(11001, 20001)], [(20001, 30001)], [])
+
+
+def test_stop_partial_same(check_ranges, accounts, nft):
+    nft.transferRange(accounts[3], 19000, 20001, {"from": accounts[2]})
+    check_ranges([(1, 10001)], [(10001, 19000)], [(19000, 30001)], [])
+
+
+def test_whole_range_same(check_ranges, accounts, nft):
+    nft.transferRange(accounts[3], 5000, 10001, {"from": accounts[1]})
+    nft.transferRange(accounts[1], 25001, 30001, {"from": accounts[3]})
+    nft.transferRange(accounts[3], 10001, 20001, {"from": accounts[2]})
+    check_ranges([(1, 5000), (25001, 30001)], [], [(5000, 25001)], [])
+
+
+def test_one_token(check_ranges, accounts, nft):
+    for i in range(10001, 10010):
+        nft.transferRange(accounts[4], i, i + 1, {"from": accounts[2]})
+        nft.transferRange(accounts[1], i + 10000, i + 10001, {"from": accounts[3]})
+    check_ranges(
+        [(1, 10001), (20001, 20010)], [(10010, 20001)], [(20010, 30001)], [(10001, 10010)],
+    )
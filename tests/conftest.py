@@ -3,6 +3,78 @@
 import functools
 
 import pytest
+from brownie import chain, web3
+
+from scripts.benchmarks import fragment
+from scripts.range_index import fetch_ranges
+
+
+class _ChainStates:
+
+    """
+    Starting states that are built once per session and shared by every test
+    module that uses them, instead of being rebuilt by each module.
+
+    States are built on top of one another, and a snapshot is taken after each
+    one is added. `module_isolation` reverts to this snapshot, so every module
+    begins with all of the states built so far already in place. When running
+    with xdist, each worker has its own chain and builds its own copy.
+    """
+
+    def __init__(self):
+        self._cache = {}
+        self._snapshot()
+
+    def get(self, name, build, *args):
+        """
+        Returns the result of `build(*args)`, only calling it the first time.
+
+        Must be called from a session or module scoped fixture. Function scoped
+        fixtures run after the snapshot taken by `fn_isolation`, and reverting
+        to that snapshot also discards any snapshot taken after it.
+        """
+        if name in self._cache:
+            return self._cache[name]
+        # the state is only kept if nothing else has changed since the last revert
+        is_clean = chain.height == self._height
+        result = build(*args)
+        if is_clean:
+            self._cache[name] = result
+            self._snapshot()
+        return result
+
+    def revert(self):
+        self._snapshot_id = _revert_to(self._snapshot_id)
+
+    def _snapshot(self):
+        self._snapshot_id = _take_snapshot()
+        self._height = chain.height
+
+
+def _take_snapshot():
+    # chain.snapshot only holds a single snapshot, which fn_isolation replaces
+    # before every test, so states are kept in snapshots of their own
+    return web3.provider.make_request("evm_snapshot", [])["result"]
+
+
+def _revert_to(snapshot_id):
+    # Chain._revert is private, it requires eth-brownie 1.10.0 or later. Reverting
+    # discards the snapshot, so it takes a new one and returns the new id. It also
+    # removes later transactions and deployments from history.
+    return chain._revert(snapshot_id)
+
+
+@pytest.fixture(scope="session")
+def chain_states():
+    yield _ChainStates()
+
+
+# replaces brownie's module_isolation, which resets the chain to the genesis block
+@pytest.fixture(scope="module")
+def module_isolation(chain_states):
+    chain_states.revert()
+    yield
+    chain_states.revert()
 
 
 # test isolation, always use!
@@ -13,18 +85,63 @@ def isolation(fn_isolation):
 
 # contract deployment
 @pytest.fixture(scope="module")
-def nft(accounts, NFToken):
+def nft(chain_states, accounts, NFToken):
+    yield chain_states.get("nft", _deploy_nft, accounts, NFToken)
+
+
+@pytest.fixture(scope="module")
+def nftmint(chain_states, accounts, NFTokenMintable):
+    yield chain_states.get("nftmint", accounts[0].deploy, NFTokenMintable, "Test NFT", "NFT", 0)
+
+
+@pytest.fixture(scope="session")
+def distributed(chain_states, accounts, NFToken):
+    """
+    Returns a function that gives an NFToken with a total supply of
+    `total_supply`, where each of accounts[1:] holds `amount` tokens.
+    """
+
+    def get(total_supply, amount):
+        name = f"distributed/{total_supply}/{amount}"
+        return chain_states.get(name, _deploy_distributed, accounts, NFToken, total_supply, amount)
+
+    yield get
+
+
+@pytest.fixture(scope="session")
+def fragmented(chain_states, accounts, NFTokenMintable):
+    """
+    Returns a function that gives an NFTokenMintable where accounts[0] and
+    accounts[1] each hold `ranges` non-adjacent ranges of `amount` tokens.
+    """
+
+    def get(ranges, amount):
+        name = f"fragmented/{ranges}/{amount}"
+        return chain_states.get(name, _deploy_fragmented, accounts, NFTokenMintable, ranges, amount)
+
+    yield get
+
+
+def _deploy_nft(accounts, NFToken):
     token = accounts[0].deploy(NFToken, "Test NFT", "NFT", 30000)
     token.transfer(accounts[1], 10000, {"from": accounts[0]})
     token.transfer(accounts[2], 10000, {"from": accounts[0]})
     token.transfer(accounts[3], 10000, {"from": accounts[0]})
-    yield token
+    return token
 
 
-@pytest.fixture(scope="module")
-def nftmint(accounts, NFTokenMintable):
+def _deploy_distributed(accounts, NFToken, total_supply, amount):
+    token = accounts[0].deploy(NFToken, "Test NFT", "NFT", total_supply)
+    if amount:
+        for account in accounts[1:]:
+            token.transfer(account, amount, {"from": accounts[0]})
+    return token
+
+
+def _deploy_fragmented(accounts, NFTokenMintable, ranges, amount):
     token = accounts[0].deploy(NFTokenMintable, "Test NFT", "NFT", 0)
-    yield token
+    fragment(token, accounts, ranges, amount)
+    return token
 
 
 # range and balance checks
@@ -35,27 +152,37 @@ def check_ranges(accounts, nft):
 
 
 def _check_ranges(accounts, upper, *expected_ranges, nft=None):
+    # token indexes to verify, mapped to the ranges that they are adjacent to
+    probes = {}
     for num, expected in enumerate(expected_ranges, start=1):
         account = accounts[num]
-        ranges = nft.rangesOf(account)
+        ranges = fetch_ranges(nft, account)
         assert set(ranges) == set(expected)
         assert nft.balanceOf(account) == sum((i[1] - i[0]) for i in ranges)
         for start, stop in ranges:
-            if stop - start == 1:
-                assert nft.getRange(start)[:3] == (account, start, stop)
-                continue
-            for i in range(max(1, start - 1), start + 2):
-                try:
-                    data = nft.getRange(i)
-                except Exception:
-                    raise AssertionError(f"Could not get range pointer {i} for account {num}")
-                if i < start:
-                    assert data[0] != account
-                else:
-                    assert data[0] == account
-            for i in range(stop - 1, min(stop + 1, upper)):
-                data = nft.getRange(i)
-                if i < stop:
-                    assert data[0] == account
-                else:
-                    assert data[0] != account
+            for i in {start - 1, start, start + 1, stop - 1, stop}:
+                if 0 < i < upper:
+                    probes.setdefault(i, []).append((num, account, start, stop))
+    if not probes:
+        return
+
+    # all pointers are fetched in a single call
+    idx_list = sorted(probes)
+    try:
+        results = zip(idx_list, *nft.getRanges(idx_list))
+    except Exception:
+        for i in idx_list:
+            try:
+                nft.getRange(i)
+            except Exception:
+                num = probes[i][0][0]
+                raise AssertionError(f"Could not get range pointer {i} for account {num}")
+        raise
+
+    for i, owner, start, stop in results:
+        for num, account, range_start, range_stop in probes[i]:
+            message = f"Incorrect range pointer {i} for account {num}"
+            if range_start <= i < range_stop:
+                assert (owner, start, stop) == (account, range_start, range_stop), message
+            else:
+                assert owner != account, message
@@ -0,0 +1,9 @@
+#!/usr/bin/python3
+
+import pytest
+
+
+# the model does not use the chain, so chain isolation is not required
+@pytest.fixture(autouse=True)
+def isolation():
+    pass
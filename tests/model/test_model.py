@@ -0,0 +1,254 @@
+#!/usr/bin/python3
+
+from hypothesis import settings
+from hypothesis import strategies as st
+from hypothesis.stateful import RuleBasedStateMachine, invariant, precondition, rule
+
+from scripts.model import ZERO_ADDRESS, ModelRevert, NFTokenMintableModel
+
+ACCOUNTS = [f"0x{i:040x}" for i in range(1, 6)]
+TOTAL_SUPPLY = 300
+
+st_account = st.sampled_from(ACCOUNTS)
+st_pct = st.floats(min_value=0, max_value=1, exclude_max=True)
+
+
+class ModelStateMachine(RuleBasedStateMachine):
+
+    """
+    Stateful test that verifies the model against a naive, per-token record of
+    ownership. Running without a chain allows many more examples than the tests
+    in tests/stateful.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.model = NFTokenMintableModel(ACCOUNTS[0], TOTAL_SUPPLY)
+        self.owners = [ZERO_ADDRESS] + [ACCOUNTS[0]] * TOTAL_SUPPLY
+
+    @rule(sender=st_account, receiver=st_account, amount=st.integers(0, TOTAL_SUPPLY))
+    def transfer(self, sender, receiver, amount):
+        ranges = self.model.ranges_of(sender)
+        try:
+            self.model.transfer(sender, receiver, amount)
+        except ModelRevert as exc:
+            assert exc.revert_msg == "dev: underflow"
+            assert amount > self.model.balance_of(sender)
+            return
+        if sender == receiver:
+            return
+        # tokens are taken from the first range of the sender, when a range is
+        # entirely removed it is replaced with the last range of the sender
+        while amount:
+            start, stop = ranges[0]
+            stop = min(stop, start + amount)
+            self._set_owner(start, stop, receiver)
+            amount -= stop - start
+            ranges[0] = ranges[-1]
+            ranges.pop()
+
+    @rule(
+        sender=st_account,
+        receiver=st_account,
+        amount=st.integers(1, TOTAL_SUPPLY),
+        policy=st.integers(0, 3),
+    )
+    def transfer_with_policy(self, sender, receiver, amount, policy):
+        if amount > self.model.balance_of(sender) or sender == receiver:
+            return
+        events = self.model.transfer_with_policy(sender, receiver, amount, policy)
+        # the tokens sent by each policy are taken from the emitted events
+        for name, from_, to, start, stop, value in (i for i in events if i[0] == "TransferRange"):
+            assert set(self.owners[start:stop]) == {sender}
+            self._set_owner(start, stop, receiver)
+            amount -= value
+        assert amount == 0
+
+    @rule(sender=st_account, receiver=st_account, idx=st_pct, a=st_pct, b=st_pct)
+    def transfer_range(self, sender, receiver, idx, a, b):
+        start, stop = self._get_range(sender, idx, a, b)
+        if start == stop:
+            return
+        self.model.transfer_range(sender, receiver, start, stop)
+        self._set_owner(start, stop, receiver)
+
+    @rule(sender=st_account, receiver=st_account, idx=st.integers(0, 400))
+    def transfer_token(self, sender, receiver, idx):
+        if 0 < idx < len(self.owners) and self.owners[idx] == sender:
+            self.model.transfer_token(sender, receiver, idx)
+            self._set_owner(idx, idx + 1, receiver)
+            return
+        state = self._state()
+        try:
+            self.model.transfer_token(sender, receiver, idx)
+        except ModelRevert:
+            assert self._state() == state
+        else:
+            raise AssertionError("Invalid transfer did not revert")
+
+    @rule(sender=st_account, receiver=st_account, idx=st_pct, a=st_pct, b=st_pct)
+    def transfer_ranges(self, sender, receiver, idx, a, b):
+        ranges = self.model.ranges_of(sender)[int(idx * 2) :][:3]
+        ranges = [self._shrink(*i, a, b) for i in ranges]
+        ranges = [i for i in ranges if i[0] < i[1]]
+        self.model.transfer_ranges(sender, receiver, ranges)
+        for start, stop in ranges:
+            self._set_owner(start, stop, receiver)
+
+    @rule(receiver=st_account, amount=st.integers(1, 50))
+    def mint(self, receiver, amount):
+        self.model.mint(ACCOUNTS[0], receiver, amount)
+        self.owners.extend([receiver] * amount)
+
+    @rule(mints=st.lists(st.tuples(st_account, st.integers(1, 20)), max_size=5))
+    def mint_batch(self, mints):
+        self.model.mint_batch(ACCOUNTS[0], [i[0] for i in mints], [i[1] for i in mints])
+        for receiver, amount in mints:
+            self.owners.extend([receiver] * amount)
+
+    @precondition(lambda self: self.model.range_count_of(ACCOUNTS[0]))
+    @rule(idx=st_pct, a=st_pct, b=st_pct)
+    def burn(self, idx, a, b):
+        start, stop = self._get_range(ACCOUNTS[0], idx, a, b)
+        if start == stop:
+            return
+        self.model.burn(ACCOUNTS[0], start, stop)
+        self._set_owner(start, stop, ZERO_ADDRESS)
+
+    @precondition(lambda self: self.model.range_count_of(ACCOUNTS[0]))
+    @rule(idx=st_pct, a=st_pct, b=st_pct)
+    def burn_ranges(self, idx, a, b):
+        ranges = self.model.ranges_of(ACCOUNTS[0])[int(idx * 2) :][:3]
+        ranges = [self._shrink(*i, a, b) for i in ranges]
+        ranges = [i for i in ranges if i[0] < i[1]]
+        if not ranges:
+            return
+        self.model.burn_ranges(ACCOUNTS[0], ranges)
+        for start, stop in ranges:
+            self._set_owner(start, stop, ZERO_ADDRESS)
+
+    @rule(amount=st.integers(1, TOTAL_SUPPLY))
+    def burn_amount(self, amount):
+        if amount > self.model.balance_of(ACCOUNTS[0]):
+            state = self._state()
+            try:
+                self.model.burn_amount(ACCOUNTS[0], amount)
+            except ModelRevert as exc:
+                assert exc.revert_msg == "dev: underflow"
+                assert self._state() == state
+                return
+            raise AssertionError("Invalid burn did not revert")
+        events = self.model.burn_amount(ACCOUNTS[0], amount)
+        for name, from_, to, start, stop, value in (i for i in events if i[0] == "TransferRange"):
+            assert set(self.owners[start:stop]) == {ACCOUNTS[0]}
+            self._set_owner(start, stop, ZERO_ADDRESS)
+            amount -= value
+        assert amount == 0
+
+    @rule(sender=st_account, counterparty=st_account, a=st_pct, b=st_pct, size=st.integers(1, 20))
+    def swap_ranges(self, sender, counterparty, a, b, size):
+        start, stop = self._get_range(sender, a, 0, 1)
+        counter_start, counter_stop = self._get_range(counterparty, b, 0, 1)
+        size = min(size, stop - start, counter_stop - counter_start)
+        if sender == counterparty or size <= 0:
+            return
+        args = (start, start + size, counter_start, counter_start + size)
+        self.model.approve_swap(counterparty, sender, *args[2:], *args[:2], True)
+        self.model.swap_ranges(sender, counterparty, *args)
+        self._set_owner(*args[:2], counterparty)
+        self._set_owner(*args[2:], sender)
+
+    @rule(sender=st_account, receiver=st_account, start=st.integers(0, 400), length=st.integers())
+    def transfer_range_invalid(self, sender, receiver, start, length):
+        stop = max(start + length, 0)
+        owners = set(self.owners[start:stop])
+        if 0 < start < stop <= len(self.owners) and owners == {sender}:
+            return
+        state = self._state()
+        try:
+            self.model.transfer_range(sender, receiver, start, stop)
+        except ModelRevert:
+            assert self._state() == state
+        else:
+            raise AssertionError("Invalid transfer did not revert")
+
+    @invariant()
+    def ownership(self):
+        naive = {}
+        for account in ACCOUNTS:
+            for start, stop in self.model.ranges_of(account):
+                assert start < stop
+                for i in range(start, stop):
+                    assert naive.setdefault(i, account) == account
+        for idx in range(1, len(self.owners)):
+            owner, start, stop = self.model.get_range(idx)
+            assert start <= idx < stop
+            assert owner == naive.get(idx, ZERO_ADDRESS) == self.owners[idx]
+
+    @invariant()
+    def balances(self):
+        for account in ACCOUNTS:
+            ranges = self.model.ranges_of(account)
+            assert self.model.balance_of(account) == sum(i[1] - i[0] for i in ranges)
+        assert self.model.total_supply == len([i for i in self.owners if i != ZERO_ADDRESS])
+
+    @invariant()
+    def merged(self):
+        # adjacent ranges with the same owner are always merged
+        for account in ACCOUNTS:
+            starts = set(i[0] for i in self.model.ranges_of(account))
+            for start, stop in self.model.ranges_of(account):
+                assert stop not in starts
+
+    @invariant()
+    def no_stale_storage(self):
+        # every non-zero slot belongs to a current range, or to a balance array
+        # slot that holds at least one range
+        starts = []
+        expected = NFTokenMintableModel(ACCOUNTS[0], 0)
+        idx = 1
+        while idx <= self.model.upper_bound:
+            owner, start, stop = self.model.get_range(idx)
+            starts.append(start)
+            expected._set_range_pointers(start, stop, start)
+            idx = stop
+        assert self.model.tokens == expected.tokens
+        assert sorted(self.model.range_map) == starts
+
+        # every range held in a balance array knows its position, and no other does
+        positions = {}
+        for b in self.model.balances.values():
+            positions.update((b.ranges[i], i + 1) for i in range(b.length))
+        assert self.model.positions == positions
+
+        # adjacent burned ranges are merged
+        owners = [self.model.range_map[i][0] for i in starts]
+        assert (ZERO_ADDRESS, ZERO_ADDRESS) not in zip(owners, owners[1:])
+
+        for b in self.model.balances.values():
+            assert max(b.ranges, default=-1) < -(-b.length // 4) * 4
+
+    def _get_range(self, account, idx, a, b):
+        ranges = self.model.ranges_of(account)
+        if not ranges:
+            return 0, 0
+        return self._shrink(*ranges[int(len(ranges) * idx)], a, b)
+
+    def _shrink(self, start, stop, a, b):
+        length = stop - start
+        a, b = sorted((int(length * a), int(length * b) + 1))
+        return start + a, start + min(b, length)
+
+    def _set_owner(self, start, stop, owner):
+        for i in range(start, stop):
+            self.owners[i] = owner
+
+    def _state(self):
+        model = self.model
+        return (dict(model.tokens), dict(model.range_map), model.balance_of(ACCOUNTS[0]))
+
+
+ModelStateMachine.TestCase.settings = settings(
+    max_examples=500, stateful_step_count=50, deadline=None
+)
+test_model = ModelStateMachine.TestCase
@@ -1,6 +1,14 @@
 #!/usr/bin/python3
 
 import pytest
+from brownie import history
+
+from scripts.range_index import ZERO_ADDRESS, RangeIndex, fetch_ranges
+
+# number of steps between each check of the state of every account
+# with 10 accounts, a full sweep makes ~31 calls and a normal step ~7, averaging
+# ~9 calls per step instead of 30. stateful_step_count was raised 2.5x to match.
+FULL_SWEEP_INTERVAL = 10
 
 
 class _BaseStateMachine:
@@ -10,25 +18,65 @@ class _BaseStateMachine:
     methods that are shared across multiple stateful tests.
     """
 
-    def __init__(cls, NFToken, accounts, total_supply):
+    def __init__(cls, nft, accounts):
         cls.accounts = accounts
-        cls.total_supply = total_supply
-        cls.nft = NFToken.deploy("Test NFT", "NFT", total_supply, {"from": accounts[0]})
-
-    def invariant_balances(self):
-        for account, balance in self.balances.items():
-            assert self.nft.balanceOf(account) == balance
+        cls.total_supply = nft.totalSupply()
+        cls.nft = nft
 
     def invariant_ranges(self):
+        touched = self._apply_history()
+        self._steps += 1
+        if self._steps % FULL_SWEEP_INTERVAL == 0:
+            self._full_sweep()
+            return
+
+        # only accounts involved in a transfer since the last check are verified
+        idx_list = []
+        for account in touched:
+            ranges = fetch_ranges(self.nft, account)
+            assert sorted(ranges) == self._index.ranges_of(account)
+            assert self.nft.balanceOf(account) == self.balances[account]
+            assert self._index.balance_of(account) == self.balances[account]
+            idx_list.extend(x for i in ranges for x in (i[0], i[1] - 1))
+        self._check_pointers(idx_list)
+
+    def teardown(self):
+        self._apply_history()
+        self._full_sweep()
+
+    def _apply_history(self):
+        # updates the local index from the TransferRange events of new transactions
+        if "_index" not in self.__dict__:
+            self._index = RangeIndex()
+            self._history_length = len(history)
+            self._steps = 0
+            for account in self.accounts:
+                for start, stop in fetch_ranges(self.nft, account):
+                    self._index.apply(ZERO_ADDRESS, account, start, stop)
+            return self.accounts
+
+        touched = set()
+        for tx in history[self._history_length :]:
+            if tx.status == 0 or tx.receiver != self.nft.address:
+                continue
+            for event in tx.events["TransferRange"] if "TransferRange" in tx.events else []:
+                self._index.apply(event["from"], event["to"], event["start"], event["stop"])
+                touched.update((event["from"], event["to"]))
+        self._history_length = len(history)
+        return [i for i in self.accounts if str(i) in touched]
+
+    def _full_sweep(self):
         all_ranges = []
 
         for account in self.accounts:
-            ranges = self.nft.rangesOf(account)
+            ranges = fetch_ranges(self.nft, account)
             all_ranges.extend(ranges)
 
             # check that ranges are valid
             assert not next((i for i in ranges if i[1] <= i[0]), False)
             assert sum(i[-1] - i[0] for i in ranges) == self.balances[account]
+            assert self.nft.balanceOf(account) == self.balances[account]
+            assert sorted(ranges) == self._index.ranges_of(account)
 
         # check for overlapping or missing ranges
         all_ranges = sorted(all_ranges, key=lambda k: k[0])
@@ -39,6 +87,17 @@ class _BaseStateMachine:
         for i in range(len(all_ranges) - 1):
             assert all_ranges[i][1] == all_ranges[i + 1][0]
 
+        self._check_pointers([x for i in all_ranges for x in (i[0], i[1] - 1)])
+
+    def _check_pointers(self, idx_list):
+        # verifies the range returned by the contract for each index
+        if not idx_list:
+            return
+        idx_list = sorted(idx_list)
+        owners, starts, stops = self.nft.getRanges(idx_list)
+        for idx, owner, start, stop in zip(idx_list, owners, starts, stops):
+            assert (owner, start, stop) == self._index.get_range(idx), f"Bad pointer for {idx}"
+
 
 @pytest.fixture
 def BaseStateMachine():
@@ -0,0 +1,133 @@
+#!/usr/bin/python3
+
+import brownie
+import pytest
+from brownie.test import strategy
+
+from scripts.model import ModelRevert, NFTokenMintableModel
+from scripts.range_index import fetch_ranges
+
+
+@pytest.fixture(scope="module")
+def nftmint(chain_states, accounts, NFTokenMintable):
+    args = (NFTokenMintable, "Test NFT", "NFT", 1000)
+    yield chain_states.get("nftmint/1000", accounts[0].deploy, *args)
+
+
+def test_stateful_differential(state_machine, nftmint, accounts):
+
+    """
+    Stateful test that replays the same calls against NFTokenMintable and
+    the reference model, and verifies that both give the same results.
+    """
+
+    class StateMachine:
+
+        st_idx = strategy("decimal", min_value=0, max_value="0.9999999999")
+        st_pct = strategy("decimal", min_value=0, max_value="0.9999999999")
+        st_amount = strategy("uint256", max_value=300)
+        st_sender = strategy("address")
+        st_receiver = strategy("address")
+        st_policy = strategy("uint8", max_value=4)
+
+        def __init__(cls, nft, accounts):
+            cls.accounts = accounts
+            cls.nft = nft
+
+        def setup(self):
+            self.model = NFTokenMintableModel(self.accounts[0], 1000)
+
+        def rule_transfer(self, st_sender, st_receiver, st_amount):
+            self._call("transfer", st_sender, st_receiver, st_amount)
+
+        def rule_transfer_with_policy(self, st_sender, st_receiver, st_amount, st_policy):
+            self._call("transferWithPolicy", st_sender, st_receiver, st_amount, st_policy)
+
+        def rule_set_transfer_policy(self, st_sender, st_policy):
+            self._call("setTransferPolicy", st_sender, st_policy)
+
+        def rule_transfer_range(self, st_sender, st_receiver, st_idx, st_pct):
+            start, stop = self._get_range(st_sender, st_idx, st_pct)
+            self._call("transferRange", st_sender, st_receiver, start, stop)
+
+        def rule_transfer_token(self, st_sender, st_receiver, st_idx, st_pct):
+            # the token at the end of the shrunk range lies inside the full range
+            idx = self._get_range(st_sender, st_idx, st_pct)[1]
+            self._call("transferToken", st_sender, st_receiver, idx)
+
+        def rule_transfer_ranges(self, st_sender, st_receiver, st_idx, st_pct):
+            ranges = self.model.ranges_of(st_sender)[int(st_idx * 2) :][:3]
+            ranges = [(i[0], i[0] + max(1, int((i[1] - i[0]) * st_pct))) for i in ranges]
+            self._call("transferRanges", st_sender, st_receiver, ranges)
+
+        def rule_mint(self, st_receiver, st_amount):
+            self._call("mint", self.accounts[0], st_receiver, st_amount)
+
+        def rule_mint_batch(self, st_receiver, st_sender, st_amount, st_pct):
+            # mints twice to the first target, so consecutive mints are merged
+            targets = [st_receiver, st_receiver, st_sender]
+            values = [st_amount // 2 + 1, int(st_amount * st_pct) + 1, st_amount + 1]
+            self._call("mintBatch", self.accounts[0], targets, values)
+
+        def rule_burn(self, st_idx, st_pct):
+            start, stop = self._get_range(self.accounts[0], st_idx, st_pct)
+            self._call("burn", self.accounts[0], start, stop)
+
+        def rule_burn_ranges(self, st_idx, st_pct):
+            ranges = self.model.ranges_of(self.accounts[0])[int(st_idx * 2) :][:3]
+            ranges = [(i[0], i[0] + max(1, int((i[1] - i[0]) * st_pct))) for i in ranges]
+            self._call("burnRanges", self.accounts[0], ranges)
+
+        def rule_burn_amount(self, st_amount):
+            self._call("burnAmount", self.accounts[0], st_amount)
+
+        def rule_swap_ranges(self, st_sender, st_receiver, st_idx, st_pct):
+            start, stop = self._get_range(st_sender, st_idx, st_pct)
+            counter_start, counter_stop = self._get_range(st_receiver, st_idx, st_pct)
+            size = min(stop - start, counter_stop - counter_start)
+            args = (start, start + size, counter_start, counter_start + size)
+            self._call("approveSwap", st_receiver, st_sender, *args[2:], *args[:2], True)
+            self._call("swapRanges", st_sender, st_receiver, *args)
+
+        def invariant_model(self):
+            for account in self.accounts:
+                ranges = fetch_ranges(self.nft, account)
+                # the model stores ranges in the same order as the contract
+                assert ranges == self.model.ranges_of(account)
+                assert self.nft.balanceOf(account) == self.model.balance_of(account)
+
+                idx_list = sorted(x for i in ranges for x in (i[0], i[1] - 1))
+                if idx_list:
+                    assert self.nft.getRanges(idx_list) == self.model.get_ranges(idx_list)
+
+            assert self.nft.totalSupply() == self.model.total_supply
+
+        def _get_range(self, address, idx, pct):
+            ranges = self.model.ranges_of(address)
+            if not ranges:
+                return 0, 0
+            start, stop = ranges[int(len(ranges) * idx)]
+            return start, start + int((stop - start) * pct)
+
+        def _call(self, fn_name, sender, *args):
+            model_fn = getattr(self.model, _snake_case(fn_name))
+            try:
+                events = model_fn(sender, *args)
+            except ModelRevert as exc:
+                with brownie.reverts(exc.revert_msg):
+                    getattr(self.nft, fn_name)(*args, {"from": sender})
+                return
+
+            tx = getattr(self.nft, fn_name)(*args, {"from": sender})
+            assert [(i.name,) + tuple(i.values()) for i in _events(tx)] == events
+
+    settings = {"stateful_step_count": 20, "max_examples": 20}
+    state_machine(StateMachine, nftmint, accounts, settings=settings)
+
+
+def _events(tx):
+    return [tx.events[i] for i in range(len(tx.events))]
+
+
+def _snake_case(name):
+    return "".join(f"_{i.lower()}" if i.isupper() else i for i in name)
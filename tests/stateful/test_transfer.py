@@ -1,10 +1,17 @@
 #!/usr/bin/python3
 
 import brownie
+import pytest
 from brownie.test import strategy
 
 
-def test_stateful_transfer(BaseStateMachine, state_machine, NFToken, accounts):
+@pytest.fixture(scope="module")
+def nft(distributed):
+    # accounts[0] holds the entire supply
+    yield distributed(1000000, 0)
+
+
+def test_stateful_transfer(BaseStateMachine, state_machine, nft, accounts):
 
     """
     Stateful test that verifies transfer behavior with NFToken.transfer
@@ -42,5 +49,5 @@ def test_stateful_transfer(BaseStateMachine, state_machine, NFToken, accounts):
                 with brownie.reverts("dev: underflow"):
                     self.nft.transfer(receiver, amount, {"from": sender})
 
-    settings = {"stateful_step_count": 20, "max_examples": 20}
-    state_machine(StateMachine, NFToken, accounts, 1000000, settings=settings)
+    settings = {"stateful_step_count": 50, "max_examples": 20}
+    state_machine(StateMachine, nft, accounts, settings=settings)
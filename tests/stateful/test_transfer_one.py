@@ -1,10 +1,17 @@
 #!/usr/bin/python3
 
 import brownie
+import pytest
 from brownie.test import strategy
 
 
-def test_stateful_transfer_one_token(BaseStateMachine, state_machine, NFToken, accounts):
+@pytest.fixture(scope="module")
+def nft(distributed, accounts):
+    # every account holds a single token
+    yield distributed(len(accounts), 1)
+
+
+def test_stateful_transfer_one_token(BaseStateMachine, state_machine, nft, accounts):
 
     """
     Stateful test that verifies range pointer modifications when
@@ -17,11 +24,6 @@ def test_stateful_transfer_one_token(BaseStateMachine, state_machine, NFToken, a
         st_sender = strategy("address")
         st_receiver = strategy("address")
 
-        def __init__(cls, NFToken, accounts):
-            super().__init__(cls, NFToken, accounts, len(accounts))
-            for account in accounts[1:]:
-                cls.nft.transfer(account, 1, {"from": accounts[0]})
-
         def setup(self):
             self.balances = {i: 1 for i in self.accounts}
 
@@ -46,5 +48,5 @@ def test_stateful_transfer_one_token(BaseStateMachine, state_machine, NFToken, a
                 with brownie.reverts("dev: underflow"):
                     self.nft.transfer(st_receiver, 1, {"from": st_sender})
 
-    settings = {"stateful_step_count": 20, "max_examples": 20}
-    state_machine(StateMachine, NFToken, accounts, settings=settings)
+    settings = {"stateful_step_count": 50, "max_examples": 20}
+    state_machine(StateMachine, nft, accounts, settings=settings)
@@ -1,10 +1,17 @@
 #!/usr/bin/python3
 
 import brownie
+import pytest
 from brownie.test import strategy
 
 
-def test_stateful_transfer_range(BaseStateMachine, state_machine, NFToken, accounts):
+@pytest.fixture(scope="module")
+def nft(distributed, accounts):
+    # the supply is divided equally between every account
+    yield distributed(1000, 1000 // len(accounts))
+
+
+def test_stateful_transfer_range(BaseStateMachine, state_machine, nft, accounts):
 
     """
     Stateful test that verifies transfer behavior with NFToken.transferRange
@@ -17,11 +24,6 @@ def test_stateful_transfer_range(BaseStateMachine, state_machine, NFToken, accou
         st_sender = strategy("address")
         st_receiver = strategy("address")
 
-        def __init__(cls, NFToken, accounts):
-            super().__init__(cls, NFToken, accounts, 1000)
-            for account in accounts[1:]:
-                cls.nft.transfer(account, 1000 // len(accounts), {"from": accounts[0]})
-
         def setup(self):
             initial = self.total_supply // len(self.accounts)
             self.balances = {i: initial for i in self.accounts}
@@ -65,5 +67,5 @@ def test_stateful_transfer_range(BaseStateMachine, state_machine, NFToken, accou
                 self.balances[sender] -= stop - start
                 self.balances[receiver] += stop - start
 
-    settings = {"stateful_step_count": 20, "max_examples": 20}
-    state_machine(StateMachine, NFToken, accounts, settings=settings)
+    settings = {"stateful_step_count": 50, "max_examples": 20}
+    state_machine(StateMachine, nft, accounts, settings=settings)